@@ -1,33 +1,77 @@
-# config.py
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Configuration management for database and application settings
-# 2026-02-07: Added authentication and security configuration
-
-import os
-from pathlib import Path
-from dotenv import load_dotenv  # Add this import
-
-# load environment variables from .env file
-# this must be called BEFORE accessing os.getenv()
-load_dotenv()
-
-class Config:
-    # database configuration (read from environment variables)
-    DB_HOST = os.getenv('DB_HOST', 'localhost')
-    DB_USER = os.getenv('DB_USER', 'root')
-    DB_PASSWORD = os.getenv('DB_PASSWORD', '')
-    DB_NAME = os.getenv('DB_NAME', 'pet_bag_db')
-    
-    # application configuration
-    APP_NAME = "PetBag Boarding System"
-    VERSION = "1.0.0"
-    
-    # session configuration
-    SESSION_TIMEOUT = 1800  # 30 minutes in seconds
-    
-    # logging configuration
-    LOG_FILE = "app.log"
-    LOG_LEVEL = "INFO"
-
+# config.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Configuration management for database and application settings
+# 2026-02-07: Added authentication and security configuration
+# 2026-10-18: Added connection pool settings
+# 2026-10-18: Added storage backend selection (mysql or sqlite)
+# 2026-10-18: Added query instrumentation and slow-query log settings
+# 2026-10-18: Added Customer/Pet row cache settings
+# 2026-10-18: Added report cache settings
+# 2026-10-18: Report cache files are opt-in; REPORT_CACHE_DIR defaults to memory only
+# 2026-10-18: Corrected when the query metrics totals are saved
+
+import os
+from pathlib import Path
+from dotenv import load_dotenv  # Add this import
+
+# load environment variables from .env file
+# this must be called BEFORE accessing os.getenv()
+load_dotenv()
+
+class Config:
+    # database configuration (read from environment variables)
+    DB_HOST = os.getenv('DB_HOST', 'localhost')
+    DB_USER = os.getenv('DB_USER', 'root')
+    DB_PASSWORD = os.getenv('DB_PASSWORD', '')
+    DB_NAME = os.getenv('DB_NAME', 'pet_bag_db')
+    
+    # storage backend: 'mysql' for the shared server, 'sqlite' for an embedded file
+    # (use ':memory:' as the path for a throwaway database in CI and benchmarks)
+    DB_BACKEND = os.getenv('DB_BACKEND', 'mysql')
+    DB_SQLITE_PATH = os.getenv('DB_SQLITE_PATH', 'pet_bag.db')
+    
+    # connection pool configuration
+    # with the pool off every caller shares one connection and the window's
+    # background loads run on the Tk thread instead (see database/worker.py)
+    DB_POOL_ENABLED = os.getenv('DB_POOL_ENABLED', 'true').lower() == 'true'
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))  # seconds to wait for a free connection
+    
+    # application configuration
+    APP_NAME = "PetBag Boarding System"
+    VERSION = "1.0.0"
+    
+    # session configuration
+    SESSION_TIMEOUT = 1800  # 30 minutes in seconds
+    
+    # logging configuration
+    LOG_FILE = "app.log"
+    LOG_LEVEL = "INFO"
+    
+    # query instrumentation: per-statement timings are kept in memory and
+    # statements slower than SLOW_QUERY_MS are written to LOG_FILE; the app
+    # saves the totals to QUERY_METRICS_FILE when it exits (the command-line
+    # tools do not, so their runs never overwrite an app session's file)
+    QUERY_METRICS_ENABLED = os.getenv('QUERY_METRICS_ENABLED', 'true').lower() == 'true'
+    SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '200'))
+    QUERY_METRICS_FILE = os.getenv('QUERY_METRICS_FILE', 'query_metrics.json')
+    
+    # row cache: Customer and Pet rows read by primary key are kept per session
+    # (least recently used dropped past ROW_CACHE_SIZE per table); changes made
+    # by other terminals are noticed within ROW_CACHE_POLL_SECONDS
+    ROW_CACHE_ENABLED = os.getenv('ROW_CACHE_ENABLED', 'true').lower() == 'true'
+    ROW_CACHE_SIZE = int(os.getenv('ROW_CACHE_SIZE', '5000'))
+    ROW_CACHE_POLL_SECONDS = float(os.getenv('ROW_CACHE_POLL_SECONDS', '2'))
+    
+    # report cache: a computed report is reused for REPORT_CACHE_TTL_SECONDS
+    # unless a write changes the rollup rows it covers. up to REPORT_CACHE_SIZE
+    # reports are kept in memory. setting REPORT_CACHE_DIR also keeps them as
+    # files there, shared by every process pointed at the same directory; it
+    # must not be writable by other users, since the files are unpickled
+    REPORT_CACHE_ENABLED = os.getenv('REPORT_CACHE_ENABLED', 'true').lower() == 'true'
+    REPORT_CACHE_TTL_SECONDS = float(os.getenv('REPORT_CACHE_TTL_SECONDS', '300'))
+    REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', '32'))
+    REPORT_CACHE_DIR = os.getenv('REPORT_CACHE_DIR', '')
+
 config = Config()
\ No newline at end of file
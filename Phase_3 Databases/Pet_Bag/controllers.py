@@ -1,1177 +1,1484 @@
-# # SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Business logic and data handling
-# 2026-01-31: Refactored to separate app logic from entry point
-# 2026-02-07: Added authentication controllers and data validation
-
-import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
-import re
-from models.customer import Customer
-from models.pet import Pet
-from services.boarding_service import BoardingService
-from services.checkout_service import CheckoutService
-from services.report_service import ReportService
-import services.auth_service
-
-# validation functions:
-
-def validate_name(name, field_name="Name"):# names contain only letters and spaces with minimum 2 characters
-    
-    if not name or not name.strip():
-        return False, f"{field_name} cannot be empty"
-    # check for letters only (no numbers or special characters)
-    if not re.match(r"^[A-Za-z\s]+$", name):
-        return False, f"{field_name} can only contain letters"
-    
-    # min=2
-    if len(name.strip()) < 2:
-        return False, f"{field_name} must be at least 2 characters"
-    
-    return True, ""
-
-def validate_phone(phone):# phone numbers 10 digits with common separators allowed
-    
-    if not phone or not phone.strip():
-        return False, "Phone number cannot be empty"
-    
-    # remove separators to check digit count
-    clean_phone = re.sub(r'[\s\-\(\)\.]+', '', phone)
-    
-    # verify only digits remain after removing separators
-    if not clean_phone.isdigit():
-        return False, "Phone number can only contain digits and common separators"
-    
-    # min=10
-    if len(clean_phone) != 10:
-        return False, "Phone number must be 10 digits"
-    
-    return True, ""
-
-def validate_email(email): # email format requiring @ and domain
-    
-    if not email or not email.strip():
-        return False, "Email cannot be empty"
-    
-    # email format xxxx@xxxx.xxx
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(pattern, email.strip()):
-        return False, "Invalid email format. Must contain '@' and domain"
-    
-    return True, ""
-
-def validate_weight(weight_str, pet_type=None): # weight is positive number under 200 lbs
-    
-    if not weight_str or not weight_str.strip():
-        if pet_type and pet_type.lower() == "dog":
-            return False, "Weight is required for dogs"
-        return False, "Weight cannot be empty"
-    
-    try:
-        weight = float(weight_str)
-        if weight <= 0:
-            return False, "Weight must be a positive number"
-        if weight > 200:  # max=200
-            return False, "Weight cannot exceed 200 lbs"
-        return True, ""
-    except ValueError:
-        return False, "Weight must be a valid number"
-
-def validate_pet_name(pet_name): # pet names with same rules as human names
-    
-    if not pet_name or not pet_name.strip():
-        return False, "Pet name cannot be empty"
-    
-    if not re.match(r"^[A-Za-z\s]+$", pet_name):
-        return False, "Pet name can only contain letters"
-    
-    if len(pet_name.strip()) < 2:
-        return False, "Pet name must be at least 2 characters"
-    
-    return True, ""
-
-def validate_breed(breed): # breed names with same rules as human names
-    
-    if not breed or not breed.strip():
-        return False, "Breed cannot be empty"
-    
-    if not re.match(r"^[A-Za-z\s]+$", breed):
-        return False, "Breed can only contain letters"
-    
-    if len(breed.strip()) < 2:
-        return False, "Breed must be at least 2 characters"
-    
-    return True, ""
-
-# main controllers class: all application logic
-class AppControllers:
-    def __init__(self, db, current_user):
-        self.db = db  # database connection
-        self.current_user = current_user  # currently logged in user
-        self.views = None  
-    
-    def set_views(self, views):
-        # connect controllers to UI components
-        self.views = views
-        self.load_customers()
-        self.load_pets()
-        self.update_dashboard()
-    
-    def get_available_spaces(self):
-        # get current boarding capacity
-        return BoardingService.get_available_spaces(self.db)
-    
-    def show_change_password(self):
-        # open password change dialog
-        ChangePasswordDialog(self.db, self.current_user['user_id']).show()
-    
-    def logout(self):
-        # handle user logout
-        response = messagebox.askyesno("Confirm Logout", "Are you sure you want to logout?")
-        if response:
-            result, message = services.auth_service.AuthService.logout_user()
-            if result:
-                messagebox.showinfo("Success", message)
-                self.views.root.destroy()
-    
-    def load_customers(self):
-        # populate customer tab with all customers
-        if not self.views:
-            return
-            
-        # clear existing entries
-        for item in self.views.customer_tree.get_children():
-            self.views.customer_tree.delete(item)
-        
-        try:
-            customers = Customer.get_all(self.db)
-            if customers:
-                for cust in customers:
-                    # Insert customer data into treeview
-                    self.views.customer_tree.insert("", tk.END, values=(
-                        cust['customer_id'],
-                        cust['first_name'],
-                        cust['last_name'],
-                        cust['phone'] or "",
-                        cust['email'] or ""
-                    ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load customers: {str(e)}")
-    
-    def load_pets(self):
-        # populate pet tab with all pets
-        if not self.views:
-            return
-            
-        # clear existing entries
-        for item in self.views.pet_tree.get_children():
-            self.views.pet_tree.delete(item)
-        
-        try:
-            pets = Pet.get_all(self.db)
-            if pets:
-                for pet in pets:
-                    owner = f"{pet['first_name']} {pet['last_name']}"
-                    # Insert pet data into treeview
-                    self.views.pet_tree.insert("", tk.END, values=(
-                        pet['pet_id'],
-                        pet['pet_name'],
-                        pet['pet_type'],
-                        pet['pet_age'],
-                        pet['breed'] or "",
-                        owner
-                    ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load pets: {str(e)}")
-    
-    def show_checkin_form(self):
-        # open check-in dialog for new bookings
-        CheckinDialog(self.db, self).show()
-    
-    def show_checkout_form(self):
-        # open checkout dialog
-        CheckoutDialog(self.db, self).show()
-    
-    def add_customer(self):
-        # open add customer dialog
-        AddCustomerDialog(self.db, self).show()
-    
-    def edit_customer(self, event=None):
-        # open edit dialog for selected customer
-        selection = self.views.customer_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select a customer to edit")
-            return
-        
-        item = self.views.customer_tree.item(selection[0])
-        customer_id = item['values'][0]
-        EditCustomerDialog(self.db, customer_id, self).show()
-    
-    def delete_customer(self):
-        # delete selected customer with cascading delete 
-        selection = self.views.customer_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select a customer to delete")
-            return
-        
-        item = self.views.customer_tree.item(selection[0])
-        customer_id = item['values'][0]
-        customer_name = f"{item['values'][1]} {item['values'][2]}"
-        
-        # Warn about cascading deletion of related records
-        response = messagebox.askyesno(
-            "Confirm Delete", 
-            f"Are you sure you want to delete customer '{customer_name}'?\n\n"
-            f"This will also delete all their pets, boarding records, and grooming records!"
-        )
-        
-        if response:
-            try:
-                success = Customer.delete_by_id(self.db, customer_id)
-                if success:
-                    messagebox.showinfo("Success", f"Customer '{customer_name}' deleted successfully")
-                    self.load_customers()
-                    self.load_pets()
-                    self.update_dashboard()
-                else:
-                    messagebox.showerror("Error", "Failed to delete customer")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete customer: {str(e)}")
-    
-    def add_pet(self):
-        # open add pet dialog
-        AddPetDialog(self.db, self).show()
-    
-    def edit_pet(self, event=None):
-        # open edit dialog for selected pet
-        selection = self.views.pet_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select a pet to edit")
-            return
-        
-        item = self.views.pet_tree.item(selection[0])
-        pet_id = item['values'][0]
-        EditPetDialog(self.db, pet_id, self).show()
-    
-    def delete_pet(self):
-        # delete selected pet with boarding status check
-        selection = self.views.pet_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select a pet to delete")
-            return
-        
-        item = self.views.pet_tree.item(selection[0])
-        pet_id = item['values'][0]
-        pet_name = item['values'][1]
-        owner_name = item['values'][5]
-        
-        # confirm deletion warning
-        response = messagebox.askyesno(
-            "Confirm Delete", 
-            f"Are you sure you want to delete pet '{pet_name}' (Owner: {owner_name})?\n\n"
-            f"This will also delete all boarding and grooming records for this pet!"
-        )
-        
-        if response:
-            try:
-                # Check if pet is currently boarded
-                cursor = self.db.connection.cursor()
-                cursor.execute("""
-                    SELECT COUNT(*) FROM Boarding 
-                    WHERE pet_id = %s AND check_out IS NULL
-                """, (pet_id,))
-                is_boarding = cursor.fetchone()[0] > 0
-                cursor.close()
-                
-                # additional warning if pet is currently boarded
-                if is_boarding:
-                    response2 = messagebox.askyesno(
-                        "Pet is Currently Boarded",
-                        f"Pet '{pet_name}' is currently boarded!\n\n"
-                        f"If you delete this pet, the boarding space will be freed up.\n"
-                        f"Continue with deletion?"
-                    )
-                    if not response2:
-                        return
-                
-                success = Pet.delete_by_id(self.db, pet_id)
-                if success:
-                    messagebox.showinfo("Success", f"Pet '{pet_name}' deleted successfully")
-                    self.load_pets()
-                    self.update_dashboard()
-                else:
-                    messagebox.showerror("Error", "Failed to delete pet")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete pet: {str(e)}")
-    
-    def update_dashboard(self):
-        # update dashboard display with current boarding capacity
-        spaces = BoardingService.get_available_spaces(self.db)
-        if self.views:
-            self.views.dog_spaces_label.config(text=f"Available: {spaces['dog_spaces']} of 30")
-            self.views.cat_spaces_label.config(text=f"Available: {spaces['cat_spaces']} of 12")
-    
-    def generate_occupancy_report(self, period_days):
-        # generate occupancy report
-        try:
-            report = ReportService.get_occupancy_report(self.db, period_days)
-            self.views.display_report(report)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate occupancy report: {str(e)}")
-    
-    def generate_revenue_report(self, period_days):
-        # generate revenue report
-        try:
-            report = ReportService.get_revenue_report(self.db, period_days)
-            self.views.display_report(report)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate revenue report: {str(e)}")
-
-# dialog classes
-class CheckinDialog:
-    def __init__(self, db, controller):
-        self.db = db
-        self.controller = controller
-        
-    def show(self):
-        # create and display check-in dialog window
-        dialog = tk.Toplevel()
-        dialog.title("New Booking - Check-In")
-        dialog.geometry("600x400")
-        dialog.resizable(False, False)
-        
-        main_frame = tk.Frame(dialog, padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Left side form fields
-        left_frame = tk.Frame(main_frame)
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 20))
-        
-        tk.Label(left_frame, text="Owner:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        owner_entry = tk.Entry(left_frame, width=28)
-        owner_entry.pack(anchor="w", pady=(0, 15))
-        
-        tk.Label(left_frame, text="Pet Type:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        pet_type_var = tk.StringVar(value="Dog")
-        pet_type_combo = ttk.Combobox(left_frame, textvariable=pet_type_var, 
-                                     values=["Dog", "Cat"], state="readonly", width=25)
-        pet_type_combo.pack(anchor="w", pady=(0, 15))
-        
-        tk.Label(left_frame, text="Pet Name:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        pet_name_entry = tk.Entry(left_frame, width=28)
-        pet_name_entry.pack(anchor="w", pady=(0, 15))
-        
-        grooming_var = tk.BooleanVar()
-        tk.Checkbutton(left_frame, text="Grooming Requested", 
-                      variable=grooming_var, font=("Arial", 11)).pack(anchor="w", pady=15)
-        
-        # right side form fields
-        right_frame = tk.Frame(main_frame)
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        tk.Label(right_frame, text="Breed:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        breed_entry = tk.Entry(right_frame, width=28)
-        breed_entry.pack(anchor="w", pady=(0, 15))
-        
-        tk.Label(right_frame, text="Age:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        age_values = [str(i) for i in range(1, 17)]
-        age_var = tk.StringVar(value="1")
-        age_combo = ttk.Combobox(right_frame, textvariable=age_var, 
-                                values=age_values, state="readonly", width=25)
-        age_combo.pack(anchor="w", pady=(0, 15))
-        
-        tk.Label(right_frame, text="Weight:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        weight_frame = tk.Frame(right_frame)
-        weight_frame.pack(anchor="w", pady=(0, 15))
-        
-        weight_entry = tk.Entry(weight_frame, width=10)
-        weight_entry.pack(side=tk.LEFT)
-        tk.Label(weight_frame, text=" lbs").pack(side=tk.LEFT, padx=(5, 0))
-        
-        tk.Label(right_frame, text="Days Stay:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        days_values = [str(i) for i in range(1, 32)]
-        days_var = tk.StringVar(value="1")
-        days_combo = ttk.Combobox(right_frame, textvariable=days_var, 
-                                 values=days_values, state="readonly", width=25)
-        days_combo.pack(anchor="w", pady=(0, 15))
-        
-        # action buttons
-        buttons_frame = tk.Frame(dialog)
-        buttons_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        def check_in():
-            # validate all input fields before completing check-in
-            pet_name = pet_name_entry.get().strip()
-            is_valid, error = validate_pet_name(pet_name)
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            owner_name = owner_entry.get().strip()
-            is_valid, error = validate_name(owner_name, "Owner name")
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            breed = breed_entry.get().strip()
-            is_valid, error = validate_breed(breed)
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            try:
-                pet_type = pet_type_var.get()
-                age = int(age_var.get())
-                days_stay = int(days_var.get())
-                
-                # validate age range
-                if age <= 0 or age > 30:
-                    messagebox.showerror("Error", "Age must be between 1 and 30 years")
-                    return
-                
-                # validate stay duration
-                if days_stay <= 0 or days_stay > 365:
-                    messagebox.showerror("Error", "Days stay must be between 1 and 365")
-                    return
-                
-                # validate weight based on pet type
-                weight_str = weight_entry.get() if weight_entry.get() else "0"
-                is_valid, error = validate_weight(weight_str, pet_type)
-                if not is_valid:
-                    messagebox.showerror("Validation Error", error)
-                    return
-                
-                weight = float(weight_str)
-                grooming = grooming_var.get()
-                
-                # find or create customer
-                customers = Customer.get_all(self.db)
-                customer_exists = False
-                customer_id = None
-                
-                for cust in customers:
-                    full_name = f"{cust['first_name']} {cust['last_name']}"
-                    if owner_name.lower() in full_name.lower():
-                        customer_exists = True
-                        customer_id = cust['customer_id']
-                        break
-                
-                # create new customer if not found
-                if not customer_exists:
-                    name_parts = owner_name.split()
-                    first_name = name_parts[0] if len(name_parts) > 0 else owner_name
-                    last_name = name_parts[1] if len(name_parts) > 1 else ""
-                    
-                    customer_data = {
-                        'first_name': first_name,
-                        'last_name': last_name,
-                        'phone': '',
-                        'email': ''
-                    }
-                    customer_id = Customer.create(self.db, customer_data)
-                
-                # create pet record
-                pet_data = {
-                    'customer_id': customer_id,
-                    'pet_name': pet_name,
-                    'pet_type': pet_type,
-                    'pet_age': age,
-                    'breed': breed,
-                    'weight': weight
-                }
-                pet_id = Pet.create(self.db, pet_data)
-                
-                # process boarding check-in
-                success, message = BoardingService.check_in_pet(
-                    self.db, pet_id, days_stay, grooming
-                )
-                
-                if success:
-                    messagebox.showinfo("Success", message)
-                    dialog.destroy()
-                    # Refresh UI components
-                    self.controller.load_pets()
-                    self.controller.load_customers()
-                    self.controller.update_dashboard()
-                else:
-                    messagebox.showerror("Error", message)
-                    
-            except ValueError as e:
-                messagebox.showerror("Error", f"Please enter valid data: {str(e)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"An error occurred: {str(e)}")
-        
-        # add buttons to dialog
-        tk.Button(buttons_frame, text="Check-In", command=check_in,
-                 bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
-                 padx=30, pady=10).pack(side=tk.RIGHT, padx=(10, 0))
-        
-        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
-                 bg="#FF9800", fg="white", font=("Arial", 11),
-                 padx=30, pady=10).pack(side=tk.RIGHT)
-        
-        # make dialog
-        dialog.grab_set()
-        dialog.wait_window()
-
-class CheckoutDialog:
-    def __init__(self, db, controller):
-        self.db = db
-        self.controller = controller
-        
-    def show(self):
-        # create checkout dialog
-        dialog = tk.Toplevel()
-        dialog.title("Check-Out")
-        dialog.geometry("500x550")
-        dialog.resizable(False, False)
-        
-        main_frame = tk.Frame(dialog, padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        tk.Label(main_frame, text="Select Pet:", font=("Arial", 11, "bold")).pack(anchor="w", pady=(0, 5))
-        
-        # get currently boarded pets
-        boardings = BoardingService.get_current_boardings(self.db)
-        boarding_list = [f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})" for b in boardings]
-        
-        pet_var = tk.StringVar()
-        pet_combo = ttk.Combobox(main_frame, textvariable=pet_var, 
-                                values=boarding_list, state="readonly", width=40)
-        pet_combo.pack(anchor="w", pady=(0, 20))
-        
-        # pet details display frame
-        details_frame = tk.LabelFrame(main_frame, text="Pet Details", padx=10, pady=10)
-        details_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        pet_name_label = tk.Label(details_frame, text="Pet Name: ", anchor="w")
-        pet_name_label.pack(fill=tk.X, pady=2)
-        
-        owner_label = tk.Label(details_frame, text="Owner: ", anchor="w")
-        owner_label.pack(fill=tk.X, pady=2)
-        
-        days_label = tk.Label(details_frame, text="Boarding Days: ", anchor="w")
-        days_label.pack(fill=tk.X, pady=2)
-        
-        weight_label = tk.Label(details_frame, text="Weight: ", anchor="w")
-        weight_label.pack(fill=tk.X, pady=2)
-        
-        grooming_label = tk.Label(details_frame, text="Grooming: ", anchor="w")
-        grooming_label.pack(fill=tk.X, pady=2)
-        
-        # payment information frame
-        amount_frame = tk.LabelFrame(main_frame, text="Payment", padx=10, pady=10)
-        amount_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        amount_label = tk.Label(amount_frame, text="Total Amount Due: $0.00", 
-                                font=("Arial", 12, "bold"))
-        amount_label.pack(anchor="w")
-        
-        # action buttons frame
-        buttons_frame = tk.Frame(main_frame)
-        buttons_frame.pack(fill=tk.X)
-        
-        def calculate_total():
-            # calculate and display total amount due for selected pet
-            selection = pet_combo.get()
-            if selection and boardings:
-                for b in boardings:
-                    display_name = f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})"
-                    if display_name == selection:
-                        # get grooming price if applicable
-                        cursor = self.db.connection.cursor(dictionary=True)
-                        cursor.execute("""
-                            SELECT price FROM Grooming 
-                            WHERE boarding_id = %s
-                        """, (b['boarding_id'],))
-                        grooming = cursor.fetchone()
-                        cursor.close()
-                        
-                        grooming_price = grooming['price'] if grooming else 0
-                        total = b['amount_due']
-                        
-                        amount_label.config(text=f"Total Amount Due: ${total:.2f}")
-                        
-                        # update detail labels
-                        pet_name_label.config(text=f"Pet Name: {b['pet_name']}")
-                        owner_label.config(text=f"Owner: {b['first_name']} {b['last_name']}")
-                        days_label.config(text=f"Boarding Days: {b['days_stay']}")
-                        weight_label.config(text=f"Weight: {b.get('weight', 0)} lbs")
-                        
-                        # format grooming information with tier pricing for dogs
-                        if b['pet_type'].lower() == 'dog' and b.get('weight', 0):
-                            grooming_tier = ""
-                            for tier, details in BoardingService.GROOMING_PRICES.items():
-                                if details['min'] <= b['weight'] <= details['max']:
-                                    grooming_tier = f" ({tier.title()} - ${details['price']})"
-                                    break
-                            grooming_text = f"Grooming: {'Yes' + grooming_tier if b['grooming_requested'] else 'No'}"
-                        else:
-                            grooming_text = f"Grooming: {'Yes' if b['grooming_requested'] else 'No'}"
-                        grooming_label.config(text=grooming_text)
-                        break
-        
-        def confirm_checkout():
-            # process checkout for selected pet
-            selection = pet_combo.get()
-            if not selection:
-                messagebox.showerror("Error", "Please select a pet")
-                return
-            
-            response = messagebox.askyesno("Confirm Check-out", 
-                                          f"Check out {selection.split('(')[0].strip()}?")
-            if response:
-                for b in boardings:
-                    display_name = f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})"
-                    if display_name == selection:
-                        success, message, amount = CheckoutService.check_out_pet(self.db, b['boarding_id'])
-                        if success:
-                            dialog.destroy()
-                            
-                            # Generate and display invoice
-                            invoice = CheckoutService.generate_invoice(self.db, b['boarding_id'])
-                            if invoice:
-                                invoice_dialog = tk.Toplevel()
-                                invoice_dialog.title("Invoice")
-                                invoice_dialog.geometry("400x500")
-                                
-                                text_widget = tk.Text(invoice_dialog, wrap=tk.WORD)
-                                text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-                                text_widget.insert(1.0, invoice)
-                                text_widget.config(state=tk.DISABLED)
-                            
-                            messagebox.showinfo("Success", message)
-                            self.controller.update_dashboard()
-                        else:
-                            messagebox.showerror("Error", message)
-                        break
-        
-        def generate_invoice():
-            # generate invoice without checking out
-            selection = pet_combo.get()
-            if not selection:
-                messagebox.showerror("Error", "Please select a pet")
-                return
-            
-            for b in boardings:
-                display_name = f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})"
-                if display_name == selection:
-                    invoice = CheckoutService.generate_invoice(self.db, b['boarding_id'])
-                    if invoice:
-                        invoice_dialog = tk.Toplevel(dialog)
-                        invoice_dialog.title("Invoice")
-                        invoice_dialog.geometry("400x500")
-                        
-                        text_widget = tk.Text(invoice_dialog, wrap=tk.WORD)
-                        text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-                        text_widget.insert(1.0, invoice)
-                        text_widget.config(state=tk.DISABLED)
-                    break
-        
-        # add action buttons
-        tk.Button(buttons_frame, text="Calculate Total", command=calculate_total,
-                 bg="#2196F3", fg="white", font=("Arial", 10),
-                 padx=15, pady=8).pack(side=tk.LEFT, padx=(0, 5))
-        
-        tk.Button(buttons_frame, text="Confirm Check-out", command=confirm_checkout,
-                 bg="#2196F3", fg="white", font=("Arial", 10, "bold"),
-                 padx=15, pady=8).pack(side=tk.LEFT, padx=5)
-        
-        tk.Button(buttons_frame, text="Invoice", command=generate_invoice,
-                 bg="#2196F3", fg="white", font=("Arial", 10),
-                 padx=15, pady=8).pack(side=tk.LEFT, padx=5)
-        
-        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
-                 bg="#FF9800", fg="white", font=("Arial", 10),
-                 padx=15, pady=8).pack(side=tk.RIGHT)
-        
-        # Make dialog modal
-        dialog.grab_set()
-        dialog.wait_window()
-
-class AddCustomerDialog:
-    def __init__(self, db, controller):
-        self.db = db
-        self.controller = controller
-        
-    def show(self):
-        # create add customer dialog
-        dialog = tk.Toplevel()
-        dialog.title("Add Customer")
-        dialog.geometry("400x300")
-        
-        tk.Label(dialog, text="First Name:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
-        first_name_entry = tk.Entry(dialog, width=30)
-        first_name_entry.grid(row=0, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Last Name:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
-        last_name_entry = tk.Entry(dialog, width=30)
-        last_name_entry.grid(row=1, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Phone:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
-        phone_entry = tk.Entry(dialog, width=30)
-        phone_entry.grid(row=2, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Email:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
-        email_entry = tk.Entry(dialog, width=30)
-        email_entry.grid(row=3, column=1, pady=10, padx=10)
-        
-        def save_customer():
-            # validate and save new customer
-            first_name = first_name_entry.get().strip()
-            last_name = last_name_entry.get().strip()
-            phone = phone_entry.get().strip()
-            email = email_entry.get().strip()
-            
-            # validate first name
-            is_valid, error = validate_name(first_name, "First name")
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            # validate last name
-            is_valid, error = validate_name(last_name, "Last name")
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            # validate phone
-            is_valid, error = validate_phone(phone)
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            # validate email
-            is_valid, error = validate_email(email)
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            customer_data = {
-                'first_name': first_name,
-                'last_name': last_name,
-                'phone': phone,
-                'email': email
-            }
-            
-            try:
-                Customer.create(self.db, customer_data)
-                messagebox.showinfo("Success", "Customer added successfully")
-                dialog.destroy()
-                self.controller.load_customers()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to add customer: {str(e)}")
-        
-        tk.Button(dialog, text="Save", command=save_customer,
-                 bg="#2196F3", fg="white", padx=20, pady=10).grid(row=4, column=0, columnspan=2, pady=20)
-        
-        dialog.grab_set()
-        dialog.wait_window()
-
-class EditCustomerDialog:
-    def __init__(self, db, customer_id, controller):
-        self.db = db
-        self.customer_id = customer_id
-        self.controller = controller
-        
-    def show(self):
-        # load customer data for editing
-        customers = Customer.get_all(self.db)
-        customer = None
-        for cust in customers:
-            if cust['customer_id'] == self.customer_id:
-                customer = cust
-                break
-        
-        if not customer:
-            return
-        
-        # create edit customer dialog
-        dialog = tk.Toplevel()
-        dialog.title("Edit Customer")
-        dialog.geometry("400x300")
-        
-        tk.Label(dialog, text="First Name:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
-        first_name_entry = tk.Entry(dialog, width=30)
-        first_name_entry.insert(0, customer['first_name'])
-        first_name_entry.grid(row=0, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Last Name:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
-        last_name_entry = tk.Entry(dialog, width=30)
-        last_name_entry.insert(0, customer['last_name'])
-        last_name_entry.grid(row=1, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Phone:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
-        phone_entry = tk.Entry(dialog, width=30)
-        phone_entry.insert(0, customer['phone'] or "")
-        phone_entry.grid(row=2, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Email:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
-        email_entry = tk.Entry(dialog, width=30)
-        email_entry.insert(0, customer['email'] or "")
-        email_entry.grid(row=3, column=1, pady=10, padx=10)
-        
-        def update_customer():
-            # validate and update customer information
-            first_name = first_name_entry.get().strip()
-            last_name = last_name_entry.get().strip()
-            phone = phone_entry.get().strip()
-            email = email_entry.get().strip()
-            
-            # validate first name
-            is_valid, error = validate_name(first_name, "First name")
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            # validate last name
-            is_valid, error = validate_name(last_name, "Last name")
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            # validate phone
-            is_valid, error = validate_phone(phone)
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            # validate email
-            is_valid, error = validate_email(email)
-            if not is_valid:
-                messagebox.showerror("Validation Error", error)
-                return
-            
-            customer_data = {
-                'first_name': first_name,
-                'last_name': last_name,
-                'phone': phone,
-                'email': email
-            }
-            
-            try:
-                Customer.update(self.db, self.customer_id, customer_data)
-                messagebox.showinfo("Success", "Customer updated successfully")
-                dialog.destroy()
-                self.controller.load_customers()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to update customer: {str(e)}")
-        
-        tk.Button(dialog, text="Update", command=update_customer,
-                 bg="#2196F3", fg="white", padx=20, pady=10).grid(row=4, column=0, columnspan=2, pady=20)
-        
-        dialog.grab_set()
-        dialog.wait_window()
-
-class AddPetDialog:
-    def __init__(self, db, controller):
-        self.db = db
-        self.controller = controller
-        
-    def show(self):
-        # create add pet dialog
-        dialog = tk.Toplevel()
-        dialog.title("Add Pet")
-        dialog.geometry("400x400")
-        
-        content_frame = tk.Frame(dialog, padx=20, pady=20)
-        content_frame.pack(fill=tk.BOTH, expand=True)
-        
-        tk.Label(content_frame, text="Owner:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
-        
-        # populate owner dropdown
-        customers = Customer.get_all(self.db)
-        customer_list = [f"{c['first_name']} {c['last_name']}" for c in customers]
-        
-        owner_combo = ttk.Combobox(content_frame, values=customer_list, state="readonly", width=25)
-        owner_combo.grid(row=0, column=1, pady=10, padx=10)
-        
-        tk.Label(content_frame, text="Pet Type:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
-        pet_type_var = tk.StringVar(value="Dog")
-        pet_type_combo = ttk.Combobox(content_frame, textvariable=pet_type_var, 
-                                     values=["Dog", "Cat"], state="readonly", width=25)
-        pet_type_combo.grid(row=1, column=1, pady=10, padx=10)
-        
-        tk.Label(content_frame, text="Pet Name:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
-        pet_name_entry = tk.Entry(content_frame, width=28)
-        pet_name_entry.grid(row=2, column=1, pady=10, padx=10)
-        
-        tk.Label(content_frame, text="Breed:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
-        breed_entry = tk.Entry(content_frame, width=28)
-        breed_entry.grid(row=3, column=1, pady=10, padx=10)
-        
-        tk.Label(content_frame, text="Age:", font=("Arial", 11)).grid(row=4, column=0, pady=10, padx=10, sticky="w")
-        age_values = [str(i) for i in range(1, 17)]
-        age_var = tk.StringVar(value="1")
-        age_combo = ttk.Combobox(content_frame, textvariable=age_var, 
-                                values=age_values, state="readonly", width=25)
-        age_combo.grid(row=4, column=1, pady=10, padx=10)
-        
-        tk.Label(content_frame, text="Weight:", font=("Arial", 11)).grid(row=5, column=0, pady=10, padx=10, sticky="w")
-        weight_entry = tk.Entry(content_frame, width=28)
-        weight_entry.grid(row=5, column=1, pady=10, padx=10)
-        
-        buttons_frame = tk.Frame(dialog)
-        buttons_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        def save_pet():
-            # validate and save new pet
-            if not owner_combo.get():
-                messagebox.showerror("Error", "Please select an owner")
-                return
-            
-            # validate pet name
-            pet_name = pet_name_entry.get().strip()
-            is_valid, error = validate_pet_name(pet_name)
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            # validate breed
-            breed = breed_entry.get().strip()
-            is_valid, error = validate_breed(breed)
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            try:
-                # find selected customer ID
-                selected_owner = owner_combo.get()
-                customer_id = None
-                for cust in customers:
-                    full_name = f"{cust['first_name']} {cust['last_name']}"
-                    if full_name == selected_owner:
-                        customer_id = cust['customer_id']
-                        break
-                
-                if not customer_id:
-                    messagebox.showerror("Error", "Selected owner not found")
-                    return
-                
-                # validate age
-                age = int(age_var.get()) if age_var.get() else 1
-                if age <= 0 or age > 30:
-                    messagebox.showerror("Error", "Age must be between 1 and 30 years")
-                    return
-                
-                pet_type = pet_type_var.get()
-                
-                # validate weight
-                weight_str = weight_entry.get().strip()
-                is_valid, error = validate_weight(weight_str, pet_type)
-                if not is_valid:
-                    messagebox.showerror("Validation Error", error)
-                    return
-                
-                weight = float(weight_str)
-                
-                # create pet record
-                pet_data = {
-                    'customer_id': customer_id,
-                    'pet_name': pet_name,
-                    'pet_type': pet_type,
-                    'pet_age': age,
-                    'breed': breed,
-                    'weight': weight
-                }
-                
-                Pet.create(self.db, pet_data)
-                messagebox.showinfo("Success", "Pet added successfully")
-                dialog.destroy()
-                self.controller.load_pets()
-            except ValueError as e:
-                if "Age must be" not in str(e):
-                    messagebox.showerror("Error", "Please enter valid numeric values")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to add pet: {str(e)}")
-        
-        # add action buttons
-        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
-                 bg="#FF9800", fg="white", font=("Arial", 11),
-                 padx=20, pady=8).pack(side=tk.LEFT, padx=(0, 10))
-        
-        tk.Button(buttons_frame, text="Add", command=save_pet,
-                 bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
-                 padx=20, pady=8).pack(side=tk.LEFT)
-        
-        dialog.grab_set()
-        dialog.wait_window()
-
-class EditPetDialog:
-    def __init__(self, db, pet_id, controller):
-        self.db = db
-        self.pet_id = pet_id
-        self.controller = controller
-        
-    def show(self):
-        # load pet data for editing
-        pets = Pet.get_all(self.db)
-        pet = None
-        for p in pets:
-            if p['pet_id'] == self.pet_id:
-                pet = p
-                break
-        
-        if not pet:
-            return
-        
-        # create edit pet dialog
-        dialog = tk.Toplevel()
-        dialog.title("Edit Pet")
-        dialog.geometry("400x350")
-        
-        # prepare customer list for dropdown
-        customers = Customer.get_all(self.db)
-        customer_list = [f"{c['customer_id']}: {c['first_name']} {c['last_name']}" for c in customers]
-        
-        current_customer = f"{pet['customer_id']}: {pet['first_name']} {pet['last_name']}"
-        
-        tk.Label(dialog, text="Customer:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
-        customer_combo = ttk.Combobox(dialog, values=customer_list, state="readonly", width=27)
-        customer_combo.set(current_customer)
-        customer_combo.grid(row=0, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Pet Name:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
-        pet_name_entry = tk.Entry(dialog, width=30)
-        pet_name_entry.insert(0, pet['pet_name'])
-        pet_name_entry.grid(row=1, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Pet Type:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
-        pet_type_var = tk.StringVar(value=pet['pet_type'])
-        pet_type_combo = ttk.Combobox(dialog, textvariable=pet_type_var, 
-                                     values=["Dog", "Cat"], state="readonly", width=27)
-        pet_type_combo.grid(row=2, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Age:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
-        age_values = [str(i) for i in range(1, 17)]
-        age_var = tk.StringVar(value=str(int(pet['pet_age'])) if pet['pet_age'] else "1")
-        age_combo = ttk.Combobox(dialog, textvariable=age_var, 
-                                values=age_values, state="readonly", width=27)
-        age_combo.grid(row=3, column=1, pady=10, padx=10)
-        
-        tk.Label(dialog, text="Breed:", font=("Arial", 11)).grid(row=4, column=0, pady=10, padx=10, sticky="w")
-        breed_entry = tk.Entry(dialog, width=30)
-        breed_entry.insert(0, pet['breed'] or "")
-        breed_entry.grid(row=4, column=1, pady=10, padx=10)
-        
-        def update_pet():
-            # validate and update pet information
-            if not customer_combo.get():
-                messagebox.showerror("Error", "Please select a customer")
-                return
-            
-            # validate pet name
-            pet_name = pet_name_entry.get().strip()
-            is_valid, error = validate_pet_name(pet_name)
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            # validate breed
-            breed = breed_entry.get().strip()
-            is_valid, error = validate_breed(breed)
-            if not is_valid:
-                messagebox.showerror("Error", error)
-                return
-            
-            try:
-                customer_id = int(customer_combo.get().split(":")[0])
-                age = int(age_var.get()) if age_var.get() else 1
-                
-                if age <= 0 or age > 30:
-                    messagebox.showerror("Error", "Age must be between 1 and 30 years")
-                    return
-                
-                # prepare updated pet data
-                pet_data = {
-                    'customer_id': customer_id,
-                    'pet_name': pet_name,
-                    'pet_type': pet_type_var.get(),
-                    'pet_age': age,
-                    'breed': breed,
-                    'weight': pet.get('weight', 0)
-                }
-                
-                Pet.update(self.db, self.pet_id, pet_data)
-                messagebox.showinfo("Success", "Pet updated successfully")
-                dialog.destroy()
-                self.controller.load_pets()
-            except ValueError:
-                messagebox.showerror("Error", "Please enter valid age (1-30)")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to update pet: {str(e)}")
-        
-        tk.Button(dialog, text="Update", command=update_pet,
-                 bg="#2196F3", fg="white", padx=20, pady=10).grid(row=5, column=0, columnspan=2, pady=20)
-        
-        dialog.grab_set()
-        dialog.wait_window()
-
-class ChangePasswordDialog:
-    def __init__(self, db, user_id):
-        self.db = db
-        self.user_id = user_id
-        
-    def show(self):
-        # create password change dialog
-        dialog = tk.Toplevel()
-        dialog.title("Change Password")
-        dialog.geometry("400x300")
-        dialog.resizable(False, False)
-        dialog.grab_set()
-        
-        main_frame = tk.Frame(dialog, padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        tk.Label(main_frame, text="Current Password:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        current_password_var = tk.StringVar()
-        current_password_entry = tk.Entry(main_frame, textvariable=current_password_var, 
-                                         show="*", width=30)
-        current_password_entry.pack(anchor="w", pady=(0, 15))
-        
-        tk.Label(main_frame, text="New Password:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        new_password_var = tk.StringVar()
-        new_password_entry = tk.Entry(main_frame, textvariable=new_password_var, 
-                                     show="*", width=30)
-        new_password_entry.pack(anchor="w", pady=(0, 15))
-        
-        tk.Label(main_frame, text="Confirm New Password:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
-        confirm_password_var = tk.StringVar()
-        confirm_password_entry = tk.Entry(main_frame, textvariable=confirm_password_var, 
-                                         show="*", width=30)
-        confirm_password_entry.pack(anchor="w", pady=(0, 25))
-        
-        requirements_label = tk.Label(main_frame, 
-                                     text="Password must be at least 6 characters",
-                                     font=("Arial", 9), fg="gray")
-        requirements_label.pack(anchor="w", pady=(0, 20))
-        
-        buttons_frame = tk.Frame(main_frame)
-        buttons_frame.pack(fill=tk.X)
-        
-        def change_password():
-            # process password change request
-            current = current_password_var.get()
-            new = new_password_var.get()
-            confirm = confirm_password_var.get()
-            
-            success, message = services.auth_service.AuthService.change_password(self.db, self.user_id, 
-                                                          current, new, confirm)
-            if success:
-                messagebox.showinfo("Success", message)
-                dialog.destroy()
-            else:
-                messagebox.showerror("Error", message)
-        
-        # add action buttons
-        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
-                 bg="#FF9800", fg="white", padx=20, pady=8).pack(side=tk.LEFT, padx=(0, 10))
-        
-        tk.Button(buttons_frame, text="Change Password", command=change_password,
-                 bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
-                 padx=20, pady=8).pack(side=tk.LEFT)
-        
-        dialog.bind('<Return>', lambda e: change_password())
+# # SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Business logic and data handling
+# 2026-01-31: Refactored to separate app logic from entry point
+# 2026-02-07: Added authentication controllers and data validation
+# 2026-10-18: Check-in dialog admits owner, pet and boarding in one transaction
+# 2026-10-18: Lists, dashboard, reports and dialog lookups load on the background DB worker
+# 2026-10-18: Customer and pet lists load page by page as the user scrolls
+# 2026-10-18: Mutations refresh only the rows they touched instead of reloading the lists
+# 2026-10-18: Check-in confirms the owner from indexed name lookup candidates
+# 2026-10-18: Edit dialogs load one row by key; owner dropdowns load a bounded, filtered page
+# 2026-10-18: Owner dropdowns are a debounced typeahead over an in-memory prefix index
+# 2026-10-18: Check-out reads the booked grooming row through BoardingService.get_grooming
+# 2026-10-18: Validation rules moved to validation.py so the bulk create APIs share them
+# 2026-10-18: Customer and pet deletes run as batched purges on the worker with progress
+# 2026-10-18: Reports come back as structured Report objects for the view to render and export
+# 2026-10-18: Editing a boarded pet to a full pet type shows why it was refused
+# 2026-10-18: Delete counts, owner lookup, check-in, check-out, invoices and customer/pet saves run on the worker
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import datetime
+import bisect
+from models.customer import Customer
+from models.pet import Pet
+from models.capacity import CapacityFullError
+from services.boarding_service import BoardingService
+from services.customer_lookup_service import CustomerLookupService
+from services.owner_index import OwnerIndex
+from services.checkout_service import CheckoutService
+from services.purge_service import PurgeService
+from services.report_service import ReportService
+from database.worker import DatabaseWorker
+import services.auth_service
+from validation import (validate_name, validate_phone, validate_email, validate_weight,
+                        validate_pet_name, validate_breed)
+
+# fills a Treeview one keyset page at a time: the first page is shown right
+# away and the next is fetched when the user scrolls near the bottom. after
+# a mutation only the touched rows are re-read and moved, inserted or removed,
+# so scroll position and selection survive and the cost follows the change
+class LazyTreeLoader:
+    PAGE_SIZE = 100
+    
+    def __init__(self, controller, tree, key, fetch_page, fetch_rows, row_id, page_key, row_values, error_text,
+                 on_change=None):
+        self.controller = controller
+        self.tree = tree
+        self.key = key  # worker key; a reset supersedes a page still loading
+        self.fetch_page = fetch_page  # (db, after, limit) -> rows
+        self.fetch_rows = fetch_rows  # (db, ids) -> rows that still exist
+        self.row_id = row_id  # row -> primary key
+        self.page_key = page_key  # row -> seek key for the next page
+        self.row_values = row_values  # row -> Treeview values
+        self.error_text = error_text
+        self.on_change = on_change  # (ids, rows that still exist) after a refresh or delete
+        self.items = {}  # row id -> Treeview item id
+        self.rows = {}  # row id -> row currently shown
+        self.sort_keys = []  # sort keys of the shown rows, in display order
+        self.changed_ids = set()  # ids whose refresh is still in flight
+        self.after = None
+        self.done = False
+        self.loading = False
+    
+    @staticmethod
+    def sort_key(key):
+        # the database compares names case-insensitively; match it so
+        # bisect finds the same position the ORDER BY would
+        return tuple(part.lower() if isinstance(part, str) else part for part in key)
+    
+    def reset(self):
+        # clear existing entries and start again from the first page
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.items.clear()
+        self.rows.clear()
+        self.sort_keys = []
+        self.after = None
+        self.done = False
+        self.loading = False
+        self.load_more()
+    
+    def load_more(self):
+        if self.loading or self.done:
+            return
+        self.loading = True
+        self.controller.worker.submit(self.key, self.fetch_page, self.controller.db, self.after, self.PAGE_SIZE,
+                                      on_success=self.show_page, on_error=self.show_error)
+    
+    def show_page(self, rows):
+        self.loading = False
+        for row in rows:
+            # a refresh may already have placed this row
+            if self.row_id(row) not in self.items:
+                self._append(row)
+        self.done = len(rows) < self.PAGE_SIZE
+        if rows:
+            self.after = self.page_key(rows[-1])
+    
+    def show_error(self, error):
+        self.loading = False
+        messagebox.showerror("Error", f"{self.error_text}: {str(error)}")
+    
+    def on_scroll(self, first, last):
+        # yscrollcommand hook: fetch the next page once the last fifth is visible
+        if float(last) >= 0.8:
+            self.load_more()
+    
+    def _append(self, row):
+        rid = self.row_id(row)
+        self.items[rid] = self.tree.insert("", tk.END, values=self.row_values(row))
+        self.rows[rid] = row
+        self.sort_keys.append(self.sort_key(self.page_key(row)))
+    
+    def _in_loaded_range(self, key):
+        # rows past the last loaded page will arrive with a later page
+        if self.done:
+            return True
+        return self.after is not None and key <= self.sort_key(self.after)
+    
+    def remove(self, row_ids):
+        # drop rows the caller has just deleted
+        if self.on_change:
+            self.on_change(row_ids, [])
+        for rid in row_ids:
+            row = self.rows.pop(rid, None)
+            if row is None:
+                continue
+            index = bisect.bisect_left(self.sort_keys, self.sort_key(self.page_key(row)))
+            del self.sort_keys[index]
+            self.tree.delete(self.items.pop(rid))
+    
+    def remove_where(self, predicate):
+        self.remove([rid for rid, row in self.rows.items() if predicate(row)])
+    
+    def refresh(self, row_ids):
+        # re-read just these rows; ids of a refresh still in flight are
+        # folded in because the new job supersedes it
+        self.changed_ids.update(row_ids)
+        ids = sorted(self.changed_ids)
+        if not ids:
+            return
+        self.controller.worker.submit(self.key + "_changes", self.fetch_rows, self.controller.db, ids,
+                                      on_success=lambda rows: self.apply_changes(ids, rows),
+                                      on_error=self.show_error)
+    
+    def refresh_where(self, predicate):
+        self.refresh([rid for rid, row in self.rows.items() if predicate(row)])
+    
+    def apply_changes(self, row_ids, rows):
+        self.changed_ids.difference_update(row_ids)
+        if self.on_change:
+            self.on_change(row_ids, rows)
+        found = {self.row_id(row): row for row in rows}
+        for rid in row_ids:
+            row = found.get(rid)
+            key = self.sort_key(self.page_key(row)) if row is not None else None
+            
+            if rid in self.rows:
+                old_index = bisect.bisect_left(self.sort_keys, self.sort_key(self.page_key(self.rows[rid])))
+                if row is None or not self._in_loaded_range(key):
+                    # deleted, or now sorts past the loaded pages
+                    self.remove([rid])
+                    continue
+                # update in place and move only if the sort position changed
+                del self.sort_keys[old_index]
+                index = bisect.bisect_left(self.sort_keys, key)
+                self.sort_keys.insert(index, key)
+                self.rows[rid] = row
+                self.tree.item(self.items[rid], values=self.row_values(row))
+                if index != old_index:
+                    self.tree.move(self.items[rid], "", index)
+            elif row is not None and self._in_loaded_range(key):
+                index = bisect.bisect_left(self.sort_keys, key)
+                self.sort_keys.insert(index, key)
+                self.rows[rid] = row
+                self.items[rid] = self.tree.insert("", index, values=self.row_values(row))
+
+# typeahead owner dropdown: each keystroke (debounced) filters the shared
+# OwnerIndex and only the top matches are shown. the owners behind the shown
+# values are kept so a choice maps straight to its id
+class OwnerPicker:
+    MAX_MATCHES = 20
+    DEBOUNCE_MS = 150
+    
+    def __init__(self, controller, parent, width=25, current=None):
+        self.controller = controller
+        self.combo = ttk.Combobox(parent, values=[], width=width)
+        self.shown = []  # owners behind the combobox values, same order
+        self.selected = None
+        self._pending = None
+        if current:
+            self.selected = OwnerIndex.owner(current)
+            self.show([])
+            self.combo.current(0)
+        self.combo.bind("<KeyRelease>", self.on_type)
+        self.combo.bind("<<ComboboxSelected>>", self.on_select)
+        # list the first owners once the index is ready (built once per session)
+        controller.with_owner_index(lambda index: self.filter())
+    
+    @staticmethod
+    def display(owner):
+        return f"{owner['first_name']} {owner['last_name']} (#{owner['customer_id']})"
+    
+    def grid(self, **kwargs):
+        self.combo.grid(**kwargs)
+    
+    def on_type(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        if self._pending is not None:
+            self.combo.after_cancel(self._pending)
+        self._pending = self.combo.after(self.DEBOUNCE_MS, self.filter)
+    
+    def on_select(self, event):
+        index = self.combo.current()
+        if index >= 0:
+            self.selected = self.shown[index]
+    
+    def filter(self, text=None):
+        self._pending = None
+        if not self.combo.winfo_exists():
+            return
+        if text is None:
+            # a completed choice lists everyone again; anything else narrows
+            text = "" if self.selected_id() else self.combo.get()
+        index = self.controller.owner_index
+        if index is None:
+            # index still building: narrow with the indexed SQL prefix search
+            self.controller.worker.submit("owner_options", Customer.get_owner_options, self.controller.db,
+                                          text.strip(), self.MAX_MATCHES, on_success=self.show)
+            return
+        self.show(index.search(text, self.MAX_MATCHES))
+    
+    def show(self, owners):
+        if not self.combo.winfo_exists():
+            return
+        self.shown = list(owners)
+        # the current choice stays pickable while the list is narrowed
+        if self.selected and all(o['customer_id'] != self.selected['customer_id'] for o in self.shown):
+            self.shown.insert(0, self.selected)
+        self.combo.config(values=[OwnerPicker.display(o) for o in self.shown])
+    
+    def selected_id(self):
+        text = self.combo.get()
+        if self.selected and text == OwnerPicker.display(self.selected):
+            return self.selected['customer_id']
+        for owner in self.shown:
+            if text == OwnerPicker.display(owner):
+                return owner['customer_id']
+        return None
+
+# main controllers class: all application logic
+class AppControllers:
+    def __init__(self, db, current_user):
+        self.db = db  # database connection
+        self.current_user = current_user  # currently logged in user
+        self.views = None  
+        self.worker = None  # background database worker, created with the views
+        self.customer_loader = None
+        self.pet_loader = None
+        self.owner_index = None  # built on first use by an owner picker
+        self._owner_index_waiters = []
+        self._owner_index_changed = set()  # customers changed while the index was building
+    
+    def set_views(self, views):
+        # connect controllers to UI components
+        self.views = views
+        self.worker = DatabaseWorker(views.root, DatabaseWorker.workers_for(self.db), views.set_busy)
+        self.customer_loader = LazyTreeLoader(
+            self, views.customer_tree, "customers", Customer.get_page, Customer.get_by_ids,
+            lambda cust: cust['customer_id'], Customer.page_key,
+            lambda cust: (cust['customer_id'], cust['first_name'], cust['last_name'],
+                          cust['phone'] or "", cust['email'] or ""),
+            "Failed to load customers", on_change=self.update_owner_index)
+        self.pet_loader = LazyTreeLoader(
+            self, views.pet_tree, "pets", Pet.get_page, Pet.get_by_ids,
+            lambda pet: pet['pet_id'], Pet.page_key,
+            lambda pet: (pet['pet_id'], pet['pet_name'], pet['pet_type'], pet['pet_age'],
+                         pet['breed'] or "", f"{pet['first_name']} {pet['last_name']}"),
+            "Failed to load pets")
+        self.load_customers()
+        self.load_pets()
+        self.update_dashboard()
+    
+    def get_available_spaces(self):
+        # get current boarding capacity
+        return BoardingService.get_available_spaces(self.db)
+    
+    def show_change_password(self):
+        # open password change dialog
+        ChangePasswordDialog(self.db, self.current_user['user_id']).show()
+    
+    def logout(self):
+        # handle user logout
+        response = messagebox.askyesno("Confirm Logout", "Are you sure you want to logout?")
+        if response:
+            result, message = services.auth_service.AuthService.logout_user()
+            if result:
+                messagebox.showinfo("Success", message)
+                self.worker.shutdown()
+                self.views.root.destroy()
+    
+    def load_customers(self):
+        # populate customer tab from the first page; later pages load on scroll
+        if not self.views:
+            return
+        self.customer_loader.reset()
+    
+    def load_pets(self):
+        # populate pet tab from the first page; later pages load on scroll
+        if not self.views:
+            return
+        self.pet_loader.reset()
+    
+    # apply a mutation to the lists: re-read only the rows it touched
+    def refresh_customers(self, customer_ids):
+        if self.customer_loader:
+            self.customer_loader.refresh(customer_ids)
+    
+    def refresh_pets(self, pet_ids):
+        if self.pet_loader:
+            self.pet_loader.refresh(pet_ids)
+    
+    # call back with the owner index, building it on the worker the first time
+    def with_owner_index(self, callback):
+        if self.owner_index is not None:
+            callback(self.owner_index)
+            return
+        self._owner_index_waiters.append(callback)
+        if len(self._owner_index_waiters) == 1:
+            self.worker.submit("owner_index", OwnerIndex.build, self.db,
+                               on_success=self._owner_index_ready, on_error=self._owner_index_failed)
+    
+    def _owner_index_ready(self, index):
+        self.owner_index = index
+        waiters, self._owner_index_waiters = self._owner_index_waiters, []
+        # the build may have read some customers before they changed
+        if self._owner_index_changed:
+            self.customer_loader.refresh(self._owner_index_changed)
+            self._owner_index_changed = set()
+        for callback in waiters:
+            callback(index)
+    
+    def _owner_index_failed(self, error):
+        # pickers keep using the SQL prefix search
+        self._owner_index_waiters = []
+        print(f"Failed to build owner index: {error}")
+    
+    # keep the owner index in step with customer refreshes and deletes
+    def update_owner_index(self, customer_ids, rows):
+        if self.owner_index is not None:
+            self.owner_index.update(customer_ids, rows)
+        elif self._owner_index_waiters:
+            self._owner_index_changed.update(customer_ids)
+    
+    def on_customer_scroll(self, first, last):
+        if self.customer_loader:
+            self.customer_loader.on_scroll(first, last)
+    
+    def on_pet_scroll(self, first, last):
+        if self.pet_loader:
+            self.pet_loader.on_scroll(first, last)
+    
+    def show_checkin_form(self):
+        # open check-in dialog for new bookings
+        CheckinDialog(self.db, self).show()
+    
+    def show_checkout_form(self):
+        # open checkout dialog
+        CheckoutDialog(self.db, self).show()
+    
+    def add_customer(self):
+        # open add customer dialog
+        AddCustomerDialog(self.db, self).show()
+    
+    def edit_customer(self, event=None):
+        # open edit dialog for selected customer
+        selection = self.views.customer_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a customer to edit")
+            return
+        
+        item = self.views.customer_tree.item(selection[0])
+        customer_id = item['values'][0]
+        EditCustomerDialog(self.db, customer_id, self).show()
+    
+    def delete_customer(self):
+        # delete selected customer with cascading delete 
+        selection = self.views.customer_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a customer to delete")
+            return
+        
+        item = self.views.customer_tree.item(selection[0])
+        customer_id = item['values'][0]
+        customer_name = f"{item['values'][1]} {item['values'][2]}"
+        
+        # count first so the warning says how much history goes with them
+        self.worker.submit("delete_customer", PurgeService.count_customer, self.db, customer_id,
+                           on_success=lambda counts: self.confirm_delete_customer(customer_id, customer_name, counts),
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to delete customer: {str(e)}"))
+    
+    def confirm_delete_customer(self, customer_id, customer_name, counts):
+        # Warn about cascading deletion of related records
+        response = messagebox.askyesno(
+            "Confirm Delete", 
+            f"Are you sure you want to delete customer '{customer_name}'?\n\n"
+            f"This will also delete {counts['Pet']:,} pet(s), {counts['Boarding']:,} boarding records "
+            f"and {counts['Grooming']:,} grooming records!"
+        )
+        
+        if response:
+            def deleted(result):
+                success, message = result
+                if success:
+                    messagebox.showinfo("Success", f"Customer '{customer_name}' deleted successfully\n\n{message}")
+                    self.customer_loader.remove([customer_id])
+                    self.pet_loader.remove_where(lambda pet: pet['customer_id'] == customer_id)
+                else:
+                    messagebox.showerror("Error", f"Failed to delete customer: {message}")
+                    # a purge that stopped part way may already have removed some pets
+                    self.pet_loader.refresh_where(lambda pet: pet['customer_id'] == customer_id)
+                self.update_dashboard()
+            
+            # history goes in small batches on the worker so other desks
+            # can keep checking in while a large account is removed
+            self.worker.submit("delete_customer", PurgeService.purge_customer, self.db, customer_id,
+                               on_success=deleted, on_error=self.delete_failed,
+                               on_progress=self.show_delete_progress)
+    
+    def show_delete_progress(self, table, deleted, total):
+        self.views.status_label.config(text=f"Deleting {table} records: {deleted:,} of {total:,}...")
+    
+    def delete_failed(self, error):
+        messagebox.showerror("Error", f"Delete failed: {str(error)}")
+    
+    def add_pet(self):
+        # open add pet dialog
+        AddPetDialog(self.db, self).show()
+    
+    def edit_pet(self, event=None):
+        # open edit dialog for selected pet
+        selection = self.views.pet_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a pet to edit")
+            return
+        
+        item = self.views.pet_tree.item(selection[0])
+        pet_id = item['values'][0]
+        EditPetDialog(self.db, pet_id, self).show()
+    
+    def delete_pet(self):
+        # delete selected pet with boarding status check
+        selection = self.views.pet_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a pet to delete")
+            return
+        
+        item = self.views.pet_tree.item(selection[0])
+        pet_id = item['values'][0]
+        pet_name = item['values'][1]
+        owner_name = item['values'][5]
+        
+        # confirm deletion warning
+        response = messagebox.askyesno(
+            "Confirm Delete", 
+            f"Are you sure you want to delete pet '{pet_name}' (Owner: {owner_name})?\n\n"
+            f"This will also delete all boarding and grooming records for this pet!"
+        )
+        
+        if response:
+            # Check if pet is currently boarded
+            self.worker.submit("delete_pet", PurgeService.count_pet, self.db, pet_id,
+                               on_success=lambda counts: self.confirm_delete_pet(pet_id, pet_name, counts),
+                               on_error=lambda e: messagebox.showerror("Error", f"Failed to delete pet: {str(e)}"))
+    
+    def confirm_delete_pet(self, pet_id, pet_name, counts):
+        # additional warning if pet is currently boarded
+        if counts['open_boardings'] > 0:
+            response = messagebox.askyesno(
+                "Pet is Currently Boarded",
+                f"Pet '{pet_name}' is currently boarded!\n\n"
+                f"If you delete this pet, the boarding space will be freed up.\n"
+                f"Continue with deletion?"
+            )
+            if not response:
+                return
+        
+        def deleted(result):
+            success, message = result
+            if success:
+                messagebox.showinfo("Success", f"Pet '{pet_name}' deleted successfully")
+                self.pet_loader.remove([pet_id])
+            else:
+                messagebox.showerror("Error", f"Failed to delete pet: {message}")
+            self.update_dashboard()
+        
+        self.worker.submit("delete_pet", PurgeService.purge_pet, self.db, pet_id,
+                           on_success=deleted, on_error=self.delete_failed,
+                           on_progress=self.show_delete_progress)
+    
+    def update_dashboard(self):
+        # update dashboard display with current boarding capacity
+        if not self.views:
+            return
+        
+        def show_spaces(spaces):
+            self.views.dog_spaces_label.config(text=f"Available: {spaces['dog_spaces']} of 30")
+            self.views.cat_spaces_label.config(text=f"Available: {spaces['cat_spaces']} of 12")
+        
+        self.worker.submit("dashboard", BoardingService.get_available_spaces, self.db,
+                           on_success=show_spaces)
+    
+    def generate_occupancy_report(self, period_days):
+        # generate occupancy report; both reports share one key so clicking
+        # again before the first finishes supersedes it
+        self.views.display_report("Generating occupancy report...")
+        self.worker.submit("report", ReportService.build_occupancy_report, self.db, period_days,
+                           on_success=self.views.show_report,
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to generate occupancy report: {str(e)}"))
+    
+    def generate_revenue_report(self, period_days):
+        # generate revenue report
+        self.views.display_report("Generating revenue report...")
+        self.worker.submit("report", ReportService.build_revenue_report, self.db, period_days,
+                           on_success=self.views.show_report,
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to generate revenue report: {str(e)}"))
+
+# dialog classes
+class CheckinDialog:
+    CREATE_NEW = "new"
+    
+    def __init__(self, db, controller):
+        self.db = db
+        self.controller = controller
+        
+    def show(self):
+        # create and display check-in dialog window
+        dialog = tk.Toplevel()
+        dialog.title("New Booking - Check-In")
+        dialog.geometry("600x400")
+        dialog.resizable(False, False)
+        
+        main_frame = tk.Frame(dialog, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Left side form fields
+        left_frame = tk.Frame(main_frame)
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 20))
+        
+        tk.Label(left_frame, text="Owner:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        owner_entry = tk.Entry(left_frame, width=28)
+        owner_entry.pack(anchor="w", pady=(0, 15))
+        
+        tk.Label(left_frame, text="Pet Type:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        pet_type_var = tk.StringVar(value="Dog")
+        pet_type_combo = ttk.Combobox(left_frame, textvariable=pet_type_var, 
+                                     values=["Dog", "Cat"], state="readonly", width=25)
+        pet_type_combo.pack(anchor="w", pady=(0, 15))
+        
+        tk.Label(left_frame, text="Pet Name:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        pet_name_entry = tk.Entry(left_frame, width=28)
+        pet_name_entry.pack(anchor="w", pady=(0, 15))
+        
+        grooming_var = tk.BooleanVar()
+        tk.Checkbutton(left_frame, text="Grooming Requested", 
+                      variable=grooming_var, font=("Arial", 11)).pack(anchor="w", pady=15)
+        
+        # right side form fields
+        right_frame = tk.Frame(main_frame)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        tk.Label(right_frame, text="Breed:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        breed_entry = tk.Entry(right_frame, width=28)
+        breed_entry.pack(anchor="w", pady=(0, 15))
+        
+        tk.Label(right_frame, text="Age:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        age_values = [str(i) for i in range(1, 17)]
+        age_var = tk.StringVar(value="1")
+        age_combo = ttk.Combobox(right_frame, textvariable=age_var, 
+                                values=age_values, state="readonly", width=25)
+        age_combo.pack(anchor="w", pady=(0, 15))
+        
+        tk.Label(right_frame, text="Weight:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        weight_frame = tk.Frame(right_frame)
+        weight_frame.pack(anchor="w", pady=(0, 15))
+        
+        weight_entry = tk.Entry(weight_frame, width=10)
+        weight_entry.pack(side=tk.LEFT)
+        tk.Label(weight_frame, text=" lbs").pack(side=tk.LEFT, padx=(5, 0))
+        
+        tk.Label(right_frame, text="Days Stay:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        days_values = [str(i) for i in range(1, 32)]
+        days_var = tk.StringVar(value="1")
+        days_combo = ttk.Combobox(right_frame, textvariable=days_var, 
+                                 values=days_values, state="readonly", width=25)
+        days_combo.pack(anchor="w", pady=(0, 15))
+        
+        # action buttons
+        buttons_frame = tk.Frame(dialog)
+        buttons_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        def check_in():
+            # validate all input fields before completing check-in
+            pet_name = pet_name_entry.get().strip()
+            is_valid, error = validate_pet_name(pet_name)
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            owner_name = owner_entry.get().strip()
+            is_valid, error = validate_name(owner_name, "Owner name")
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            breed = breed_entry.get().strip()
+            is_valid, error = validate_breed(breed)
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            try:
+                pet_type = pet_type_var.get()
+                age = int(age_var.get())
+                days_stay = int(days_var.get())
+                
+                # validate age range
+                if age <= 0 or age > 30:
+                    messagebox.showerror("Error", "Age must be between 1 and 30 years")
+                    return
+                
+                # validate stay duration
+                if days_stay <= 0 or days_stay > 365:
+                    messagebox.showerror("Error", "Days stay must be between 1 and 365")
+                    return
+                
+                # validate weight based on pet type
+                weight_str = weight_entry.get() if weight_entry.get() else "0"
+                is_valid, error = validate_weight(weight_str, pet_type)
+                if not is_valid:
+                    messagebox.showerror("Validation Error", error)
+                    return
+                
+                weight = float(weight_str)
+                grooming = grooming_var.get()
+                
+                # find or create the owner, create the pet and board it in
+                # one transaction; a full kennel leaves nothing behind
+                pet_data = {
+                    'pet_name': pet_name,
+                    'pet_type': pet_type,
+                    'pet_age': age,
+                    'breed': breed,
+                    'weight': weight
+                }
+                # look the owner up by name first so a typo or a second
+                # customer with the same name is confirmed, not guessed.
+                # the button stays off until the check-in finishes or fails
+                checkin_button.config(state=tk.DISABLED)
+                self.controller.worker.submit(
+                    "checkin", CustomerLookupService.find_candidates, self.db, owner_name,
+                    on_success=lambda candidates: admit(owner_name, pet_data, days_stay, grooming, candidates),
+                    on_error=failed)
+                    
+            except ValueError as e:
+                messagebox.showerror("Error", f"Please enter valid data: {str(e)}")
+            except Exception as e:
+                messagebox.showerror("Error", f"An error occurred: {str(e)}")
+        
+        def admit(owner_name, pet_data, days_stay, grooming, candidates):
+            if not dialog.winfo_exists():
+                return
+            if candidates:
+                choice = self.choose_owner(dialog, owner_name, candidates)
+                if choice is None:
+                    release()
+                    return
+                customer_id = None if choice == self.CREATE_NEW else choice
+            else:
+                customer_id = None
+            
+            self.controller.worker.submit("checkin", BoardingService.admit, self.db, owner_name, pet_data,
+                                          days_stay, grooming, customer_id, customer_id is None,
+                                          on_success=admitted, on_error=failed)
+        
+        def admitted(result):
+            success, message, rows = result
+            if success:
+                messagebox.showinfo("Success", message)
+                if dialog.winfo_exists():
+                    dialog.destroy()
+                # Refresh UI components
+                self.controller.refresh_pets([rows['pet_id']])
+                self.controller.refresh_customers([rows['customer_id']])
+                self.controller.update_dashboard()
+            else:
+                messagebox.showerror("Error", message)
+                release()
+        
+        def failed(error):
+            messagebox.showerror("Error", f"An error occurred: {str(error)}")
+            release()
+        
+        def release():
+            if dialog.winfo_exists():
+                checkin_button.config(state=tk.NORMAL)
+        
+        # add buttons to dialog
+        checkin_button = tk.Button(buttons_frame, text="Check-In", command=check_in,
+                                   bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
+                                   padx=30, pady=10)
+        checkin_button.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
+                 bg="#FF9800", fg="white", font=("Arial", 11),
+                 padx=30, pady=10).pack(side=tk.RIGHT)
+        
+        # make dialog
+        dialog.grab_set()
+        dialog.wait_window()
+
+    # ask which existing owner the typed name means; returns the chosen
+    # customer_id, None for cancel, or CREATE_NEW to add a new owner
+    def choose_owner(self, parent, owner_name, candidates):
+        picker = tk.Toplevel(parent)
+        picker.title("Select Owner")
+        picker.geometry("460x320")
+        picker.resizable(False, False)
+        picker.transient(parent)
+        
+        frame = tk.Frame(picker, padx=15, pady=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(frame, text=f"Owners matching '{owner_name}':",
+                 font=("Arial", 11, "bold")).pack(anchor="w", pady=(0, 5))
+        
+        listbox = tk.Listbox(frame, height=8, font=("Arial", 10))
+        listbox.pack(fill=tk.BOTH, expand=True)
+        for candidate in candidates:
+            contact = candidate['phone'] or candidate['email'] or ""
+            listbox.insert(tk.END, f"{CustomerLookupService.full_name(candidate)}  {contact}  ({candidate['match']})")
+        listbox.selection_set(0)
+        
+        result = {'choice': None}
+        
+        def use_selected():
+            selection = listbox.curselection()
+            if not selection:
+                messagebox.showwarning("Warning", "Please select an owner", parent=picker)
+                return
+            result['choice'] = candidates[selection[0]]['customer_id']
+            picker.destroy()
+        
+        def create_new():
+            result['choice'] = CheckinDialog.CREATE_NEW
+            picker.destroy()
+        
+        listbox.bind("<Double-Button-1>", lambda event: use_selected())
+        
+        buttons = tk.Frame(frame)
+        buttons.pack(fill=tk.X, pady=(10, 0))
+        tk.Button(buttons, text="Use Selected Owner", command=use_selected,
+                 bg="#2196F3", fg="white", padx=10).pack(side=tk.LEFT)
+        tk.Button(buttons, text="Create New Owner", command=create_new,
+                 bg="#4CAF50", fg="white", padx=10).pack(side=tk.LEFT, padx=(10, 0))
+        tk.Button(buttons, text="Cancel", command=picker.destroy,
+                 bg="#FF9800", fg="white", padx=10).pack(side=tk.RIGHT)
+        
+        picker.grab_set()
+        picker.wait_window()
+        parent.grab_set()
+        return result['choice']
+
+class CheckoutDialog:
+    def __init__(self, db, controller):
+        self.db = db
+        self.controller = controller
+        
+    def show(self):
+        # create checkout dialog
+        dialog = tk.Toplevel()
+        dialog.title("Check-Out")
+        dialog.geometry("500x550")
+        dialog.resizable(False, False)
+        
+        main_frame = tk.Frame(dialog, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(main_frame, text="Select Pet:", font=("Arial", 11, "bold")).pack(anchor="w", pady=(0, 5))
+        
+        # currently boarded pets are filled in when the background load finishes
+        boardings = []
+        
+        pet_var = tk.StringVar(value="Loading...")
+        pet_combo = ttk.Combobox(main_frame, textvariable=pet_var, 
+                                values=[], state="disabled", width=40)
+        pet_combo.pack(anchor="w", pady=(0, 20))
+        
+        def show_boardings(result):
+            if not dialog.winfo_exists():
+                return
+            boardings[:] = result
+            pet_combo.config(values=[f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})" for b in boardings],
+                             state="readonly")
+            pet_var.set("")
+        
+        self.controller.worker.submit("checkout_boardings", BoardingService.get_current_boardings, self.db,
+                                      on_success=show_boardings,
+                                      on_error=lambda e: messagebox.showerror("Error", f"Failed to load boarded pets: {str(e)}"))
+        
+        # pet details display frame
+        details_frame = tk.LabelFrame(main_frame, text="Pet Details", padx=10, pady=10)
+        details_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        pet_name_label = tk.Label(details_frame, text="Pet Name: ", anchor="w")
+        pet_name_label.pack(fill=tk.X, pady=2)
+        
+        owner_label = tk.Label(details_frame, text="Owner: ", anchor="w")
+        owner_label.pack(fill=tk.X, pady=2)
+        
+        days_label = tk.Label(details_frame, text="Boarding Days: ", anchor="w")
+        days_label.pack(fill=tk.X, pady=2)
+        
+        weight_label = tk.Label(details_frame, text="Weight: ", anchor="w")
+        weight_label.pack(fill=tk.X, pady=2)
+        
+        grooming_label = tk.Label(details_frame, text="Grooming: ", anchor="w")
+        grooming_label.pack(fill=tk.X, pady=2)
+        
+        # payment information frame
+        amount_frame = tk.LabelFrame(main_frame, text="Payment", padx=10, pady=10)
+        amount_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        amount_label = tk.Label(amount_frame, text="Total Amount Due: $0.00", 
+                                font=("Arial", 12, "bold"))
+        amount_label.pack(anchor="w")
+        
+        # action buttons frame
+        buttons_frame = tk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X)
+        
+        def calculate_total():
+            # calculate and display total amount due for selected pet
+            selection = pet_combo.get()
+            if selection and boardings:
+                for b in boardings:
+                    display_name = f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})"
+                    if display_name == selection:
+                        # get grooming price if applicable
+                        self.controller.worker.submit(
+                            "checkout_total", BoardingService.get_grooming, self.db, b['boarding_id'],
+                            on_success=lambda grooming, b=b: show_total(b, grooming),
+                            on_error=lambda e: messagebox.showerror("Error", f"Failed to load grooming: {str(e)}"))
+                        break
+        
+        def show_total(b, grooming):
+            if not dialog.winfo_exists():
+                return
+            grooming_price = grooming.price if grooming else 0
+            total = b['amount_due']
+            
+            amount_label.config(text=f"Total Amount Due: ${total:.2f}")
+            
+            # update detail labels
+            pet_name_label.config(text=f"Pet Name: {b['pet_name']}")
+            owner_label.config(text=f"Owner: {b['first_name']} {b['last_name']}")
+            days_label.config(text=f"Boarding Days: {b['days_stay']}")
+            weight_label.config(text=f"Weight: {b.get('weight', 0)} lbs")
+            
+            # format grooming information with tier pricing for dogs
+            if b['pet_type'].lower() == 'dog' and b.get('weight', 0):
+                grooming_tier = ""
+                for tier, details in BoardingService.GROOMING_PRICES.items():
+                    if details['min'] <= b['weight'] <= details['max']:
+                        # show what was actually charged when it was recorded
+                        grooming_tier = f" ({tier.title()} - ${grooming_price or details['price']})"
+                        break
+                grooming_text = f"Grooming: {'Yes' + grooming_tier if b['grooming_requested'] else 'No'}"
+            else:
+                grooming_text = f"Grooming: {'Yes' if b['grooming_requested'] else 'No'}"
+            grooming_label.config(text=grooming_text)
+        
+        def show_invoice(invoice, parent=None):
+            if not invoice:
+                return
+            invoice_dialog = tk.Toplevel(parent)
+            invoice_dialog.title("Invoice")
+            invoice_dialog.geometry("400x500")
+            
+            text_widget = tk.Text(invoice_dialog, wrap=tk.WORD)
+            text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            text_widget.insert(1.0, invoice)
+            text_widget.config(state=tk.DISABLED)
+        
+        def confirm_checkout():
+            # process checkout for selected pet
+            selection = pet_combo.get()
+            if not selection:
+                messagebox.showerror("Error", "Please select a pet")
+                return
+            
+            response = messagebox.askyesno("Confirm Check-out", 
+                                          f"Check out {selection.split('(')[0].strip()}?")
+            if response:
+                for b in boardings:
+                    display_name = f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})"
+                    if display_name == selection:
+                        checkout_button.config(state=tk.DISABLED)
+                        self.controller.worker.submit(
+                            "checkout", CheckoutService.check_out_pet, self.db, b['boarding_id'],
+                            on_success=lambda result, b=b: checked_out(b, result),
+                            on_error=checkout_failed)
+                        break
+        
+        def checked_out(b, result):
+            success, message, amount = result
+            if not success:
+                messagebox.showerror("Error", message)
+                if dialog.winfo_exists():
+                    checkout_button.config(state=tk.NORMAL)
+                return
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self.controller.update_dashboard()
+            
+            # Generate and display invoice
+            def invoiced(invoice):
+                show_invoice(invoice)
+                messagebox.showinfo("Success", message)
+            
+            self.controller.worker.submit(
+                "invoice", CheckoutService.generate_invoice, self.db, b['boarding_id'],
+                on_success=invoiced,
+                on_error=lambda e: messagebox.showinfo("Success", f"{message}\n\nFailed to generate invoice: {str(e)}"))
+        
+        def checkout_failed(error):
+            messagebox.showerror("Error", f"Check-out failed: {str(error)}")
+            if dialog.winfo_exists():
+                checkout_button.config(state=tk.NORMAL)
+        
+        def generate_invoice():
+            # generate invoice without checking out
+            selection = pet_combo.get()
+            if not selection:
+                messagebox.showerror("Error", "Please select a pet")
+                return
+            
+            for b in boardings:
+                display_name = f"{b['pet_name']} (Owner: {b['first_name']} {b['last_name']})"
+                if display_name == selection:
+                    self.controller.worker.submit(
+                        "invoice", CheckoutService.generate_invoice, self.db, b['boarding_id'],
+                        on_success=lambda invoice: show_invoice(invoice, dialog) if dialog.winfo_exists() else None,
+                        on_error=lambda e: messagebox.showerror("Error", f"Failed to generate invoice: {str(e)}"))
+                    break
+        
+        # add action buttons
+        tk.Button(buttons_frame, text="Calculate Total", command=calculate_total,
+                 bg="#2196F3", fg="white", font=("Arial", 10),
+                 padx=15, pady=8).pack(side=tk.LEFT, padx=(0, 5))
+        
+        checkout_button = tk.Button(buttons_frame, text="Confirm Check-out", command=confirm_checkout,
+                                    bg="#2196F3", fg="white", font=("Arial", 10, "bold"),
+                                    padx=15, pady=8)
+        checkout_button.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(buttons_frame, text="Invoice", command=generate_invoice,
+                 bg="#2196F3", fg="white", font=("Arial", 10),
+                 padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
+                 bg="#FF9800", fg="white", font=("Arial", 10),
+                 padx=15, pady=8).pack(side=tk.RIGHT)
+        
+        # Make dialog modal
+        dialog.grab_set()
+        dialog.wait_window()
+
+class AddCustomerDialog:
+    def __init__(self, db, controller):
+        self.db = db
+        self.controller = controller
+        
+    def show(self):
+        # create add customer dialog
+        dialog = tk.Toplevel()
+        dialog.title("Add Customer")
+        dialog.geometry("400x300")
+        
+        tk.Label(dialog, text="First Name:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
+        first_name_entry = tk.Entry(dialog, width=30)
+        first_name_entry.grid(row=0, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Last Name:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
+        last_name_entry = tk.Entry(dialog, width=30)
+        last_name_entry.grid(row=1, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Phone:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
+        phone_entry = tk.Entry(dialog, width=30)
+        phone_entry.grid(row=2, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Email:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
+        email_entry = tk.Entry(dialog, width=30)
+        email_entry.grid(row=3, column=1, pady=10, padx=10)
+        
+        def save_customer():
+            # validate and save new customer
+            first_name = first_name_entry.get().strip()
+            last_name = last_name_entry.get().strip()
+            phone = phone_entry.get().strip()
+            email = email_entry.get().strip()
+            
+            # validate first name
+            is_valid, error = validate_name(first_name, "First name")
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            # validate last name
+            is_valid, error = validate_name(last_name, "Last name")
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            # validate phone
+            is_valid, error = validate_phone(phone)
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            # validate email
+            is_valid, error = validate_email(email)
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            customer_data = {
+                'first_name': first_name,
+                'last_name': last_name,
+                'phone': phone,
+                'email': email
+            }
+            
+            save_button.config(state=tk.DISABLED)
+            self.controller.worker.submit("save_customer", Customer.create, self.db, customer_data,
+                                          on_success=saved, on_error=failed)
+        
+        def saved(customer_id):
+            messagebox.showinfo("Success", "Customer added successfully")
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self.controller.refresh_customers([customer_id])
+        
+        def failed(error):
+            messagebox.showerror("Error", f"Failed to add customer: {str(error)}")
+            if dialog.winfo_exists():
+                save_button.config(state=tk.NORMAL)
+        
+        save_button = tk.Button(dialog, text="Save", command=save_customer,
+                                bg="#2196F3", fg="white", padx=20, pady=10)
+        save_button.grid(row=4, column=0, columnspan=2, pady=20)
+        
+        dialog.grab_set()
+        dialog.wait_window()
+
+class EditCustomerDialog:
+    def __init__(self, db, customer_id, controller):
+        self.db = db
+        self.customer_id = customer_id
+        self.controller = controller
+        
+    def show(self):
+        # load the customer's row off the UI thread, then build the dialog
+        self.controller.worker.submit("edit_customer", Customer.get_by_id, self.db, self.customer_id,
+                                      on_success=self.build,
+                                      on_error=lambda e: messagebox.showerror("Error", f"Failed to load customer: {str(e)}"))
+    
+    def build(self, customer):
+        if not customer:
+            messagebox.showerror("Error", "Customer no longer exists")
+            self.controller.customer_loader.remove([self.customer_id])
+            return
+        
+        # create edit customer dialog
+        dialog = tk.Toplevel()
+        dialog.title("Edit Customer")
+        dialog.geometry("400x300")
+        
+        tk.Label(dialog, text="First Name:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
+        first_name_entry = tk.Entry(dialog, width=30)
+        first_name_entry.insert(0, customer['first_name'])
+        first_name_entry.grid(row=0, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Last Name:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
+        last_name_entry = tk.Entry(dialog, width=30)
+        last_name_entry.insert(0, customer['last_name'])
+        last_name_entry.grid(row=1, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Phone:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
+        phone_entry = tk.Entry(dialog, width=30)
+        phone_entry.insert(0, customer['phone'] or "")
+        phone_entry.grid(row=2, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Email:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
+        email_entry = tk.Entry(dialog, width=30)
+        email_entry.insert(0, customer['email'] or "")
+        email_entry.grid(row=3, column=1, pady=10, padx=10)
+        
+        def update_customer():
+            # validate and update customer information
+            first_name = first_name_entry.get().strip()
+            last_name = last_name_entry.get().strip()
+            phone = phone_entry.get().strip()
+            email = email_entry.get().strip()
+            
+            # validate first name
+            is_valid, error = validate_name(first_name, "First name")
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            # validate last name
+            is_valid, error = validate_name(last_name, "Last name")
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            # validate phone
+            is_valid, error = validate_phone(phone)
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            # validate email
+            is_valid, error = validate_email(email)
+            if not is_valid:
+                messagebox.showerror("Validation Error", error)
+                return
+            
+            customer_data = {
+                'first_name': first_name,
+                'last_name': last_name,
+                'phone': phone,
+                'email': email
+            }
+            
+            update_button.config(state=tk.DISABLED)
+            self.controller.worker.submit("save_customer", Customer.update, self.db, self.customer_id, customer_data,
+                                          on_success=updated, on_error=failed)
+        
+        def updated(result):
+            messagebox.showinfo("Success", "Customer updated successfully")
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self.controller.refresh_customers([self.customer_id])
+            # the pet list shows the owner's name
+            self.controller.pet_loader.refresh_where(lambda pet: pet['customer_id'] == self.customer_id)
+        
+        def failed(error):
+            messagebox.showerror("Error", f"Failed to update customer: {str(error)}")
+            if dialog.winfo_exists():
+                update_button.config(state=tk.NORMAL)
+        
+        update_button = tk.Button(dialog, text="Update", command=update_customer,
+                                  bg="#2196F3", fg="white", padx=20, pady=10)
+        update_button.grid(row=4, column=0, columnspan=2, pady=20)
+        
+        dialog.grab_set()
+        dialog.wait_window()
+
+class AddPetDialog:
+    def __init__(self, db, controller):
+        self.db = db
+        self.controller = controller
+        
+    def show(self):
+        # create add pet dialog
+        dialog = tk.Toplevel()
+        dialog.title("Add Pet")
+        dialog.geometry("400x400")
+        
+        content_frame = tk.Frame(dialog, padx=20, pady=20)
+        content_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(content_frame, text="Owner:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
+        
+        # owner dropdown loads a bounded page of owners; typing searches the rest
+        owner_picker = OwnerPicker(self.controller, content_frame, width=25)
+        owner_picker.grid(row=0, column=1, pady=10, padx=10)
+        
+        tk.Label(content_frame, text="Pet Type:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
+        pet_type_var = tk.StringVar(value="Dog")
+        pet_type_combo = ttk.Combobox(content_frame, textvariable=pet_type_var, 
+                                     values=["Dog", "Cat"], state="readonly", width=25)
+        pet_type_combo.grid(row=1, column=1, pady=10, padx=10)
+        
+        tk.Label(content_frame, text="Pet Name:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
+        pet_name_entry = tk.Entry(content_frame, width=28)
+        pet_name_entry.grid(row=2, column=1, pady=10, padx=10)
+        
+        tk.Label(content_frame, text="Breed:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
+        breed_entry = tk.Entry(content_frame, width=28)
+        breed_entry.grid(row=3, column=1, pady=10, padx=10)
+        
+        tk.Label(content_frame, text="Age:", font=("Arial", 11)).grid(row=4, column=0, pady=10, padx=10, sticky="w")
+        age_values = [str(i) for i in range(1, 17)]
+        age_var = tk.StringVar(value="1")
+        age_combo = ttk.Combobox(content_frame, textvariable=age_var, 
+                                values=age_values, state="readonly", width=25)
+        age_combo.grid(row=4, column=1, pady=10, padx=10)
+        
+        tk.Label(content_frame, text="Weight:", font=("Arial", 11)).grid(row=5, column=0, pady=10, padx=10, sticky="w")
+        weight_entry = tk.Entry(content_frame, width=28)
+        weight_entry.grid(row=5, column=1, pady=10, padx=10)
+        
+        buttons_frame = tk.Frame(dialog)
+        buttons_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        def save_pet():
+            # validate and save new pet
+            customer_id = owner_picker.selected_id()
+            if not customer_id:
+                messagebox.showerror("Error", "Please select an owner")
+                return
+            
+            # validate pet name
+            pet_name = pet_name_entry.get().strip()
+            is_valid, error = validate_pet_name(pet_name)
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            # validate breed
+            breed = breed_entry.get().strip()
+            is_valid, error = validate_breed(breed)
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            try:
+                # validate age
+                age = int(age_var.get()) if age_var.get() else 1
+                if age <= 0 or age > 30:
+                    messagebox.showerror("Error", "Age must be between 1 and 30 years")
+                    return
+                
+                pet_type = pet_type_var.get()
+                
+                # validate weight
+                weight_str = weight_entry.get().strip()
+                is_valid, error = validate_weight(weight_str, pet_type)
+                if not is_valid:
+                    messagebox.showerror("Validation Error", error)
+                    return
+                
+                weight = float(weight_str)
+                
+                # create pet record
+                pet_data = {
+                    'customer_id': customer_id,
+                    'pet_name': pet_name,
+                    'pet_type': pet_type,
+                    'pet_age': age,
+                    'breed': breed,
+                    'weight': weight
+                }
+                
+                add_button.config(state=tk.DISABLED)
+                self.controller.worker.submit("save_pet", Pet.create, self.db, pet_data,
+                                              on_success=saved, on_error=failed)
+            except ValueError as e:
+                if "Age must be" not in str(e):
+                    messagebox.showerror("Error", "Please enter valid numeric values")
+        
+        def saved(pet_id):
+            messagebox.showinfo("Success", "Pet added successfully")
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self.controller.refresh_pets([pet_id])
+        
+        def failed(error):
+            messagebox.showerror("Error", f"Failed to add pet: {str(error)}")
+            if dialog.winfo_exists():
+                add_button.config(state=tk.NORMAL)
+        
+        # add action buttons
+        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
+                 bg="#FF9800", fg="white", font=("Arial", 11),
+                 padx=20, pady=8).pack(side=tk.LEFT, padx=(0, 10))
+        
+        add_button = tk.Button(buttons_frame, text="Add", command=save_pet,
+                               bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
+                               padx=20, pady=8)
+        add_button.pack(side=tk.LEFT)
+        
+        dialog.grab_set()
+        dialog.wait_window()
+
+class EditPetDialog:
+    def __init__(self, db, pet_id, controller):
+        self.db = db
+        self.pet_id = pet_id
+        self.controller = controller
+        
+    def show(self):
+        # load the pet's row (with its owner) off the UI thread, then build the dialog
+        self.controller.worker.submit("edit_pet", Pet.get_by_id, self.db, self.pet_id,
+                                      on_success=self.build,
+                                      on_error=lambda e: messagebox.showerror("Error", f"Failed to load pet: {str(e)}"))
+    
+    def build(self, pet):
+        if not pet:
+            messagebox.showerror("Error", "Pet no longer exists")
+            self.controller.pet_loader.remove([self.pet_id])
+            return
+        
+        # create edit pet dialog
+        dialog = tk.Toplevel()
+        dialog.title("Edit Pet")
+        dialog.geometry("400x350")
+        
+        # owner dropdown starts on the current owner; typing searches the rest
+        tk.Label(dialog, text="Customer:", font=("Arial", 11)).grid(row=0, column=0, pady=10, padx=10, sticky="w")
+        owner_picker = OwnerPicker(self.controller, dialog, width=27, current=pet)
+        owner_picker.grid(row=0, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Pet Name:", font=("Arial", 11)).grid(row=1, column=0, pady=10, padx=10, sticky="w")
+        pet_name_entry = tk.Entry(dialog, width=30)
+        pet_name_entry.insert(0, pet['pet_name'])
+        pet_name_entry.grid(row=1, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Pet Type:", font=("Arial", 11)).grid(row=2, column=0, pady=10, padx=10, sticky="w")
+        pet_type_var = tk.StringVar(value=pet['pet_type'])
+        pet_type_combo = ttk.Combobox(dialog, textvariable=pet_type_var, 
+                                     values=["Dog", "Cat"], state="readonly", width=27)
+        pet_type_combo.grid(row=2, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Age:", font=("Arial", 11)).grid(row=3, column=0, pady=10, padx=10, sticky="w")
+        age_values = [str(i) for i in range(1, 17)]
+        age_var = tk.StringVar(value=str(int(pet['pet_age'])) if pet['pet_age'] else "1")
+        age_combo = ttk.Combobox(dialog, textvariable=age_var, 
+                                values=age_values, state="readonly", width=27)
+        age_combo.grid(row=3, column=1, pady=10, padx=10)
+        
+        tk.Label(dialog, text="Breed:", font=("Arial", 11)).grid(row=4, column=0, pady=10, padx=10, sticky="w")
+        breed_entry = tk.Entry(dialog, width=30)
+        breed_entry.insert(0, pet['breed'] or "")
+        breed_entry.grid(row=4, column=1, pady=10, padx=10)
+        
+        def update_pet():
+            # validate and update pet information
+            customer_id = owner_picker.selected_id()
+            if not customer_id:
+                messagebox.showerror("Error", "Please select a customer")
+                return
+            
+            # validate pet name
+            pet_name = pet_name_entry.get().strip()
+            is_valid, error = validate_pet_name(pet_name)
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            # validate breed
+            breed = breed_entry.get().strip()
+            is_valid, error = validate_breed(breed)
+            if not is_valid:
+                messagebox.showerror("Error", error)
+                return
+            
+            try:
+                age = int(age_var.get()) if age_var.get() else 1
+                
+                if age <= 0 or age > 30:
+                    messagebox.showerror("Error", "Age must be between 1 and 30 years")
+                    return
+                
+                # prepare updated pet data
+                pet_data = {
+                    'customer_id': customer_id,
+                    'pet_name': pet_name,
+                    'pet_type': pet_type_var.get(),
+                    'pet_age': age,
+                    'breed': breed,
+                    'weight': pet.get('weight', 0)
+                }
+                
+                update_button.config(state=tk.DISABLED)
+                self.controller.worker.submit("save_pet", Pet.update, self.db, self.pet_id, pet_data,
+                                              on_success=updated, on_error=failed)
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid age (1-30)")
+        
+        def updated(result):
+            messagebox.showinfo("Success", "Pet updated successfully")
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self.controller.refresh_pets([self.pet_id])
+            # a boarded pet that changed type moved to the other counter
+            self.controller.update_dashboard()
+        
+        def failed(error):
+            if isinstance(error, CapacityFullError):
+                messagebox.showerror("Cannot Change Pet Type", str(error))
+            else:
+                messagebox.showerror("Error", f"Failed to update pet: {str(error)}")
+            if dialog.winfo_exists():
+                update_button.config(state=tk.NORMAL)
+        
+        update_button = tk.Button(dialog, text="Update", command=update_pet,
+                                  bg="#2196F3", fg="white", padx=20, pady=10)
+        update_button.grid(row=5, column=0, columnspan=2, pady=20)
+        
+        dialog.grab_set()
+        dialog.wait_window()
+
+class ChangePasswordDialog:
+    def __init__(self, db, user_id):
+        self.db = db
+        self.user_id = user_id
+        
+    def show(self):
+        # create password change dialog
+        dialog = tk.Toplevel()
+        dialog.title("Change Password")
+        dialog.geometry("400x300")
+        dialog.resizable(False, False)
+        dialog.grab_set()
+        
+        main_frame = tk.Frame(dialog, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(main_frame, text="Current Password:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        current_password_var = tk.StringVar()
+        current_password_entry = tk.Entry(main_frame, textvariable=current_password_var, 
+                                         show="*", width=30)
+        current_password_entry.pack(anchor="w", pady=(0, 15))
+        
+        tk.Label(main_frame, text="New Password:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        new_password_var = tk.StringVar()
+        new_password_entry = tk.Entry(main_frame, textvariable=new_password_var, 
+                                     show="*", width=30)
+        new_password_entry.pack(anchor="w", pady=(0, 15))
+        
+        tk.Label(main_frame, text="Confirm New Password:", font=("Arial", 11)).pack(anchor="w", pady=(0, 5))
+        confirm_password_var = tk.StringVar()
+        confirm_password_entry = tk.Entry(main_frame, textvariable=confirm_password_var, 
+                                         show="*", width=30)
+        confirm_password_entry.pack(anchor="w", pady=(0, 25))
+        
+        requirements_label = tk.Label(main_frame, 
+                                     text="Password must be at least 6 characters",
+                                     font=("Arial", 9), fg="gray")
+        requirements_label.pack(anchor="w", pady=(0, 20))
+        
+        buttons_frame = tk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X)
+        
+        def change_password():
+            # process password change request
+            current = current_password_var.get()
+            new = new_password_var.get()
+            confirm = confirm_password_var.get()
+            
+            success, message = services.auth_service.AuthService.change_password(self.db, self.user_id, 
+                                                          current, new, confirm)
+            if success:
+                messagebox.showinfo("Success", message)
+                dialog.destroy()
+            else:
+                messagebox.showerror("Error", message)
+        
+        # add action buttons
+        tk.Button(buttons_frame, text="Cancel", command=dialog.destroy,
+                 bg="#FF9800", fg="white", padx=20, pady=8).pack(side=tk.LEFT, padx=(0, 10))
+        
+        tk.Button(buttons_frame, text="Change Password", command=change_password,
+                 bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
+                 padx=20, pady=8).pack(side=tk.LEFT)
+        
+        dialog.bind('<Return>', lambda e: change_password())
         dialog.wait_window()
\ No newline at end of file
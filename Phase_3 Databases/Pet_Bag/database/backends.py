@@ -0,0 +1,265 @@
+# database/backends.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Storage backends (MySQL server or embedded SQLite) behind DatabaseConnection
+# 2026-10-18: Added so the app, CI and benchmarks can run without a MySQL server
+# 2026-10-18: Report the ids of a multi-row INSERT for the bulk create APIs
+# 2026-10-18: Translate ON DUPLICATE KEY UPDATE for the daily_stats rollup
+# 2026-10-18: Name the database each backend points at for the shared report cache
+# 2026-10-18: Corrected the note on how an in-memory SQLite database is shared
+# 2026-10-18: Look up an index by name so a rerun migration can skip the ones it already built
+# 2026-10-18: Multi-row INSERT ids are consecutive in every autoinc lock mode; check the increment instead
+# 2026-10-18: Translate MySQL's DROP INDEX ... ON table
+#
+# every backend hands out connections with the mysql.connector surface the
+# models already use: cursor(dictionary=True), %s placeholders, lastrowid,
+# rowcount, commit/rollback, ping and in_transaction
+
+import os
+import re
+import sqlite3
+import itertools
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from config import config
+
+class MySQLBackend:
+    name = "mysql"
+    explain_prefix = "EXPLAIN "
+    single_connection = False
+
+    def __init__(self):
+        # imported here so SQLite-only installs do not need the MySQL driver
+        import mysql.connector
+        self.driver = mysql.connector
+        self.Error = mysql.connector.Error
+        self.IntegrityError = mysql.connector.IntegrityError
+        self._consecutive_ids = None
+
+    def connect(self, database):
+        return self.driver.connect(
+            host=config.DB_HOST,
+            user=config.DB_USER,
+            password=config.DB_PASSWORD,
+            database=database
+        )
+
+    def create_database(self, database):
+        connection = self.driver.connect(
+            host=config.DB_HOST,
+            user=config.DB_USER,
+            password=config.DB_PASSWORD
+        )
+        cursor = connection.cursor()
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")
+        cursor.close()
+        connection.close()
+
+    # the same string in every process connected to this database
+    def identity(self, database):
+        return f"mysql://{config.DB_USER}@{config.DB_HOST}/{database}"
+
+    def consecutive_insert_ids(self, cursor):
+        # a multi-row INSERT ... VALUES is a "simple insert": InnoDB knows the
+        # row count up front and reserves one block of ids for it in every
+        # innodb_autoinc_lock_mode, including the MySQL 8 default of 2. the
+        # block is only consecutive while auto_increment_increment is 1
+        # (replication setups raise it to interleave servers)
+        if self._consecutive_ids is None:
+            cursor.execute("SELECT @@auto_increment_increment")
+            self._consecutive_ids = int(cursor.fetchone()[0]) == 1
+        return self._consecutive_ids
+
+    def first_insert_id(self, cursor, count):
+        # LAST_INSERT_ID() of a multi-row INSERT is its first row
+        return cursor.lastrowid
+
+    def index_exists(self, cursor, table, index):
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+        """, (table, index))
+        return cursor.fetchone()[0] > 0
+
+    def find_full_scans(self, plan_rows):
+        # MySQL reports a full table scan as access type ALL
+        return [row.get('table') for row in plan_rows if row.get('type') == 'ALL']
+
+# SQLite stores dates as ISO text; convert on the way in and out so callers
+# get the same date/datetime/number types mysql.connector returns
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_adapter(Decimal, float)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+@lru_cache(maxsize=512)
+def translate_sql(sql):
+    # rewrite the few MySQL-only constructs the schema and queries use
+    sql = sql.replace("%s", "?")
+    sql = re.sub(r"\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", "INTEGER PRIMARY KEY AUTOINCREMENT", sql, flags=re.I)
+    # MySQL's default collation compares text case-insensitively ('Dog' = 'dog')
+    sql = re.sub(r"\bVARCHAR\((\d+)\)", r"VARCHAR(\1) COLLATE NOCASE", sql, flags=re.I)
+    sql = re.sub(r"^\s*EXPLAIN\s+(?!QUERY\s+PLAN)", "EXPLAIN QUERY PLAN ", sql, flags=re.I)
+    # index names are schema-wide in SQLite, so DROP INDEX takes no table
+    sql = re.sub(r"^(\s*DROP\s+INDEX\s+\w+)\s+ON\s+\w+", r"\1", sql, flags=re.I)
+    # upsert: ON DUPLICATE KEY UPDATE col = col + VALUES(col)
+    parts = re.split(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", sql, maxsplit=1, flags=re.I)
+    if len(parts) == 2:
+        sql = parts[0] + "ON CONFLICT DO UPDATE SET" + re.sub(r"\bVALUES\((\w+)\)", r"excluded.\1", parts[1], flags=re.I)
+    return sql
+
+class SQLiteCursor:
+    def __init__(self, cursor, dictionary=False):
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    def execute(self, sql, params=()):
+        self._cursor.execute(translate_sql(sql), tuple(params or ()))
+        return None
+
+    def executemany(self, sql, seq_of_params):
+        self._cursor.executemany(translate_sql(sql), [tuple(p) for p in seq_of_params])
+        return None
+
+    def _convert(self, row):
+        if row is None or not self._dictionary:
+            return row
+        columns = [column[0] for column in self._cursor.description]
+        return dict(zip(columns, row))
+
+    def fetchone(self):
+        return self._convert(self._cursor.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._convert(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._convert(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        return (self._convert(row) for row in self._cursor)
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+class SQLiteConnection:
+    def __init__(self, connection):
+        self._connection = connection
+        self._closed = False
+
+    def cursor(self, dictionary=False, buffered=False):
+        return SQLiteCursor(self._connection.cursor(), dictionary)
+
+    def start_transaction(self):
+        # take the write lock up front: a deferred transaction that read first
+        # fails instead of waiting when another writer commits in between
+        self._connection.execute("BEGIN IMMEDIATE")
+
+    def commit(self):
+        self._connection.commit()
+
+    def rollback(self):
+        self._connection.rollback()
+
+    @property
+    def in_transaction(self):
+        return self._connection.in_transaction
+
+    def ping(self, reconnect=False):
+        self._connection.execute("SELECT 1")
+
+    def is_connected(self):
+        return not self._closed
+
+    def close(self):
+        self._closed = True
+        self._connection.close()
+
+class SQLiteBackend:
+    name = "sqlite"
+    explain_prefix = "EXPLAIN QUERY PLAN "
+    Error = sqlite3.Error
+    IntegrityError = sqlite3.IntegrityError
+    _memory_ids = itertools.count(1)
+
+    def __init__(self, path=None):
+        self.path = path or config.DB_SQLITE_PATH
+        self.in_memory = self.path == ":memory:"
+        # an in-memory database is pooled through one connection: shared-cache
+        # connections lock whole tables against each other. files allow a pool
+        self.single_connection = self.in_memory
+        self._anchor = None
+        if self.in_memory:
+            # a named shared-cache URI, so every connection this backend opens
+            # (a reconnect, or another DatabaseConnection given this backend)
+            # sees the same database; the anchor keeps it alive while none is.
+            # a second backend gets a database of its own
+            self._uri = f"file:petbag_memory_{next(self._memory_ids)}?mode=memory&cache=shared"
+            self._anchor = self._open()
+
+    def _open(self):
+        if self.in_memory:
+            connection = sqlite3.connect(self._uri, uri=True, detect_types=sqlite3.PARSE_DECLTYPES,
+                                         check_same_thread=False)
+        else:
+            connection = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES,
+                                         check_same_thread=False, timeout=config.DB_POOL_TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    def connect(self, database=None):
+        # the database name is ignored: the file path identifies the database
+        return SQLiteConnection(self._open())
+
+    def create_database(self, database):
+        # the file (or in-memory database) is created on first connect
+        pass
+
+    # None for an in-memory database, which no other process can see
+    def identity(self, database):
+        return None if self.in_memory else f"sqlite://{os.path.abspath(self.path)}"
+
+    def consecutive_insert_ids(self, cursor):
+        # one writer at a time, so a multi-row INSERT takes consecutive ids
+        return True
+
+    def first_insert_id(self, cursor, count):
+        # SQLite reports the rowid of the last row inserted
+        return cursor.lastrowid - count + 1
+
+    def index_exists(self, cursor, table, index):
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND name = %s",
+                       (table, index))
+        return cursor.fetchone()[0] > 0
+
+    def find_full_scans(self, plan_rows):
+        # "SCAN b" is a full table scan; "SCAN b USING ... INDEX" walks an index
+        scans = []
+        for row in plan_rows:
+            detail = row.get('detail', '') if isinstance(row, dict) else row[-1]
+            if detail.startswith("SCAN ") and " USING " not in detail:
+                scans.append(detail.split()[1])
+        return scans
+
+def get_backend(name=None):
+    name = (name or config.DB_BACKEND).lower()
+    if name == "mysql":
+        return MySQLBackend()
+    if name == "sqlite":
+        return SQLiteBackend()
+    raise ValueError(f"Unknown database backend '{name}' (expected 'mysql' or 'sqlite')")
\ No newline at end of file
@@ -0,0 +1,500 @@
+# database/benchmark.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Stress and throughput checks run against a scratch database
+# 2026-10-18: Added the concurrent check-in stress test for atomic capacity reservation
+# 2026-10-18: Print the top statements from the query metrics after each run
+# 2026-10-18: Added row-memory to compare dict rows with the compact record types
+# 2026-10-18: Added bulk-insert to compare per-row create() with create_many()
+# 2026-10-18: Added report-latency for the single-pass rollup reports at growing history sizes
+# 2026-10-18: report-latency times computed reports and report cache hits separately
+# 2026-10-18: Added nightly-occupancy for the sweep-line timeline against one count per night
+# 2026-10-18: checkin-stress also retypes every boarded pet at once, which must not overbook either type
+#
+# usage:
+#   python -m database.benchmark checkin-stress [--checkins 400] [--threads 16]
+#       fire check-ins from a thread pool, then retype every boarded pet to the
+#       other type, and fail if any pet type is overbooked
+#   python -m database.benchmark row-memory [--rows 100000]
+#       bytes per row held by dictionary-cursor rows versus the record types
+#   python -m database.benchmark bulk-insert [--rows 5000]
+#       customers inserted one create() (and commit) at a time versus create_many()
+#   python -m database.benchmark report-latency [--sizes 10000,100000,1000000]
+#       revenue and occupancy report latency as the boarding history grows,
+#       next to the four Boarding scans the revenue report used to run and
+#       the revenue report served from the report cache
+#   python -m database.benchmark nightly-occupancy [--sizes 10000,100000,1000000]
+#       a year of nightly occupancy from the sweep line versus one COUNT query per night
+#
+# on the sqlite backend each run uses a throwaway file; on mysql pass
+# --database with a scratch database name (never the live one)
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from config import config
+from database.connection import DatabaseConnection, query_metrics
+from database.backends import get_backend, SQLiteBackend
+from database import migrate
+from models.capacity import Capacity, CapacityFullError
+from models.customer import Customer
+from models.pet import Pet
+from models.daily_stats import DailyStats
+from database.sample_data import seed_large_dataset
+
+def open_scratch_database(args, pool_size):
+    # returns (db, cleanup) for a migrated, empty scratch database
+    config.DB_POOL_SIZE = pool_size
+    config.REPORT_CACHE_DIR = ""  # keep scratch reports out of a shared cache directory, if one is set
+    cleanup = lambda: None
+    if config.DB_BACKEND == "sqlite":
+        # a file, not :memory:, so the pool really holds separate connections
+        folder = tempfile.mkdtemp(prefix="petbag_bench_")
+        path = os.path.join(folder, "bench.db")
+        backend = SQLiteBackend(path)
+
+        def cleanup():
+            for name in os.listdir(folder):
+                os.remove(os.path.join(folder, name))
+            os.rmdir(folder)
+    else:
+        if args.database == config.DB_NAME:
+            print("Refusing to benchmark the live database; pass --database with a scratch database name")
+            return None, cleanup
+        backend = get_backend()
+        config.DB_NAME = args.database
+        migrate.create_database(backend)
+
+    db = DatabaseConnection(pooled=True, backend=backend)
+    if not db.connect(database=args.database) or not migrate.ensure_schema(db):
+        return None, cleanup
+    return db, cleanup
+
+def _create_pets(db, count, rng):
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO Customer (first_name, last_name, phone, email)
+            VALUES (%s, %s, %s, %s)
+        """, ("Stress", "Test", "5550000000", "stress@example.com"))
+        customer_id = cursor.lastrowid
+        cursor.executemany("""
+            INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, [(customer_id, f"Pet{i}", 'dog' if rng.random() < 0.6 else 'cat', 3, "Mixed", 30)
+              for i in range(count)])
+        conn.commit()
+        cursor.execute("SELECT pet_id, pet_type FROM Pet WHERE customer_id = %s", (customer_id,))
+        pets = cursor.fetchall()
+        cursor.close()
+    return pets
+
+def _count_open_boardings(db):
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT p.pet_type, COUNT(*)
+            FROM Boarding b
+            JOIN Pet p ON b.pet_id = p.pet_id
+            WHERE b.check_out IS NULL
+            GROUP BY p.pet_type
+        """)
+        counts = {pet_type.lower(): count for pet_type, count in cursor.fetchall()}
+        cursor.close()
+    return counts
+
+# stays of each type checked out before the retype phase, so some retypes
+# find a free space and the rest race for it
+RETYPE_FREED = 3
+
+def _boarded_pets(db):
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT b.boarding_id, p.pet_id, p.customer_id, p.pet_name,
+                   p.pet_type, p.pet_age, p.breed, p.weight
+            FROM Boarding b
+            JOIN Pet p ON b.pet_id = p.pet_id
+            WHERE b.check_out IS NULL
+            ORDER BY b.boarding_id
+        """)
+        rows = cursor.fetchall()
+        cursor.close()
+    return rows
+
+def _retype_boarded(db, threads):
+    from services.checkout_service import CheckoutService
+
+    boarded = _boarded_pets(db)
+    for pet_type in Capacity.PET_TYPES:
+        for row in [row for row in boarded if row[4].lower() == pet_type][:RETYPE_FREED]:
+            CheckoutService.check_out_pet(db, row[0])
+            boarded.remove(row)
+
+    gate = threading.Event()
+
+    def retype(row):
+        _, pet_id, customer_id, pet_name, pet_type, pet_age, breed, weight = row
+        new_type = 'cat' if pet_type.lower() == 'dog' else 'dog'
+        gate.wait()
+        try:
+            Pet.update(db, pet_id, {
+                'customer_id': customer_id, 'pet_name': pet_name, 'pet_type': new_type,
+                'pet_age': pet_age, 'breed': breed, 'weight': weight
+            })
+            return "moved"
+        except CapacityFullError:
+            return "full"
+        except Exception as e:
+            return f"error: {e}"
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(retype, row) for row in boarded]
+        gate.set()
+        return [future.result() for future in futures]
+
+def checkin_stress(db, args):
+    from services.boarding_service import BoardingService
+
+    rng = random.Random(args.seed)
+    pets = _create_pets(db, args.checkins, rng)
+    limits = {pet_type: BoardingService.get_total_spaces(pet_type) for pet_type in Capacity.PET_TYPES}
+    requested = {pet_type: sum(1 for _, t in pets if t == pet_type) for pet_type in Capacity.PET_TYPES}
+
+    # a watcher polls the counters throughout the run so a transient
+    # overbooking that is later rolled back would still be caught
+    peak = {pet_type: 0 for pet_type in Capacity.PET_TYPES}
+    done = threading.Event()
+
+    def watch():
+        while not done.is_set():
+            for pet_type, count in Capacity.get_occupied(db).items():
+                peak[pet_type] = max(peak[pet_type], count)
+            time.sleep(0.005)
+
+    # workers hold at the gate until every check-in is queued so they collide
+    gate = threading.Event()
+
+    def check_in(pet_id):
+        gate.wait()
+        started = time.perf_counter()
+        success, message = BoardingService.check_in_pet(db, pet_id, 2)
+        return success, message, time.perf_counter() - started
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        futures = [executor.submit(check_in, pet_id) for pet_id, _ in pets]
+        gate.set()
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+    open_boardings = _count_open_boardings(db)
+    counters = Capacity.get_occupied(db)
+
+    # moving a boarded pet to the other type has to claim a space of that
+    # type just as a check-in does; the watcher keeps polling meanwhile
+    retypes = _retype_boarded(db, args.threads)
+    done.set()
+    watcher.join()
+    retyped_boardings = _count_open_boardings(db)
+    retyped_counters = Capacity.get_occupied(db)
+
+    admitted = sum(1 for success, _, _ in results if success)
+    full = sum(1 for success, message, _ in results if not success and message.startswith("No spaces"))
+    errors = [message for success, message, _ in results if not success and not message.startswith("No spaces")]
+    latencies = sorted(latency for _, _, latency in results)
+    retype_errors = [result for result in retypes if result.startswith("error")]
+
+    print(f"Backend: {db.backend.name}, threads: {args.threads}, check-ins: {len(results)}")
+    print(f"Admitted: {admitted}, rejected (full): {full}, errors: {len(errors)}")
+    print(f"Elapsed: {elapsed:.2f}s, throughput: {len(results) / elapsed:.1f} check-ins/s")
+    print(f"Latency p50: {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms, "
+          f"max: {latencies[-1] * 1000:.1f} ms")
+    print(f"Retypes: moved {retypes.count('moved')}, rejected (full): {retypes.count('full')}, "
+          f"errors: {len(retype_errors)}")
+    print(f"Pool: {db.pool_stats()}")
+    print(f"\nTop statements by total time:\n{query_metrics.top(5)}\n")
+
+    failures = []
+    for pet_type in Capacity.PET_TYPES:
+        expected = min(limits[pet_type], requested[pet_type])
+        booked = open_boardings.get(pet_type, 0)
+        print(f"{pet_type}: {booked}/{limits[pet_type]} booked, counter {counters[pet_type]}, "
+              f"peak counter {peak[pet_type]}")
+        if booked > limits[pet_type] or peak[pet_type] > limits[pet_type]:
+            failures.append(f"{pet_type} capacity exceeded")
+        if counters[pet_type] != booked:
+            failures.append(f"{pet_type} counter {counters[pet_type]} does not match {booked} open boardings")
+        if booked != expected:
+            failures.append(f"{pet_type} booked {booked}, expected {expected}")
+        retyped = retyped_boardings.get(pet_type, 0)
+        print(f"{pet_type} after retypes: {retyped}/{limits[pet_type]} booked, counter {retyped_counters[pet_type]}")
+        if retyped > limits[pet_type]:
+            failures.append(f"{pet_type} capacity exceeded by retypes")
+        if retyped_counters[pet_type] != retyped:
+            failures.append(f"{pet_type} counter {retyped_counters[pet_type]} does not match "
+                            f"{retyped} open boardings after retypes")
+    for message in errors[:5]:
+        failures.append(f"check-in error: {message}")
+    for message in retype_errors[:5]:
+        failures.append(f"retype {message}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: capacity was never exceeded")
+    return not failures
+
+def _seed_rows(db, count, rng, chunk=5000):
+    # count customers with one pet each, inserted in chunks
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, count, chunk):
+            size = min(chunk, count - start)
+            cursor.executemany("""
+                INSERT INTO Customer (first_name, last_name, phone, email)
+                VALUES (%s, %s, %s, %s)
+            """, [(f"First{i}", f"Last{rng.randrange(count)}", "5551234567", f"owner{i}@example.com")
+                  for i in range(start, start + size)])
+        cursor.execute("SELECT MIN(customer_id) FROM Customer")
+        first_id = cursor.fetchone()[0]
+        for start in range(0, count, chunk):
+            size = min(chunk, count - start)
+            cursor.executemany("""
+                INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, [(first_id + i, f"Pet{i}", 'dog' if i % 3 else 'cat', 4, "Mixed", 25.5)
+                  for i in range(start, start + size)])
+        db.commit(conn)
+        cursor.close()
+
+def _dict_rows(db, sql):
+    with db.get_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+        cursor.close()
+    return rows
+
+def _measure(fetch):
+    # bytes still allocated once the rows are returned, and the peak while fetching
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    rows = fetch()
+    elapsed = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(rows), retained - before, peak - before, elapsed
+
+def row_memory(db, args):
+    # the row cache would keep its own references to the records; leave it out
+    config.ROW_CACHE_ENABLED = False
+    _seed_rows(db, args.rows, random.Random(args.seed))
+
+    cases = [
+        ("Customer", "dict rows", lambda: _dict_rows(db, "SELECT * FROM Customer ORDER BY last_name, first_name")),
+        ("Customer", "CustomerRecord", lambda: Customer.get_all(db)),
+        ("Pet", "dict rows", lambda: _dict_rows(db, """
+            SELECT p.*, c.first_name, c.last_name
+            FROM Pet p JOIN Customer c ON p.customer_id = c.customer_id
+            ORDER BY p.pet_name
+        """)),
+        ("Pet", "PetRecord", lambda: Pet.get_all(db)),
+    ]
+
+    print(f"Backend: {db.backend.name}, rows per table: {args.rows}")
+    print(f"{'Table':<10} {'Row type':<16} {'Rows':>8} {'Bytes/row':>10} {'Peak/row':>10} {'Fetch':>9}")
+    results = {}
+    for table, label, fetch in cases:
+        rows, retained, peak, elapsed = _measure(fetch)
+        results[(table, label)] = retained / rows
+        print(f"{table:<10} {label:<16} {rows:>8} {retained / rows:>10.0f} {peak / rows:>10.0f} {elapsed:>8.2f}s")
+
+    for table, record in (("Customer", "CustomerRecord"), ("Pet", "PetRecord")):
+        saved = 1 - results[(table, record)] / results[(table, "dict rows")]
+        print(f"{table}: {record} holds {saved:.0%} less memory than dict rows")
+    return True
+
+def bulk_insert(db, args):
+    customers = [{'first_name': "Franchise", 'last_name': "Owner", 'phone': "555-123-4567",
+                  'email': f"owner{i}@example.com"} for i in range(args.rows)]
+
+    started = time.perf_counter()
+    for customer in customers:
+        Customer.create(db, customer)
+    per_row = time.perf_counter() - started
+
+    started = time.perf_counter()
+    customer_ids = Customer.create_many(db, customers)
+    batched = time.perf_counter() - started
+
+    print(f"Backend: {db.backend.name}, customers: {args.rows}")
+    print(f"create() per row: {per_row:.2f}s ({args.rows / per_row:,.0f} rows/s)")
+    print(f"create_many():    {batched:.2f}s ({args.rows / batched:,.0f} rows/s), {per_row / batched:.0f}x faster")
+    return len(customer_ids) == args.rows
+
+# the revenue report's queries before the daily_stats rollup, kept as the
+# baseline: each one re-joins Boarding for the same period
+LEGACY_REVENUE_QUERIES = [
+    """
+    SELECT DATE(b.check_in), COUNT(*), SUM(b.amount_due),
+           SUM(CASE WHEN p.pet_type = 'dog' THEN b.amount_due ELSE 0 END),
+           SUM(CASE WHEN p.pet_type = 'cat' THEN b.amount_due ELSE 0 END),
+           SUM(CASE WHEN b.grooming_requested = 1 AND p.pet_type = 'dog' THEN 1 ELSE 0 END),
+           SUM(CASE WHEN g.price IS NOT NULL THEN g.price ELSE 0 END)
+    FROM Boarding b
+    JOIN Pet p ON b.pet_id = p.pet_id
+    LEFT JOIN Grooming g ON b.boarding_id = g.boarding_id
+    WHERE b.check_in BETWEEN %s AND %s
+    GROUP BY DATE(b.check_in)
+    """,
+    """
+    SELECT p.pet_type, COUNT(*), SUM(b.amount_due), AVG(b.amount_due)
+    FROM Boarding b
+    JOIN Pet p ON b.pet_id = p.pet_id
+    WHERE b.check_in BETWEEN %s AND %s
+    GROUP BY p.pet_type
+    """,
+    """
+    SELECT COUNT(*), SUM(g.price), AVG(g.price)
+    FROM Grooming g
+    JOIN Boarding b ON g.boarding_id = b.boarding_id
+    WHERE b.check_in BETWEEN %s AND %s
+    """,
+    "SELECT SUM(b.amount_due), COUNT(*) FROM Boarding b WHERE b.check_out IS NULL",
+]
+
+def _legacy_revenue_scan(db, period_days):
+    end_date = date.today()
+    start_date = end_date - timedelta(days=period_days)
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        for sql in LEGACY_REVENUE_QUERIES:
+            cursor.execute(sql, (start_date, end_date) if "%s" in sql else ())
+            cursor.fetchall()
+        cursor.close()
+
+def _median_seconds(call, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)[len(timings) // 2]
+
+def report_latency(db, args):
+    from services.report_service import ReportService
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    periods = (30, 365)
+    print(f"Backend: {db.backend.name}, median of {args.repeat} runs per report")
+    print(f"{'Boardings':>10} {'Period':>7} {'Revenue':>10} {'Occupancy':>10} {'Cache hit':>10} "
+          f"{'Old 4 scans':>12} {'Backfill':>9}")
+
+    seeded = 0
+    for size in sizes:
+        # grow the same history; only the first batch leaves stays open
+        seed_large_dataset(db, boardings=size - seeded, seed=args.seed + seeded,
+                           open_dogs=25 if not seeded else 0, open_cats=10 if not seeded else 0)
+        seeded = size
+        backfill = _median_seconds(lambda: DailyStats.rebuild(db), 1)
+
+        for period_days in periods:
+            revenue = _median_seconds(lambda: ReportService.get_revenue_report(db, period_days, cached=False),
+                                      args.repeat)
+            occupancy = _median_seconds(lambda: ReportService.get_occupancy_report(db, period_days, cached=False),
+                                        args.repeat)
+            ReportService.build_revenue_report(db, period_days)  # fill the cache
+            cache_hit = _median_seconds(lambda: ReportService.get_revenue_report(db, period_days), args.repeat)
+            legacy = _median_seconds(lambda: _legacy_revenue_scan(db, period_days), max(1, args.repeat // 2))
+            print(f"{size:>10,} {period_days:>6}d {revenue * 1000:>8.1f}ms {occupancy * 1000:>8.1f}ms "
+                  f"{cache_hit * 1000:>8.1f}ms {legacy * 1000:>10.1f}ms {backfill:>8.2f}s", flush=True)
+    return True
+
+# the obvious way to get nightly occupancy: count the stays covering each night
+NIGHT_COUNT_QUERY = """
+    SELECT p.pet_type, COUNT(*)
+    FROM Boarding b
+    JOIN Pet p ON p.pet_id = b.pet_id
+    WHERE b.check_in <= %s AND (b.check_out > %s OR b.check_out IS NULL)
+    GROUP BY p.pet_type
+"""
+
+def _count_per_night(db, start_date, end_date):
+    nights = []
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        night = start_date
+        while night <= end_date:
+            cursor.execute(NIGHT_COUNT_QUERY, (night, night))
+            nights.append(dict(cursor.fetchall()))
+            night += timedelta(days=1)
+        cursor.close()
+    return nights
+
+def nightly_occupancy(db, args):
+    from services import occupancy_timeline
+    from services.occupancy_timeline import OccupancyTimeline
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    end_date = date.today()
+    start_date = end_date - timedelta(days=365)
+    sweep = "NumPy cumsum" if occupancy_timeline.numpy is not None else "Python sweep"
+    print(f"Backend: {db.backend.name}, 366 nights, {sweep}, median of {args.repeat} runs")
+    print(f"{'Boardings':>10} {'Stays read':>11} {'Sweep line':>11} {'Per night':>11}")
+
+    seeded = 0
+    for size in sizes:
+        seed_large_dataset(db, boardings=size - seeded, seed=args.seed + seeded,
+                           open_dogs=25 if not seeded else 0, open_cats=10 if not seeded else 0)
+        seeded = size
+        stays = OccupancyTimeline.load_stays(db, start_date, end_date)
+        timeline = _median_seconds(lambda: OccupancyTimeline.nightly(db, start_date, end_date), args.repeat)
+        per_night = _median_seconds(lambda: _count_per_night(db, start_date, end_date), max(1, args.repeat // 2))
+        print(f"{size:>10,} {sum(len(starts) for starts, _ in stays.values()):>11,} "
+              f"{timeline * 1000:>9.1f}ms {per_night * 1000:>9.1f}ms", flush=True)
+    return True
+
+COMMANDS = {
+    "checkin-stress": checkin_stress,
+    "row-memory": row_memory,
+    "bulk-insert": bulk_insert,
+    "report-latency": report_latency,
+    "nightly-occupancy": nightly_occupancy,
+}
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Pet BAG stress tests and benchmarks")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("--database", default="pet_bag_bench", help="scratch database name (mysql backend)")
+    parser.add_argument("--checkins", type=int, default=400, help="number of simultaneous check-ins")
+    parser.add_argument("--threads", type=int, default=16, help="worker threads (and pool size)")
+    parser.add_argument("--rows", type=int, default=100000, help="rows per table for row-memory and bulk-insert")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="boarding counts for report-latency and nightly-occupancy")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per report for report-latency")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv[1:])
+
+    db, cleanup = open_scratch_database(args, args.threads + 1)
+    if db is None:
+        cleanup()
+        return 1
+
+    try:
+        return 0 if COMMANDS[args.command](db, args) else 1
+    finally:
+        db.disconnect()
+        cleanup()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
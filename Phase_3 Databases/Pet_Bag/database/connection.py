@@ -1,31 +1,467 @@
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Establish connection with pet_bag_db
-# 2026-02-07: Updated to use configuration file
-
-import mysql.connector
-from mysql.connector import Error
-from config import config
-
-class DatabaseConnection:
-    def __init__(self):
-        self.connection = None
-    
-    def connect(self, database=None):
-        try:
-            self.connection = mysql.connector.connect(
-                host=config.DB_HOST,
-                user=config.DB_USER,
-                password=config.DB_PASSWORD,
-                database=database or config.DB_NAME
-            )
-            print(f"Connected to database '{database or config.DB_NAME}'")
-            return True
-        except Error as e:
-            print(f"Connection error: {e}")
-            return False
-    
-    def disconnect(self):
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Establish connection with pet_bag_db
+# 2026-02-07: Updated to use configuration file
+# 2026-10-18: Added pooled mode with health-checked checkouts and pool statistics
+# 2026-10-18: Connections are opened through a pluggable backend (MySQL or SQLite)
+# 2026-10-18: Added transaction() unit-of-work scope with nested savepoints
+# 2026-10-18: Cursors are instrumented: per-statement timing, rows and caller,
+#             plus a slow-query log
+# 2026-10-18: The unpooled connection also rolls back when its with-block raises
+
+import re
+import sys
+import json
+import time
+import queue
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from config import config
+from database.backends import get_backend
+
+class PoolTimeoutError(Exception):
+    # raised when no pooled connection becomes free within the checkout timeout
+    pass
+
+class ConnectionPool:
+    def __init__(self, factory, size, timeout):
+        self.factory = factory  # callable that opens a new raw connection
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._stats = {
+            'checkouts': 0,
+            'returns': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'created': 0,
+            'reconnects': 0
+        }
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _open(self):
+        connection = self.factory()
+        self._count('created')
+        return connection
+
+    def _is_healthy(self, connection):
+        # ping the server so a connection dropped by wait_timeout is never handed out
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        connection = None
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._created < self.size
+                if can_open:
+                    self._created += 1
+
+            if can_open:
+                try:
+                    return self._checkout(self._open())
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+
+            # every connection is busy, wait for one to be returned
+            self._count('waits')
+            try:
+                connection = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                self._count('timeouts')
+                raise PoolTimeoutError(
+                    f"No database connection available after {self.timeout} seconds"
+                ) from None
+
+        if not self._is_healthy(connection):
+            self._discard(connection)
+            with self._lock:
+                self._created += 1
+            try:
+                connection = self._open()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._count('reconnects')
+
+        return self._checkout(connection)
+
+    def _checkout(self, connection):
+        self._count('checkouts')
+        return connection
+
+    def release(self, connection):
+        # end any transaction left open (including read snapshots) before reuse
+        try:
+            if getattr(connection, 'in_transaction', False):
+                connection.rollback()
+        except Exception:
+            self._discard(connection)
+            return
+
+        self._count('returns')
+        self._idle.put(connection)
+
+    def _discard(self, connection):
+        with self._lock:
+            self._created -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['open'] = self._created
+        stats['idle'] = self._idle.qsize()
+        stats['in_use'] = stats['open'] - stats['idle']
+        return stats
+
+    def close_all(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql):
+    # one shape per statement: literals and placeholders become ?, IN lists
+    # collapse to IN (?...) and whitespace is normalized
+    sql = re.sub(r"'(?:[^'\\]|\\.)*'", "?", sql)
+    sql = re.sub(r"%s|\b\d+(?:\.\d+)?\b", "?", sql)
+    sql = re.sub(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", "IN (?...)", sql, flags=re.I)
+    return " ".join(sql.split())
+
+# frames from these modules are plumbing, not the code that issued the query
+_PLUMBING_MODULES = {__name__, 'database.backends', 'database.verify_indexes', 'contextlib'}
+
+def _calling_method():
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module not in _PLUMBING_MODULES:
+            code = frame.f_code
+            return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+        frame = frame.f_back
+    return "unknown"
+
+class QueryMetrics:
+    # in-process registry: fingerprint -> calls, total/max time, rows, callers
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.slow_log = logging.getLogger("petbag.slow_query")
+        self._log_ready = False
+
+    def record(self, sql_fingerprint, elapsed_ms, rows, caller, executions=1):
+        with self._lock:
+            entry = self._stats.get(sql_fingerprint)
+            if entry is None:
+                entry = self._stats[sql_fingerprint] = {
+                    'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'callers': Counter()
+                }
+            entry['calls'] += executions
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['rows'] += max(rows, 0)
+            entry['callers'][caller] += executions
+
+    def log_slow(self, sql_fingerprint, elapsed_ms, rows, caller):
+        if not self._log_ready:
+            self._setup_log()
+        self.slow_log.warning("%.1f ms rows=%d caller=%s sql=%s", elapsed_ms, rows, caller, sql_fingerprint)
+
+    def _setup_log(self):
+        with self._lock:
+            if not self._log_ready:
+                if not self.slow_log.handlers:
+                    handler = logging.FileHandler(config.LOG_FILE)
+                    handler.setFormatter(logging.Formatter("%(asctime)s SLOW QUERY %(message)s"))
+                    self.slow_log.addHandler(handler)
+                    self.slow_log.setLevel(config.LOG_LEVEL)
+                    self.slow_log.propagate = False
+                self._log_ready = True
+
+    def snapshot(self):
+        with self._lock:
+            return {sql: dict(entry, callers=dict(entry['callers'])) for sql, entry in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=1)
+
+    @staticmethod
+    def format_top(stats, top_n=10):
+        rows = sorted(stats.items(), key=lambda item: item[1]['total_ms'], reverse=True)[:top_n]
+        lines = [f"{'total ms':>10} {'calls':>7} {'avg ms':>8} {'max ms':>8} {'rows':>8}  statement / top caller"]
+        for sql, entry in rows:
+            avg = entry['total_ms'] / entry['calls'] if entry['calls'] else 0
+            caller = max(entry['callers'].items(), key=lambda item: item[1])[0] if entry['callers'] else ""
+            lines.append(f"{entry['total_ms']:>10.1f} {entry['calls']:>7} {avg:>8.2f} {entry['max_ms']:>8.1f} "
+                         f"{entry['rows']:>8}  {sql[:100]}")
+            lines.append(f"{'':>46}  <- {caller}")
+        return "\n".join(lines)
+
+    def top(self, top_n=10):
+        return self.format_top(self.snapshot(), top_n)
+
+query_metrics = QueryMetrics()
+
+class InstrumentedCursor:
+    # times execute plus the fetches that follow it, so an unbuffered
+    # cursor's row transfer counts toward the statement that caused it
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._current = None  # [fingerprint, elapsed_ms, rows, caller, executions]
+
+    def _start(self, sql, executions):
+        self._finish()
+        self._current = [fingerprint(sql), 0.0, 0, _calling_method(), executions]
+
+    def _add(self, started, rows=0):
+        if self._current is not None:
+            self._current[1] += (time.perf_counter() - started) * 1000
+            self._current[2] += rows
+
+    def _finish(self):
+        current, self._current = self._current, None
+        if current is None:
+            return
+        sql, elapsed_ms, rows, caller, executions = current
+        query_metrics.record(sql, elapsed_ms, rows, caller, executions)
+        if elapsed_ms >= config.SLOW_QUERY_MS:
+            query_metrics.log_slow(sql, elapsed_ms, rows, caller)
+
+    def execute(self, sql, params=()):
+        self._start(sql, 1)
+        started = time.perf_counter()
+        result = self._cursor.execute(sql, params)
+        # writes report affected rows; SELECT rows are counted as they are fetched
+        self._add(started, 0 if self._cursor.description else max(self._cursor.rowcount, 0))
+        return result
+
+    def executemany(self, sql, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        self._start(sql, max(len(seq_of_params), 1))
+        started = time.perf_counter()
+        result = self._cursor.executemany(sql, seq_of_params)
+        self._add(started, max(self._cursor.rowcount, 0))
+        return result
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._add(started, 1 if row is not None else 0)
+        return row
+
+    def fetchmany(self, size=1):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._add(started, len(rows))
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._add(started, len(rows))
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        self._finish()
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+class InstrumentedConnection:
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+class DatabaseConnection:
+    def __init__(self, pooled=None, backend=None):
+        self.connection = None
+        self.pool = None
+        self.pooled = config.DB_POOL_ENABLED if pooled is None else pooled
+        self.backend = backend or get_backend()
+        self.database = None
+        self._local = threading.local()
+
+    def _open_connection(self, database):
+        return self.backend.connect(database)
+
+    def _instrument(self, connection):
+        if config.QUERY_METRICS_ENABLED:
+            return InstrumentedConnection(connection)
+        return connection
+
+    def connect(self, database=None):
+        database = database or config.DB_NAME
+        self.database = database
+        try:
+            if self.pooled:
+                # an in-memory SQLite database only supports one connection
+                pool_size = 1 if self.backend.single_connection else config.DB_POOL_SIZE
+                self.pool = ConnectionPool(
+                    lambda: self._open_connection(database),
+                    pool_size,
+                    config.DB_POOL_TIMEOUT
+                )
+                # open the first connection now so bad credentials fail at startup
+                self.pool.release(self.pool.acquire())
+                print(f"Connected to {self.backend.name} database '{database}' (pool size {pool_size})")
+            else:
+                self.connection = self._instrument(self._open_connection(database))
+                print(f"Connected to {self.backend.name} database '{database}'")
+            return True
+        except self.backend.Error as e:
+            print(f"Connection error: {e}")
+            return False
+
+    # borrow a connection for the duration of a with-block; nested borrows on
+    # the same thread reuse the connection that is already checked out
+    @contextmanager
+    def get_connection(self):
+        if not self.pool:
+            # same rollback as a pooled checkout, once the outermost borrow exits
+            depth = getattr(self._local, 'plain_depth', 0)
+            self._local.plain_depth = depth + 1
+            try:
+                yield self.connection
+            except Exception:
+                if depth == 0:
+                    try:
+                        self.connection.rollback()
+                    except Exception:
+                        pass
+                raise
+            finally:
+                self._local.plain_depth = depth
+            return
+
+        held = getattr(self._local, 'connection', None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        connection = self.pool.acquire()
+        self._local.connection = self._instrument(connection)
+        self._local.depth = 1
+        try:
+            yield self._local.connection
+        except Exception:
+            try:
+                connection.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            self._local.connection = None
+            self._local.depth = 0
+            self.pool.release(connection)
+
+    # unit of work: every write inside the with-block commits once at the end.
+    # a nested scope becomes a savepoint, so a failing inner step can be
+    # rolled back without losing the outer work. an exception rolls back
+    # the innermost scope and propagates
+    @contextmanager
+    def transaction(self):
+        with self.get_connection() as conn:
+            depth = getattr(self._local, 'tx_depth', 0)
+            if depth == 0:
+                # start explicitly so a savepoint cannot open (and commit) its own transaction
+                if not conn.in_transaction:
+                    conn.start_transaction()
+                self._local.tx_depth = 1
+                try:
+                    yield conn
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    self._local.tx_depth = 0
+                return
+
+            savepoint = f"sp_{depth}"
+            cursor = conn.cursor()
+            cursor.execute(f"SAVEPOINT {savepoint}")
+            self._local.tx_depth = depth + 1
+            try:
+                yield conn
+            except Exception:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+                raise
+            else:
+                cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+            finally:
+                self._local.tx_depth = depth
+                cursor.close()
+
+    def in_transaction(self):
+        # True while a transaction() scope is open on this thread
+        return getattr(self._local, 'tx_depth', 0) > 0
+
+    # models and services call these instead of conn.commit()/rollback() so
+    # that inside a transaction() scope the scope decides when to commit
+    def commit(self, conn):
+        if not self.in_transaction():
+            conn.commit()
+
+    def rollback(self, conn):
+        # inside a scope this is a no-op: callers only roll back before
+        # writing anything, and a step that fails after writing raises
+        # so the enclosing scope or savepoint undoes it
+        if not self.in_transaction():
+            conn.rollback()
+
+    def pool_stats(self):
+        if not self.pool:
+            return None
+        return self.pool.stats()
+
+    def disconnect(self):
+        if self.pool:
+            self.pool.close_all()
+            self.pool = None
+            print("Database connection pool closed")
+        if self.connection and self.connection.is_connected():
+            self.connection.close()
             print("Database connection closed")
\ No newline at end of file
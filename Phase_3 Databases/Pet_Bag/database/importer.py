@@ -0,0 +1,403 @@
+# database/importer.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Streaming CSV import of customers, pets and historical boardings
+# 2026-10-18: Added for loading franchise exports too large to key in or hold in memory
+# 2026-10-18: Stays longer than BoardingService.MAX_STAY_DAYS are rejected
+#
+# usage:
+#   python -m database.importer customers owners.csv
+#   python -m database.importer pets pets.csv --chunk-size 2000
+#   python -m database.importer boardings history.csv --resume
+#
+# columns (header row required, extra columns ignored):
+#   customers  first_name, last_name, phone, email
+#   pets       customer_id or owner_first_name + owner_last_name,
+#              pet_name, pet_type, pet_age, breed, weight
+#   boardings  pet_id or pet_name + owner_first_name + owner_last_name,
+#              check_in, check_out (YYYY-MM-DD), optional days_stay,
+#              grooming_requested (yes/no) and amount_due
+#
+# the file flows through generators - read -> validate -> resolve owner/pet ->
+# chunk -> insert - so only one chunk and a bounded lookup cache are in memory
+# however long the file is. rows that fail a check go to the reject file
+# (<file>.rejects.csv: the original columns plus row and error) and the import
+# carries on. each chunk commits in its own transaction and is followed by a
+# checkpoint (<file>.checkpoint.json) holding the rows consumed and the reject
+# file length, so --resume restarts right after the last committed chunk; the
+# checkpoint is removed once the whole file is in
+
+import os
+import csv
+import sys
+import json
+import time
+import argparse
+from collections import OrderedDict
+from datetime import date
+from database.connection import DatabaseConnection
+from models.customer import Customer
+from models.pet import Pet
+from services.boarding_service import BoardingService
+from validation import (validate_customer, validate_name, validate_pet_name, validate_pet_type,
+                        validate_breed, validate_age, validate_weight)
+
+DEFAULT_CHUNK_SIZE = 1000
+PROGRESS_SECONDS = 1.0
+LOOKUP_CACHE_SIZE = 10000
+TRUE_VALUES = ("1", "y", "yes", "true", "t")
+
+class Rejected(Exception):
+    # a pipeline step refusing one row; the message goes to the reject file
+    pass
+
+class Progress:
+    def __init__(self, offset=0, inserted=0, rejected=0):
+        self.offset = offset  # rows skipped on resume
+        self.read = offset
+        self.inserted = inserted
+        self.rejected = rejected
+        self.started = time.perf_counter()
+        self._reported = self.started
+
+    def rate(self):
+        elapsed = time.perf_counter() - self.started
+        return (self.read - self.offset) / elapsed if elapsed > 0 else 0.0
+
+    def report(self, force=False):
+        now = time.perf_counter()
+        if not force and now - self._reported < PROGRESS_SECONDS:
+            return
+        self._reported = now
+        print(f"{self.read:,} rows read, {self.inserted:,} inserted, {self.rejected:,} rejected "
+              f"({self.rate():,.0f} rows/s)", flush=True)
+
+class RejectFile:
+    # the reject CSV, opened on the first rejected row
+    def __init__(self, path, progress, keep_bytes=0):
+        self.path = path
+        self.progress = progress
+        self.keep_bytes = keep_bytes  # on resume: what the checkpoint saw written
+        self._file = None
+        self._writer = None
+
+    def write(self, number, row, error):
+        if self._writer is None:
+            self._open(list(row.keys()))
+        self._writer.writerow(dict(row, row=number, error=error))
+        self.progress.rejected += 1
+
+    def _open(self, columns):
+        exists = self.keep_bytes > 0 and os.path.exists(self.path)
+        self._file = open(self.path, "r+" if exists else "w", newline="", encoding="utf-8")
+        if exists:
+            # drop rows rejected after the last checkpoint; they are read again
+            self._file.truncate(self.keep_bytes)
+            self._file.seek(self.keep_bytes)
+        self._writer = csv.DictWriter(self._file, fieldnames=columns + ["row", "error"], extrasaction="ignore")
+        if not exists:
+            self._writer.writeheader()
+
+    def size(self):
+        if self._file is None:
+            return self.keep_bytes
+        self._file.flush()
+        return self._file.tell()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+# ---- pipeline stages ----
+
+def read_rows(path, progress):
+    # yields (row number, row) after the first progress.offset data rows
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for number, row in enumerate(csv.DictReader(f), start=1):
+            progress.read = number
+            if number <= progress.offset:
+                continue
+            yield number, {key: (value or "").strip() for key, value in row.items() if key is not None}
+
+def stage(items, step, rejects):
+    # apply step to each row's value; a Rejected row goes to the reject file
+    for item in items:
+        number, row = item[0], item[1]
+        value = item[2] if len(item) > 2 else row
+        try:
+            yield number, row, step(value)
+        except Rejected as e:
+            rejects.write(number, row, str(e))
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# ---- row parsing ----
+
+def _check(*checks):
+    for is_valid, error in checks:
+        if not is_valid:
+            raise Rejected(error)
+
+def _int(value, label):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise Rejected(f"{label} must be a whole number") from None
+
+def _date(value, label):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise Rejected(f"{label} must be a date as YYYY-MM-DD") from None
+
+def _owner_name(row):
+    first_name, last_name = row.get('owner_first_name', ''), row.get('owner_last_name', '')
+    _check(validate_name(first_name, "Owner first name"), validate_name(last_name, "Owner last name"))
+    return first_name, last_name
+
+def parse_customer(row):
+    customer = {field: row.get(field, '') for field in ('first_name', 'last_name', 'phone', 'email')}
+    _check(validate_customer(customer))
+    return customer
+
+def parse_pet(row):
+    pet_type = row.get('pet_type', '')
+    _check(validate_pet_type(pet_type),
+           validate_pet_name(row.get('pet_name')),
+           validate_breed(row.get('breed')),
+           validate_age(row.get('pet_age')),
+           validate_weight(row.get('weight', ''), pet_type))
+    pet = {
+        'customer_id': _int(row['customer_id'], "customer_id") if row.get('customer_id') else None,
+        'pet_name': row['pet_name'],
+        'pet_type': pet_type.lower(),
+        'pet_age': int(row['pet_age']),
+        'breed': row['breed'],
+        'weight': float(row['weight'])
+    }
+    if pet['customer_id'] is None:
+        pet['owner'] = _owner_name(row)
+    return pet
+
+def parse_boarding(row):
+    check_in = _date(row.get('check_in'), "check_in")
+    if not row.get('check_out'):
+        raise Rejected("check_out is required: open stays must be checked in from the app")
+    check_out = _date(row['check_out'], "check_out")
+    if check_out < check_in:
+        raise Rejected("check_out is before check_in")
+    if (check_out - check_in).days > BoardingService.MAX_STAY_DAYS:
+        raise Rejected(f"stays longer than {BoardingService.MAX_STAY_DAYS} days are not accepted")
+    days_stay = _int(row['days_stay'], "days_stay") if row.get('days_stay') else max((check_out - check_in).days, 1)
+    if days_stay <= 0:
+        raise Rejected("days_stay must be at least 1")
+    if days_stay > BoardingService.MAX_STAY_DAYS:
+        raise Rejected(f"days_stay cannot be more than {BoardingService.MAX_STAY_DAYS}")
+    amount_due = None
+    if row.get('amount_due'):
+        try:
+            amount_due = float(row['amount_due'])
+        except ValueError:
+            raise Rejected("amount_due must be a number") from None
+        if amount_due < 0:
+            raise Rejected("amount_due cannot be negative")
+    stay = {
+        'pet_id': _int(row['pet_id'], "pet_id") if row.get('pet_id') else None,
+        'check_in': check_in,
+        'check_out': check_out,
+        'days_stay': days_stay,
+        'grooming_requested': row.get('grooming_requested', '').lower() in TRUE_VALUES,
+        'amount_due': amount_due
+    }
+    if stay['pet_id'] is None:
+        _check(validate_pet_name(row.get('pet_name')))
+        stay['pet'] = (row['pet_name'],) + _owner_name(row)
+    return stay
+
+# ---- owner and pet resolution ----
+
+class Resolver:
+    # turns owner names into customer ids and pet references into the pet's
+    # id, type and weight; answers are memoized in a bounded LRU because
+    # exports tend to list the same owner many times in a row
+    def __init__(self, db, maxsize=LOOKUP_CACHE_SIZE):
+        self.db = db
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def _lookup(self, key, sql, params):
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            cursor.close()
+        self._cache[key] = rows
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return rows
+
+    def pet_owner(self, pet):
+        if pet['customer_id'] is None:
+            first_name, last_name = pet.pop('owner')
+            rows = self._lookup(('owner', first_name.lower(), last_name.lower()), """
+                SELECT customer_id FROM Customer
+                WHERE last_name = %s AND first_name = %s
+                ORDER BY customer_id
+                LIMIT 2
+            """, (last_name, first_name))
+            if not rows:
+                raise Rejected(f"no customer named {first_name} {last_name}")
+            if len(rows) > 1:
+                raise Rejected(f"several customers are named {first_name} {last_name}; give customer_id")
+            pet['customer_id'] = rows[0][0]
+        return pet
+
+    def boarding_pet(self, stay):
+        if stay['pet_id'] is None:
+            pet_name, first_name, last_name = stay.pop('pet')
+            rows = self._lookup(('pet', pet_name.lower(), first_name.lower(), last_name.lower()), """
+                SELECT p.pet_id, p.pet_type, p.weight
+                FROM Customer c
+                JOIN Pet p ON p.customer_id = c.customer_id
+                WHERE c.last_name = %s AND c.first_name = %s AND p.pet_name = %s
+                ORDER BY p.pet_id
+                LIMIT 2
+            """, (last_name, first_name, pet_name))
+            if not rows:
+                raise Rejected(f"no pet {pet_name} owned by {first_name} {last_name}")
+            if len(rows) > 1:
+                raise Rejected(f"{first_name} {last_name} has several pets named {pet_name}; give pet_id")
+        else:
+            rows = self._lookup(('pet_id', stay['pet_id']),
+                                "SELECT pet_id, pet_type, weight FROM Pet WHERE pet_id = %s", (stay['pet_id'],))
+            if not rows:
+                raise Rejected(f"no pet with id {stay['pet_id']}")
+        stay['pet_id'], stay['pet_type'], weight = rows[0]
+        stay['weight'] = float(weight or 0)
+        return stay
+
+def customer_rows(db, rows, rejects):
+    return stage(rows, parse_customer, rejects)
+
+def pet_rows(db, rows, rejects):
+    return stage(stage(rows, parse_pet, rejects), Resolver(db).pet_owner, rejects)
+
+def boarding_rows(db, rows, rejects):
+    return stage(stage(rows, parse_boarding, rejects), Resolver(db).boarding_pet, rejects)
+
+# kind -> (pipeline after reading, batch insert returning new ids)
+IMPORTS = {
+    "customers": (customer_rows, Customer.create_many),
+    "pets": (pet_rows, Pet.create_many),
+    "boardings": (boarding_rows, BoardingService.record_history),
+}
+
+# ---- driver ----
+
+def insert_chunk(db, insert, chunk, rejects):
+    # the whole chunk in one transaction; if the database refuses it (a
+    # missing customer_id, a duplicate key) retry row by row so only the
+    # offending rows are rejected. anything else - a lost connection - stops
+    # the import and the checkpoint decides where --resume starts
+    try:
+        return len(insert(db, [value for _, _, value in chunk]))
+    except (ValueError, db.backend.IntegrityError):
+        inserted = 0
+        for number, row, value in chunk:
+            try:
+                insert(db, [value])
+                inserted += 1
+            except (ValueError, db.backend.IntegrityError) as e:
+                rejects.write(number, row, str(e))
+        return inserted
+
+def load_checkpoint(path, kind):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('kind') != kind:
+        raise ValueError(f"{path} is a checkpoint for a {checkpoint.get('kind')} import, not {kind}")
+    return checkpoint
+
+def save_checkpoint(path, kind, progress, rejects_size):
+    # written aside and renamed so a crash never leaves half a checkpoint
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({'kind': kind, 'offset': progress.read, 'inserted': progress.inserted,
+                   'rejected': progress.rejected, 'rejects_size': rejects_size}, f)
+    os.replace(temp_path, path)
+
+def run_import(db, kind, path, chunk_size=DEFAULT_CHUNK_SIZE, rejects_path=None, resume=False, offset=None):
+    pipeline, insert = IMPORTS[kind]
+    rejects_path = rejects_path or path + ".rejects.csv"
+    checkpoint_path = path + ".checkpoint.json"
+
+    checkpoint = load_checkpoint(checkpoint_path, kind) if resume else None
+    if checkpoint:
+        progress = Progress(checkpoint['offset'], checkpoint['inserted'], checkpoint['rejected'])
+        keep_bytes = checkpoint['rejects_size']
+        print(f"Resuming {kind} import after row {progress.offset:,}")
+    else:
+        progress = Progress(offset or 0)
+        keep_bytes = 0
+    rejects = RejectFile(rejects_path, progress, keep_bytes)
+
+    try:
+        for chunk in chunked(pipeline(db, read_rows(path, progress), rejects), chunk_size):
+            progress.inserted += insert_chunk(db, insert, chunk, rejects)
+            save_checkpoint(checkpoint_path, kind, progress, rejects.size())
+            progress.report()
+    finally:
+        rejects.close()
+
+    # rows rejected after the last chunk are in the reject file; done
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    progress.report(force=True)
+    if progress.rejected:
+        print(f"Rejected rows written to {rejects_path}")
+    return progress
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Import customers, pets or historical boardings from CSV")
+    parser.add_argument("kind", choices=list(IMPORTS))
+    parser.add_argument("path", help="CSV file with a header row")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per transaction")
+    parser.add_argument("--rejects", help="reject file (default <path>.rejects.csv)")
+    parser.add_argument("--resume", action="store_true", help="continue after the last committed chunk")
+    parser.add_argument("--offset", type=int, help="skip this many data rows first")
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.path):
+        print(f"No such file: {args.path}")
+        return 2
+
+    db = DatabaseConnection(pooled=False)
+    if not db.connect():
+        return 1
+
+    try:
+        progress = run_import(db, args.kind, args.path, max(args.chunk_size, 1), args.rejects,
+                              args.resume, args.offset)
+        return 0 if progress.rejected == 0 else 3
+    except Exception as e:
+        print(f"Import stopped: {e}")
+        print("Run again with --resume to continue after the last committed chunk")
+        return 1
+    finally:
+        db.disconnect()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -0,0 +1,85 @@
+# database/maintenance.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Maintenance commands for derived tables
+# 2026-10-18: Added capacity counter reconciliation
+# 2026-10-18: Added batched customer and pet purges with a dry run
+# 2026-10-18: Added the daily_stats rollup backfill
+# 2026-10-18: Exit status reports a failed purge or corrected capacity drift
+#
+# usage:
+#   python -m database.maintenance reconcile-capacity   rebuild the Capacity counters from Boarding
+#   python -m database.maintenance rebuild-daily-stats  recompute the report rollup from history
+#   python -m database.maintenance purge-customer ID [--dry-run]
+#   python -m database.maintenance purge-pet ID [--dry-run]
+#                                                       delete with all history, a batch at a time
+#
+# exit status: 0 done, 1 cannot connect or the command failed (e.g. "Pet not
+# found"), 2 usage, 3 reconcile-capacity found and corrected drift
+
+import sys
+from database.connection import DatabaseConnection
+from models.capacity import Capacity
+from models.daily_stats import DailyStats
+from services.purge_service import PurgeService
+
+# each command returns its exit status
+def reconcile_capacity(db, *args):
+    changes = Capacity.rebuild(db)
+    drifted = False
+    for pet_type, (before, after) in sorted(changes.items()):
+        marker = "" if before == after else "  (corrected)"
+        drifted = drifted or before != after
+        print(f"{pet_type}: {before} -> {after}{marker}")
+    return 3 if drifted else 0
+
+def rebuild_daily_stats(db, *args):
+    rows = DailyStats.rebuild(db)
+    print(f"daily_stats rebuilt: {rows:,} (date, pet type) rows")
+    return 0
+
+def show_purge_progress(table, deleted, total):
+    print(f"  {table}: {deleted:,} of {total:,}", flush=True)
+
+def purge(purge_func, db, args):
+    if not args or not args[0].isdigit():
+        print("usage: python -m database.maintenance purge-customer|purge-pet ID [--dry-run]")
+        return 2
+    success, message = purge_func(db, int(args[0]), progress=show_purge_progress,
+                                  dry_run="--dry-run" in args[1:])
+    print(message)
+    return 0 if success else 1
+
+def purge_customer(db, *args):
+    return purge(PurgeService.purge_customer, db, args)
+
+def purge_pet(db, *args):
+    return purge(PurgeService.purge_pet, db, args)
+
+COMMANDS = {
+    "reconcile-capacity": reconcile_capacity,
+    "rebuild-daily-stats": rebuild_daily_stats,
+    "purge-customer": purge_customer,
+    "purge-pet": purge_pet,
+}
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else ""
+    if command not in COMMANDS:
+        print(f"usage: python -m database.maintenance [{'|'.join(COMMANDS)}]")
+        return 2
+
+    db = DatabaseConnection(pooled=False)
+    if not db.connect():
+        return 1
+
+    try:
+        return COMMANDS[command](db, *argv[2:])
+    except Exception as e:
+        print(f"{command} failed: {e}")
+        return 1
+    finally:
+        db.disconnect()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -0,0 +1,155 @@
+# database/migrate.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Apply or check versioned schema migrations
+# 2026-10-18: Replaced setup_database() on every launch with a schema_version check
+# 2026-10-18: Skip indexes that already exist so a migration that failed part way can be rerun
+# 2026-10-18: Likewise skip dropping an index that is already gone
+#
+# usage:
+#   python -m database.migrate status    show current and latest schema version
+#   python -m database.migrate check     exit with status 1 if migrations are pending
+#   python -m database.migrate upgrade   create the database if needed and apply pending migrations
+
+import re
+import sys
+from config import config
+from database.connection import DatabaseConnection
+from database.backends import get_backend
+from database.migrations import MIGRATIONS, LATEST_VERSION
+
+# CREATE INDEX name ON table (...) or DROP INDEX name ON table
+INDEX_STEP = re.compile(r"^\s*(CREATE|DROP)\s+INDEX\s+(\w+)\s+ON\s+(\w+)", re.I)
+
+SCHEMA_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INT PRIMARY KEY,
+        description VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+def create_database(backend=None):
+    # create the database itself; only needed the first time on a new server
+    backend = backend or get_backend()
+    backend.create_database(config.DB_NAME)
+    print(f"Database '{config.DB_NAME}' is ready")
+
+def get_current_version(db):
+    # one primary-key read; a missing schema_version table means version 0
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
+            row = cursor.fetchone()
+        except Exception:
+            conn.rollback()
+            row = None
+        cursor.close()
+    return row[0] if row else 0
+
+def get_pending_migrations(db):
+    current = get_current_version(db)
+    return [m for m in MIGRATIONS if m[0] > current]
+
+def run_step(db, cursor, step):
+    if callable(step):
+        step(cursor)
+        return
+    # an index built (or dropped) before an earlier attempt failed is already
+    # in place; every table is CREATE TABLE IF NOT EXISTS, so each DDL step
+    # can run twice
+    match = INDEX_STEP.match(step)
+    if match:
+        exists = db.backend.index_exists(cursor, match.group(3), match.group(2))
+        if exists == (match.group(1).upper() == "CREATE"):
+            return
+    cursor.execute(step)
+
+def apply_migrations(db):
+    # apply every pending migration in order and record each one as it completes.
+    # a migration is not atomic: MySQL commits each CREATE TABLE / CREATE INDEX
+    # on its own (and SQLite does for DDL outside a data step's transaction),
+    # so one that fails part way keeps the steps that ran but writes no
+    # schema_version row. the next upgrade runs the whole migration again and
+    # skips what is already in place
+    pending = get_pending_migrations(db)
+    if not pending:
+        return []
+
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(SCHEMA_VERSION_TABLE)
+
+        for version, description, steps in pending:
+            print(f"Applying migration {version}: {description}")
+            for step in steps:
+                run_step(db, cursor, step)
+            cursor.execute(
+                "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                (version, description)
+            )
+            conn.commit()
+
+        cursor.close()
+
+    return [m[0] for m in pending]
+
+def ensure_schema(db):
+    # fast path for every launch: one indexed read when the schema is current
+    if get_current_version(db) >= LATEST_VERSION:
+        return True
+
+    try:
+        apply_migrations(db)
+        return True
+    except Exception as e:
+        print(f"Migration error: {e}")
+        return False
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else "status"
+    if command not in ("status", "check", "upgrade"):
+        print("usage: python -m database.migrate [status|check|upgrade]")
+        return 2
+
+    backend = get_backend()
+    if command == "upgrade":
+        try:
+            create_database(backend)
+        except backend.Error as e:
+            print(f"Setup error: {e}")
+            return 1
+
+    db = DatabaseConnection(pooled=False, backend=backend)
+    if not db.connect():
+        return 1
+
+    try:
+        current = get_current_version(db)
+        pending = get_pending_migrations(db)
+        print(f"Schema version: {current} (latest: {LATEST_VERSION})")
+
+        if command == "status":
+            for version, description, _ in pending:
+                print(f"  pending {version}: {description}")
+            return 0
+
+        if command == "check":
+            if pending:
+                print(f"{len(pending)} migration(s) pending")
+                return 1
+            print("Schema is up to date")
+            return 0
+
+        applied = apply_migrations(db)
+        if applied:
+            print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+        else:
+            print("Schema is up to date")
+        return 0
+    finally:
+        db.disconnect()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
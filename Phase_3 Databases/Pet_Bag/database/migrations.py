@@ -0,0 +1,230 @@
+# database/migrations.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Ordered schema migrations applied by database/migrate.py
+# 2026-10-18: Moved table creation out of setup.py into versioned migrations
+# 2026-10-18: Added migration 5 for keyset-paginated customer and pet lists
+# 2026-10-18: Added migration 6 for the check-in owner lookup
+# 2026-10-18: Added migration 7 for row cache change counters
+# 2026-10-18: Added migration 8 for batched customer and pet purges
+# 2026-10-18: Added migration 9 for the daily_stats report rollup
+# 2026-10-18: Migration 9 backfills with its own SQL instead of calling DailyStats
+# 2026-10-18: Added migration 10 to drop two redundant indexes from migration 3
+
+import hashlib
+
+# each migration is (version, description, steps); a step is either a SQL
+# statement or a function that receives the open cursor. versions must only
+# ever be appended - never edit a migration that has already shipped, and
+# keep each one self-contained: calling into the models would let a later
+# change to them rewrite what an old migration does
+
+def seed_admin_user(cursor):
+    # create an admin user if none exists
+    cursor.execute("SELECT COUNT(*) FROM Users")
+    if cursor.fetchone()[0] == 0:
+        # Default password: admin123 (should be changed on first login)
+        default_password = "admin123"
+        password_hash = hashlib.sha256(default_password.encode()).hexdigest()
+
+        cursor.execute("""
+            INSERT INTO Users (username, password_hash, email, first_name, last_name)
+            VALUES (%s, %s, %s, %s, %s)
+        """, ('admin', password_hash, 'admin@petbag.com', 'Admin', 'User'))
+        print("Created default admin user (username: admin, password: admin123)")
+
+MIGRATIONS = [
+    (1, "Create Customer, Pet, Boarding, Grooming and Users tables", [
+        """
+        CREATE TABLE IF NOT EXISTS Customer (
+            customer_id INT AUTO_INCREMENT PRIMARY KEY,
+            first_name VARCHAR(50) NOT NULL,
+            last_name VARCHAR(50),
+            phone VARCHAR(20),
+            email VARCHAR(100)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS Pet (
+            pet_id INT AUTO_INCREMENT PRIMARY KEY,
+            customer_id INT NOT NULL,
+            pet_name VARCHAR(50) NOT NULL,
+            pet_type VARCHAR(10) NOT NULL,
+            pet_age DECIMAL(4,1),
+            breed VARCHAR(50),
+            weight DECIMAL(5,2) DEFAULT 0,
+            FOREIGN KEY (customer_id) REFERENCES Customer(customer_id)
+            ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS Boarding (
+            boarding_id INT AUTO_INCREMENT PRIMARY KEY,
+            pet_id INT NOT NULL,
+            check_in DATE NOT NULL,
+            check_out DATE,
+            days_stay INT NOT NULL,
+            amount_due DECIMAL(10,2) NOT NULL,
+            grooming_requested BOOLEAN DEFAULT FALSE,
+            FOREIGN KEY (pet_id) REFERENCES Pet(pet_id)
+            ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS Grooming (
+            grooming_id INT AUTO_INCREMENT PRIMARY KEY,
+            boarding_id INT,
+            pet_id INT NOT NULL,
+            service_date DATE NOT NULL,
+            service_type VARCHAR(50),
+            price DECIMAL(10,2),
+            FOREIGN KEY (pet_id) REFERENCES Pet(pet_id)
+            ON DELETE CASCADE,
+            FOREIGN KEY (boarding_id) REFERENCES Boarding(boarding_id)
+            ON DELETE SET NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS Users (
+            user_id INT AUTO_INCREMENT PRIMARY KEY,
+            username VARCHAR(50) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            email VARCHAR(100),
+            first_name VARCHAR(50),
+            last_name VARCHAR(50),
+            is_active BOOLEAN DEFAULT TRUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_login TIMESTAMP NULL,
+            password_changed_at TIMESTAMP NULL
+        )
+        """
+    ]),
+    (2, "Seed default admin user", [
+        seed_admin_user
+    ]),
+    (3, "Secondary indexes for open boardings, check-in ranges, occupancy and login", [
+        # WHERE check_out IS NULL joined to Pet: covers the occupancy count
+        "CREATE INDEX idx_boarding_open ON Boarding (check_out, pet_id)",
+        # WHERE check_in BETWEEN ... for the daily report breakdowns
+        "CREATE INDEX idx_boarding_check_in ON Boarding (check_in, pet_id, days_stay, amount_due)",
+        # lets the per-type occupancy count read pet_type without touching Pet rows
+        "CREATE INDEX idx_pet_type ON Pet (pet_id, pet_type)",
+        # LEFT JOIN Grooming ON boarding_id in checkout and reports, price included
+        "CREATE INDEX idx_grooming_boarding ON Grooming (boarding_id, price)",
+        # login lookup on username AND is_active
+        "CREATE INDEX idx_users_login ON Users (username, is_active)"
+    ]),
+    (4, "Materialized per-pet-type occupancy counters", [
+        """
+        CREATE TABLE IF NOT EXISTS Capacity (
+            pet_type VARCHAR(10) PRIMARY KEY,
+            occupied INT NOT NULL DEFAULT 0
+        )
+        """,
+        "INSERT INTO Capacity (pet_type, occupied) VALUES ('dog', 0), ('cat', 0)",
+        """
+        UPDATE Capacity SET occupied = (
+            SELECT COUNT(*)
+            FROM Boarding b
+            JOIN Pet p ON b.pet_id = p.pet_id
+            WHERE b.check_out IS NULL AND p.pet_type = Capacity.pet_type
+        )
+        """
+    ]),
+    (5, "Keyset pagination indexes for the customer and pet lists", [
+        # a NULL last name would drop out of the (last_name, first_name, id) seek
+        "UPDATE Customer SET last_name = '' WHERE last_name IS NULL",
+        "CREATE INDEX idx_customer_name ON Customer (last_name, first_name, customer_id)",
+        "CREATE INDEX idx_pet_name ON Pet (pet_name, pet_id)"
+    ]),
+    (6, "First-name index for owner lookup at check-in", [
+        # exact and last-name prefix lookups use idx_customer_name; this one
+        # serves first-name prefixes ("ann" -> Anna, Annette)
+        "CREATE INDEX idx_customer_first ON Customer (first_name, last_name)"
+    ]),
+    (7, "Per-table change counters for row cache invalidation across terminals", [
+        """
+        CREATE TABLE IF NOT EXISTS DataVersion (
+            table_name VARCHAR(50) PRIMARY KEY,
+            version INT NOT NULL DEFAULT 0
+        )
+        """,
+        "INSERT INTO DataVersion (table_name, version) VALUES ('Customer', 0), ('Pet', 0)"
+    ]),
+    (8, "Foreign-key indexes for batched customer and pet purges", [
+        # a customer's pets, a pet's finished stays and its grooming rows, read
+        # a batch at a time by PurgeService. MySQL replaces the implicit
+        # foreign key index with these; SQLite had none and scanned the child
+        # tables on every cascade
+        "CREATE INDEX idx_pet_customer ON Pet (customer_id, pet_id)",
+        "CREATE INDEX idx_boarding_pet ON Boarding (pet_id, check_out)",
+        "CREATE INDEX idx_grooming_pet ON Grooming (pet_id, boarding_id)"
+    ]),
+    (9, "daily_stats rollup of boardings and revenue per check-in date and pet type", [
+        """
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            stat_date DATE NOT NULL,
+            pet_type VARCHAR(10) NOT NULL,
+            boardings INT NOT NULL DEFAULT 0,
+            stay_days INT NOT NULL DEFAULT 0,
+            revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+            grooming_requests INT NOT NULL DEFAULT 0,
+            grooming_count INT NOT NULL DEFAULT 0,
+            grooming_revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+            open_boardings INT NOT NULL DEFAULT 0,
+            open_stay_days INT NOT NULL DEFAULT 0,
+            open_revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (stat_date, pet_type)
+        )
+        """,
+        # current stays and pending revenue without reading every day's row
+        "CREATE INDEX idx_daily_stats_open ON daily_stats (open_boardings, open_stay_days, open_revenue)",
+        # backfill from history: one row per check-in date and pet type,
+        # then the grooming booked against those stays
+        """
+        INSERT INTO daily_stats (stat_date, pet_type, boardings, stay_days, revenue, grooming_requests,
+                                 grooming_count, grooming_revenue, open_boardings, open_stay_days, open_revenue)
+        SELECT b.check_in, LOWER(p.pet_type),
+               COUNT(*),
+               SUM(b.days_stay),
+               SUM(b.amount_due),
+               SUM(CASE WHEN b.grooming_requested = 1 THEN 1 ELSE 0 END),
+               0, 0,
+               SUM(CASE WHEN b.check_out IS NULL THEN 1 ELSE 0 END),
+               SUM(CASE WHEN b.check_out IS NULL THEN b.days_stay ELSE 0 END),
+               SUM(CASE WHEN b.check_out IS NULL THEN b.amount_due ELSE 0 END)
+        FROM Boarding b
+        JOIN Pet p ON p.pet_id = b.pet_id
+        GROUP BY b.check_in, LOWER(p.pet_type)
+        """,
+        """
+        UPDATE daily_stats SET
+            grooming_count = (
+                SELECT COUNT(*)
+                FROM Boarding b
+                JOIN Pet p ON p.pet_id = b.pet_id
+                JOIN Grooming g ON g.boarding_id = b.boarding_id
+                WHERE b.check_in = daily_stats.stat_date AND LOWER(p.pet_type) = daily_stats.pet_type
+            ),
+            grooming_revenue = (
+                SELECT COALESCE(SUM(g.price), 0)
+                FROM Boarding b
+                JOIN Pet p ON p.pet_id = b.pet_id
+                JOIN Grooming g ON g.boarding_id = b.boarding_id
+                WHERE b.check_in = daily_stats.stat_date AND LOWER(p.pet_type) = daily_stats.pet_type
+            )
+        """
+    ]),
+    (10, "Drop the redundant Pet type and Users login indexes", [
+        # idx_pet_type led with the primary key, so it only repeated lookups
+        # the key already serves. no query filters Pet on pet_type alone:
+        # per-type counts come from Capacity and daily_stats, and the type is
+        # read after a pet_id join or under idx_pet_customer
+        "DROP INDEX idx_pet_type ON Pet",
+        # the UNIQUE(username) index finds the one row; is_active is then
+        # checked on it
+        "DROP INDEX idx_users_login ON Users"
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
\ No newline at end of file
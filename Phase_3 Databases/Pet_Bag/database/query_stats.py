@@ -0,0 +1,40 @@
+# database/query_stats.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Print the statements that took the most total time in the last app session
+# 2026-10-18: Added with the instrumented cursors in database/connection.py
+#
+# usage:
+#   python -m database.query_stats                 top 10 statements by total time
+#   python -m database.query_stats --top 25 --file other_metrics.json
+#
+# the app saves its in-memory totals to Config.QUERY_METRICS_FILE on exit;
+# individual statements over Config.SLOW_QUERY_MS are in Config.LOG_FILE
+
+import sys
+import json
+import argparse
+from config import config
+from database.connection import QueryMetrics
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Top statements by total time")
+    parser.add_argument("--top", type=int, default=10, help="number of statements to show")
+    parser.add_argument("--file", default=config.QUERY_METRICS_FILE, help="saved metrics file")
+    args = parser.parse_args(argv[1:])
+
+    try:
+        with open(args.file) as f:
+            stats = json.load(f)
+    except FileNotFoundError:
+        print(f"No query metrics found at {args.file}; run the app (with QUERY_METRICS_ENABLED) first")
+        return 1
+
+    total_ms = sum(entry['total_ms'] for entry in stats.values())
+    total_calls = sum(entry['calls'] for entry in stats.values())
+    print(f"{len(stats)} distinct statements, {total_calls} executions, {total_ms:.1f} ms total\n")
+    print(QueryMetrics.format_top(stats, args.top))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
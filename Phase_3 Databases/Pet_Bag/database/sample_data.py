@@ -0,0 +1,104 @@
+# database/sample_data.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Generate a large synthetic dataset for query plan checks and benchmarks
+# 2026-10-18: Added for the EXPLAIN index verification step
+# 2026-10-18: Rebuilds the daily_stats rollup after seeding
+#
+# only ever point this at a scratch database - it inserts rows in bulk
+
+import random
+from datetime import date, timedelta
+from models.capacity import Capacity
+from models.daily_stats import DailyStats
+
+FIRST_NAMES = ["Anna", "Ben", "Carla", "David", "Elena", "Frank", "Grace", "Henry",
+               "Irene", "Jack", "Kara", "Liam", "Maria", "Noah", "Olga", "Peter"]
+LAST_NAMES = ["Smith", "Jones", "Brown", "Miller", "Davis", "Garcia", "Wilson",
+              "Moore", "Taylor", "Clark", "Lewis", "Walker", "Young", "King"]
+PET_NAMES = ["Max", "Bella", "Charlie", "Luna", "Rocky", "Daisy", "Milo", "Coco",
+             "Buddy", "Lucy", "Oscar", "Molly", "Teddy", "Rosie", "Leo", "Nala"]
+BREEDS = {'dog': ["Beagle", "Poodle", "Labrador", "Boxer", "Collie"],
+          'cat': ["Siamese", "Persian", "Bengal", "Sphynx", "Tabby"]}
+
+CHUNK_SIZE = 1000
+
+def _insert_chunked(cursor, sql, rows):
+    for start in range(0, len(rows), CHUNK_SIZE):
+        cursor.executemany(sql, rows[start:start + CHUNK_SIZE])
+
+def seed_large_dataset(db, boardings=100000, history_days=1095, open_dogs=25, open_cats=10, seed=42):
+    # one customer per 4 boardings and one pet per 2 boardings keeps the
+    # ratios close to a real kennel; only a handful of stays are still open
+    rng = random.Random(seed)
+    customers = max(1, boardings // 4)
+    pets = max(1, boardings // 2)
+    today = date.today()
+
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COALESCE(MAX(customer_id), 0) FROM Customer")
+        first_customer = cursor.fetchone()[0] + 1
+        _insert_chunked(cursor, """
+            INSERT INTO Customer (first_name, last_name, phone, email)
+            VALUES (%s, %s, %s, %s)
+        """, [(rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+               f"555{rng.randint(1000000, 9999999)}", f"customer{i}@example.com")
+              for i in range(customers)])
+
+        cursor.execute("SELECT COALESCE(MAX(pet_id), 0) FROM Pet")
+        first_pet = cursor.fetchone()[0] + 1
+        pet_types = ['dog' if rng.random() < 0.7 else 'cat' for _ in range(pets)]
+        _insert_chunked(cursor, """
+            INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, [(first_customer + rng.randrange(customers), rng.choice(PET_NAMES), pet_type,
+               rng.randint(1, 16), rng.choice(BREEDS[pet_type]), round(rng.uniform(3, 120), 1))
+              for pet_type in pet_types])
+
+        # historical stays are all checked out; the last few are still open.
+        # grooming rows assume consecutive boarding ids, which holds for a
+        # single writer bulk-loading a scratch database
+        cursor.execute("SELECT COALESCE(MAX(boarding_id), 0) FROM Boarding")
+        first_boarding = cursor.fetchone()[0] + 1
+        boarding_rows = []
+        grooming_rows = []
+        open_left = {'dog': open_dogs, 'cat': open_cats}
+        for i in range(boardings):
+            pet_index = rng.randrange(pets)
+            pet_type = pet_types[pet_index]
+            days_stay = rng.randint(1, 14)
+            grooming = pet_type == 'dog' and days_stay >= 2 and rng.random() < 0.3
+            amount = (30 if pet_type == 'dog' else 25) * days_stay + (70 if grooming else 0)
+
+            if i >= boardings - (open_dogs + open_cats) * 3 and open_left[pet_type] > 0:
+                open_left[pet_type] -= 1
+                check_in = today - timedelta(days=rng.randint(0, days_stay - 1))
+                check_out = None
+            else:
+                check_in = today - timedelta(days=rng.randint(days_stay, history_days))
+                check_out = check_in + timedelta(days=days_stay)
+
+            boarding_rows.append((first_pet + pet_index, check_in, check_out, days_stay, amount, grooming))
+            if grooming:
+                grooming_rows.append((first_boarding + i, first_pet + pet_index, check_in, "Full Grooming", 70))
+
+        _insert_chunked(cursor, """
+            INSERT INTO Boarding (pet_id, check_in, check_out, days_stay, amount_due, grooming_requested)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, boarding_rows)
+        _insert_chunked(cursor, """
+            INSERT INTO Grooming (boarding_id, pet_id, service_date, service_type, price)
+            VALUES (%s, %s, %s, %s, %s)
+        """, grooming_rows)
+
+        conn.commit()
+        cursor.close()
+
+    # bulk rows bypass the services, so rebuild the derived counters once
+    Capacity.rebuild(db)
+    DailyStats.rebuild(db)
+
+    print(f"Seeded {customers} customers, {pets} pets, {boardings} boardings, {len(grooming_rows)} grooming records")
+    return {'customers': customers, 'pets': pets, 'boardings': boardings, 'grooming': len(grooming_rows)}
\ No newline at end of file
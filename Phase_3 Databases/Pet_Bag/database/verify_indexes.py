@@ -0,0 +1,188 @@
+# database/verify_indexes.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: EXPLAIN every query issued by the hot service methods and fail on full table scans
+# 2026-10-18: Added with the secondary indexes in migration 3
+# 2026-10-18: Check the report cache's change-counter lookup; reports are explained uncached
+# 2026-10-18: Check the nightly occupancy stay read
+#
+# usage:
+#   python -m database.verify_indexes                          check the configured database
+#   python -m database.verify_indexes --database pet_bag_scratch --seed 100000
+#                                                              migrate and seed a scratch database first
+
+import sys
+import argparse
+from datetime import date, timedelta
+from contextlib import contextmanager
+from config import config
+from database.connection import DatabaseConnection
+from database.backends import get_backend, SQLiteBackend
+from database import migrate
+from database.sample_data import seed_large_dataset
+
+class ExplainingCursor:
+    # runs EXPLAIN ahead of every SELECT, then the real statement so the
+    # calling service keeps working with its normal results
+    def __init__(self, cursor, explain_cursor, explain_prefix, plans, label):
+        self._cursor = cursor
+        self._explain_cursor = explain_cursor
+        self._explain_prefix = explain_prefix
+        self._plans = plans
+        self._label = label
+
+    def execute(self, sql, params=()):
+        if sql.lstrip().upper().startswith("SELECT"):
+            self._explain_cursor.execute(self._explain_prefix + sql, params)
+            self._plans.append((self._label, " ".join(sql.split()), self._explain_cursor.fetchall()))
+        return self._cursor.execute(sql, params)
+
+    def close(self):
+        self._explain_cursor.close()
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+class ExplainingConnection:
+    def __init__(self, connection, explain_prefix, plans, label):
+        self._connection = connection
+        self._explain_prefix = explain_prefix
+        self._plans = plans
+        self._label = label
+
+    def cursor(self, dictionary=False):
+        return ExplainingCursor(self._connection.cursor(dictionary=dictionary),
+                                self._connection.cursor(dictionary=True, buffered=True),
+                                self._explain_prefix, self._plans, self._label)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+class ExplainingDatabase:
+    # stands in for DatabaseConnection when handed to models and services
+    def __init__(self, db):
+        self.db = db
+        self.backend = db.backend
+        self.plans = []
+        self.label = ""
+
+    @contextmanager
+    def get_connection(self):
+        with self.db.get_connection() as conn:
+            yield ExplainingConnection(conn, self.backend.explain_prefix, self.plans, self.label)
+
+    def __getattr__(self, name):
+        # commit/rollback/transaction go straight to the real connection
+        return getattr(self.db, name)
+
+def collect_plans(db):
+    from models.pet import Pet
+    from models.customer import Customer
+    from services.boarding_service import BoardingService
+    from services.checkout_service import CheckoutService
+    from services.report_service import ReportService
+    from services.auth_service import AuthService
+    from services.customer_lookup_service import CustomerLookupService
+    from services.purge_service import PurgeService
+    from models.daily_stats import DailyStats
+    from services.report_cache import ReportCache
+    from services.occupancy_timeline import OccupancyTimeline
+
+    explaining = ExplainingDatabase(db)
+
+    checks = [
+        ("Pet.get_occupied_spaces", lambda: Pet.get_occupied_spaces(explaining)),
+        ("Customer.get_page", lambda: Customer.get_page(explaining, ("M", "A", 0))),
+        ("Pet.get_page", lambda: Pet.get_page(explaining, ("M", 0))),
+        ("CustomerLookupService.find_candidates", lambda: CustomerLookupService.find_candidates(explaining, "Anna Smith")),
+        ("CustomerLookupService.find_candidates", lambda: CustomerLookupService.find_candidates(explaining, "Smi")),
+        ("Customer.get_by_id", lambda: Customer.get_by_id(explaining, 1)),
+        ("Customer.get_owner_options", lambda: Customer.get_owner_options(explaining, "Smi")),
+        ("Customer.get_owner_options", lambda: Customer.get_owner_options(explaining, "Anna S")),
+        ("Pet.get_by_id", lambda: Pet.get_by_id(explaining, 1)),
+        ("BoardingService.get_current_boardings", lambda: BoardingService.get_current_boardings(explaining)),
+        ("ReportService.get_occupancy_report", lambda: ReportService.get_occupancy_report(explaining, 30, cached=False)),
+        ("ReportService.get_revenue_report", lambda: ReportService.get_revenue_report(explaining, 30, cached=False)),
+        ("ReportCache.versions", lambda: ReportCache(0, 0).versions(explaining, date.today() - timedelta(days=365),
+                                                                    date.today())),
+        ("OccupancyTimeline.load_stays", lambda: OccupancyTimeline.load_stays(
+            explaining, date.today() - timedelta(days=30), date.today())),
+        ("PurgeService.count_customer", lambda: PurgeService.count_customer(explaining, 1)),
+        ("PurgeService.count_pet", lambda: PurgeService.count_pet(explaining, 1)),
+        # a wrong password never reaches the last_login UPDATE
+        ("AuthService.authenticate_user", lambda: AuthService.authenticate_user(explaining, "admin", "")),
+    ]
+    for label, call in checks:
+        explaining.label = label
+        call()
+
+    # the rollup delta every check-in, check-out and delete computes
+    explaining.label = "DailyStats.aggregate"
+    with explaining.get_connection() as conn:
+        cursor = conn.cursor()
+        DailyStats.aggregate(cursor, "b.pet_id = %s", (1,))
+        DailyStats.aggregate(cursor, "p.customer_id = %s", (1,))
+        cursor.close()
+
+    # invoice lookup for one open boarding exercises the checkout LEFT JOIN
+    boardings = BoardingService.get_current_boardings(db)
+    if boardings:
+        explaining.label = "CheckoutService.generate_invoice"
+        CheckoutService.generate_invoice(explaining, boardings[0]['boarding_id'])
+
+    return explaining.plans
+
+def verify(db):
+    failures = []
+    for label, sql, plan_rows in collect_plans(db):
+        scans = db.backend.find_full_scans(plan_rows)
+        status = "FULL SCAN " + ", ".join(scans) if scans else "ok"
+        print(f"[{status}] {label}: {sql[:90]}")
+        if scans:
+            failures.append((label, sql, scans))
+    return failures
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Fail if a service query falls back to a full table scan")
+    parser.add_argument("--database", default=config.DB_NAME,
+                        help="database to check (the file path, or :memory:, on the sqlite backend)")
+    parser.add_argument("--seed", type=int, default=0, help="insert this many synthetic boardings first")
+    args = parser.parse_args(argv[1:])
+
+    if args.seed and args.database == config.DB_NAME:
+        print("Refusing to seed the live database; pass --database with a scratch database name")
+        return 2
+
+    # every lookup must reach the database to be explained
+    config.ROW_CACHE_ENABLED = False
+
+    if config.DB_BACKEND == "sqlite":
+        backend = SQLiteBackend(args.database if args.database != config.DB_NAME else None)
+    else:
+        backend = get_backend()
+        config.DB_NAME = args.database
+        if args.seed:
+            migrate.create_database(backend)
+
+    db = DatabaseConnection(pooled=False, backend=backend)
+    if not db.connect(database=args.database):
+        return 1
+
+    try:
+        if not migrate.ensure_schema(db):
+            return 1
+        if args.seed:
+            seed_large_dataset(db, boardings=args.seed)
+
+        failures = verify(db)
+        if failures:
+            print(f"\n{len(failures)} query(ies) fell back to a full table scan")
+            return 1
+        print("\nAll service queries use an index")
+        return 0
+    finally:
+        db.disconnect()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -0,0 +1,170 @@
+# database/worker.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Run database calls on background threads and deliver results on the Tk thread
+# 2026-10-18: Added so slow queries (WAN-hosted MySQL) no longer freeze the window
+# 2026-10-18: Added on_progress for long jobs such as the batched purge
+# 2026-10-18: Without a connection pool jobs run on the Tk thread (max_workers=0)
+#
+# usage (from Tk code):
+#   worker = DatabaseWorker(root, max_workers=4, on_busy=views.set_busy)
+#   worker.submit("customers", Customer.get_all, db,
+#                 on_success=show_customers, on_error=show_error)
+#
+# Tk widgets must only be touched from the thread running mainloop, so the
+# worker threads never call back directly: they put results on a queue that
+# root.after() drains. submitting a new job under a key that is still running
+# supersedes the old one and its result is dropped when it arrives.
+# a job submitted with on_progress gets a progress= keyword argument; calls to
+# it from the worker thread are queued the same way and delivered in order.
+# with max_workers=0 there is no thread: a job runs inside submit() on the
+# calling thread and its callbacks are still delivered through the queue
+
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+_PROGRESS = object()  # marks a queued progress update instead of an error
+
+class Job:
+    def __init__(self, key, on_success, on_error, on_progress=None):
+        self.key = key
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.cancelled = False
+
+    def cancel(self):
+        # a job that already started still runs to completion on its
+        # thread; only its callback is skipped
+        self.cancelled = True
+
+class DatabaseWorker:
+    POLL_MS = 50
+
+    def __init__(self, root, max_workers=1, on_busy=None):
+        self.root = root
+        self.on_busy = on_busy  # called with the set of busy keys when it changes
+        self.executor = (ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+                         if max_workers > 0 else None)
+        self.results = queue.Queue()
+        self._latest = {}  # key -> newest Job submitted under that key
+        self._pending = 0
+        self._poll_id = None
+        self._busy = frozenset()
+        self._closed = False
+
+    @staticmethod
+    def workers_for(db):
+        # one thread per pooled connection. without a pool every caller gets
+        # the same connection, which the dialogs also query from the Tk
+        # thread, and a commit there could end a transaction a worker thread
+        # has open - so jobs run on the Tk thread instead
+        return db.pool.size if db.pool else 0
+
+    def submit(self, key, func, *args, on_success=None, on_error=None, on_progress=None):
+        if self._closed:
+            return None
+
+        previous = self._latest.get(key)
+        if previous is not None:
+            previous.cancel()
+
+        job = Job(key, on_success, on_error, on_progress)
+        self._latest[key] = job
+        self._pending += 1
+        kwargs = {}
+        if on_progress is not None:
+            kwargs['progress'] = lambda *update: self.results.put((job, update, _PROGRESS))
+        if self.executor is None:
+            self._run(job, func, args, kwargs)
+        else:
+            self.executor.submit(self._run, job, func, args, kwargs)
+        self._notify_busy()
+        self._schedule_poll()
+        return job
+
+    def cancel(self, key):
+        job = self._latest.pop(key, None)
+        if job is not None:
+            job.cancel()
+            self._notify_busy()
+
+    def is_busy(self, key=None):
+        return bool(self._busy) if key is None else key in self._busy
+
+    def _run(self, job, func, args, kwargs):
+        # runs on a worker thread: never touch Tk here
+        if job.cancelled:
+            self.results.put((job, None, None))
+            return
+        try:
+            self.results.put((job, func(*args, **kwargs), None))
+        except Exception as e:
+            self.results.put((job, None, e))
+
+    def _schedule_poll(self):
+        if self._poll_id is None and not self._closed:
+            try:
+                self._poll_id = self.root.after(self.POLL_MS, self._drain)
+            except tk.TclError:
+                # window already destroyed
+                self._poll_id = None
+
+    def _drain(self):
+        self._poll_id = None
+        ready = []
+        while True:
+            try:
+                job, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if error is _PROGRESS:
+                # a progress update; the job is still running
+                if not job.cancelled:
+                    ready.append((job, result, error))
+                continue
+            self._pending -= 1
+            if self._latest.get(job.key) is job:
+                del self._latest[job.key]
+            if not job.cancelled:
+                ready.append((job, result, error))
+
+        # reschedule before running callbacks: a callback may open a modal
+        # dialog whose nested event loop still needs results delivered
+        if self._pending:
+            self._schedule_poll()
+        self._notify_busy()
+
+        for job, result, error in ready:
+            if error is _PROGRESS:
+                job.on_progress(*result)
+            elif error is not None:
+                if job.on_error:
+                    job.on_error(error)
+                else:
+                    print(f"Background database call '{job.key}' failed: {error}")
+            elif job.on_success:
+                job.on_success(result)
+
+    def _notify_busy(self):
+        busy = frozenset(key for key, job in self._latest.items() if not job.cancelled)
+        if busy != self._busy:
+            self._busy = busy
+            if self.on_busy and not self._closed:
+                self.on_busy(busy)
+
+    def shutdown(self):
+        self._closed = True
+        for job in self._latest.values():
+            job.cancel()
+        self._latest.clear()
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass
+            self._poll_id = None
+        # queued jobs are dropped; a query already running finishes on its own
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
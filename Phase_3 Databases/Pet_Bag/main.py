@@ -1,78 +1,114 @@
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Entry point and main window setup
-# 2026-01-31: Refactored into MVC 
-# 2026-02-07: Added authentication system
-
-import tkinter as tk
-from tkinter import messagebox
-from database.connection import DatabaseConnection
-import database.setup
-from views import AppViews
-import services.auth_service
-
-class PetBoardingApp:
-    def __init__(self, root, current_user):
-        self.root = root
-        self.current_user = current_user
-        self.root.title(f"PetBag Boarding System - Welcome {current_user['first_name']}")
-        self.root.geometry("1000x600")
-        
-        # setup database
-        try:
-            database.setup.setup_database()
-            self.db = DatabaseConnection()
-            
-            if not self.db.connect(database="pet_bag_db"):
-                messagebox.showerror("Error", "Cannot connect to database")
-                root.destroy()
-                return
-        except Exception as e:
-            messagebox.showerror("Error", f"Database setup failed: {str(e)}")
-            root.destroy()
-            return
-        
-        # initialize controllers and views
-        from controllers import AppControllers
-        self.controllers = AppControllers(self.db, self.current_user)
-        self.views = AppViews(self.root, self.controllers, self.db, self.current_user)
-        self.controllers.set_views(self.views)
-    
-    def run(self): #start the app
-        
-        self.root.mainloop()
-
-def main():
-    # create login window first
-    login_root = tk.Tk()
-    
-    def on_login_success(user):
-        # create main application window after successful login
-        main_root = tk.Tk()
-        app = PetBoardingApp(main_root, user)
-        app.run()
-    
-    # setup database for login
-    try:
-        database.setup.setup_database()
-        db = DatabaseConnection()
-        
-        if not db.connect(database="pet_bag_db"):
-            messagebox.showerror("Error", "Cannot connect to database")
-            login_root.destroy()
-            return
-        
-        # import and create login window
-        from login_window import LoginWindow
-        login_window = LoginWindow(login_root, on_login_success)
-        login_window.set_database(db)
-        login_root.mainloop()
-        
-        db.disconnect()
-        
-    except Exception as e:
-        messagebox.showerror("Error", f"Application startup failed: {str(e)}")
-        login_root.destroy()
-
-if __name__ == "__main__":
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Entry point and main window setup
+# 2026-01-31: Refactored into MVC 
+# 2026-02-07: Added authentication system
+# 2026-10-18: Schema is checked once at startup through database.migrate instead of
+#             running setup_database() twice per launch
+# 2026-10-18: Stop the background database worker when the main window closes
+# 2026-10-18: Save the session's query timings for python -m database.query_stats
+# 2026-10-18: Print the row cache hit/miss totals when the main window closes
+# 2026-10-18: run() skips the worker shutdown and cache totals when the window never finished opening
+# 2026-10-18: Login and main window share one storage backend, so DB_SQLITE_PATH=:memory: keeps its schema
+
+import tkinter as tk
+from tkinter import messagebox
+from config import config
+from database.backends import get_backend
+from database.connection import DatabaseConnection, query_metrics
+from models.row_cache import session_cache
+import database.migrate
+from views import AppViews
+import services.auth_service
+
+class PetBoardingApp:
+    def __init__(self, root, current_user, backend=None):
+        self.root = root
+        self.current_user = current_user
+        self.root.title(f"PetBag Boarding System - Welcome {current_user['first_name']}")
+        self.root.geometry("1000x600")
+        self.db = None
+        self.controllers = None  # stays None if the database connection fails
+        
+        # connect to database (schema was already checked by main())
+        try:
+            self.db = DatabaseConnection(backend=backend)
+            
+            if not self.db.connect(database="pet_bag_db"):
+                messagebox.showerror("Error", "Cannot connect to database")
+                root.destroy()
+                return
+        except Exception as e:
+            messagebox.showerror("Error", f"Database setup failed: {str(e)}")
+            root.destroy()
+            return
+        
+        # initialize controllers and views
+        from controllers import AppControllers
+        self.controllers = AppControllers(self.db, self.current_user)
+        self.views = AppViews(self.root, self.controllers, self.db, self.current_user)
+        self.controllers.set_views(self.views)
+    
+    def run(self): #start the app
+        
+        # __init__ already closed the window if it could not connect
+        if self.controllers is None:
+            return
+        
+        self.root.mainloop()
+        if self.controllers.worker:
+            self.controllers.worker.shutdown()
+        
+        cache = session_cache(self.db)
+        if cache:
+            print(f"Row cache this session:\n{cache.format_stats()}")
+
+def main():
+    # create login window first
+    login_root = tk.Tk()
+    
+    def on_login_success(user):
+        # create main application window after successful login
+        main_root = tk.Tk()
+        app = PetBoardingApp(main_root, user, backend)
+        app.run()
+    
+    # connect to database for login
+    try:
+        # one backend for the whole session: an in-memory SQLite database
+        # only exists for the backend that created it
+        backend = get_backend()
+        db = DatabaseConnection(backend=backend)
+        
+        if not db.connect(database="pet_bag_db"):
+            # first launch on a new server: create the database and retry
+            database.migrate.create_database(backend)
+            if not db.connect(database="pet_bag_db"):
+                messagebox.showerror("Error", "Cannot connect to database")
+                login_root.destroy()
+                return
+        
+        # apply pending migrations; costs a single indexed read when up to date
+        if not database.migrate.ensure_schema(db):
+            messagebox.showerror("Error", "Database schema upgrade failed")
+            login_root.destroy()
+            return
+        
+        # import and create login window
+        from login_window import LoginWindow
+        login_window = LoginWindow(login_root, on_login_success)
+        login_window.set_database(db)
+        login_root.mainloop()
+        
+        db.disconnect()
+        
+        # keep this session's statement totals for python -m database.query_stats
+        if config.QUERY_METRICS_ENABLED and query_metrics.snapshot():
+            query_metrics.save(config.QUERY_METRICS_FILE)
+        
+    except Exception as e:
+        messagebox.showerror("Error", f"Application startup failed: {str(e)}")
+        login_root.destroy()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+# models/bulk.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Batched multi-row INSERT helpers behind Customer.create_many and Pet.create_many
+# 2026-10-18: Added for onboarding franchise customer lists without a commit per row
+# 2026-10-18: Note when MySQL falls back to one statement per row
+#
+# rows go in as one INSERT ... VALUES (...), (...), ... per chunk on the
+# caller's cursor, so the caller's transaction commits them all at once.
+# a multi-row INSERT reports a single id; the rest are derived from it when
+# the backend hands each statement a consecutive block (on MySQL, whenever
+# auto_increment_increment is 1), otherwise rows are inserted one statement
+# at a time (still inside the one transaction)
+
+DEFAULT_CHUNK_SIZE = 500
+
+# check every row before anything is written; raises ValueError naming the
+# first few bad rows (1-based, in input order)
+def validate_rows(rows, validate, label):
+    errors = []
+    for number, row in enumerate(rows, start=1):
+        is_valid, error = validate(row)
+        if not is_valid:
+            errors.append(f"row {number}: {error}")
+    if errors:
+        shown = "; ".join(errors[:10])
+        more = f" (and {len(errors) - 10} more)" if len(errors) > 10 else ""
+        raise ValueError(f"{len(errors)} invalid {label} rows - {shown}{more}")
+
+# insert value tuples into table and return their ids in input order
+def insert_many(db, cursor, table, columns, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    row_sql = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    ids = []
+
+    if not db.backend.consecutive_insert_ids(cursor):
+        for row in rows:
+            cursor.execute(prefix + row_sql, row)
+            ids.append(cursor.lastrowid)
+        return ids
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        cursor.execute(prefix + ", ".join([row_sql] * len(chunk)),
+                       [value for row in chunk for value in row])
+        first_id = db.backend.first_insert_id(cursor, len(chunk))
+        ids.extend(range(first_id, first_id + len(chunk)))
+    return ids
\ No newline at end of file
@@ -0,0 +1,119 @@
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Capacity model keeps per-pet-type occupied counts in step with open boardings
+# 2026-10-18: Added so capacity checks and the dashboard read two primary-key rows
+#             instead of grouping every open boarding
+# 2026-10-18: Added reserve() for atomic capacity check-and-claim at check-in
+# 2026-10-18: A retyped pet's open stay claims a space of its new type through reserve_for_pet()
+#
+# the adjust/release helpers take the caller's cursor so the counter changes
+# commit in the same transaction as the boarding or pet write that caused them
+
+# raised by a model write that would overbook a pet type; the message is
+# meant for the user, and the transaction it was raised in rolls back
+class CapacityFullError(Exception):
+    pass
+
+class Capacity:
+    PET_TYPES = ('dog', 'cat')
+
+    # add delta (+1 on check-in, -1 on check-out) to one pet type's count
+    @staticmethod
+    def adjust(cursor, pet_type, delta):
+        cursor.execute("""
+            UPDATE Capacity
+            SET occupied = occupied + %s
+            WHERE pet_type = %s
+        """, (delta, pet_type.lower()))
+
+    # claim count spaces only if they all fit under the type's limit; the
+    # conditional update locks the counter row until commit, so two desks can
+    # never both take the last space. returns False when the type is full
+    @staticmethod
+    def reserve(cursor, pet_type, total_spaces, count=1):
+        cursor.execute("""
+            UPDATE Capacity
+            SET occupied = occupied + %s
+            WHERE pet_type = %s AND occupied + %s <= %s
+        """, (count, pet_type.lower(), count, total_spaces))
+        return cursor.rowcount == 1
+
+    # after a pet type change (and release_for_pet before it): claim spaces
+    # of the new type for the pet's open boardings. False when they do not
+    # fit, or the type has no spaces at all (total_spaces None)
+    @staticmethod
+    def reserve_for_pet(cursor, pet_id, pet_type, total_spaces):
+        cursor.execute("SELECT COUNT(*) FROM Boarding WHERE pet_id = %s AND check_out IS NULL", (pet_id,))
+        open_stays = cursor.fetchone()[0]
+        if not open_stays:
+            return True
+        if total_spaces is None:
+            return False
+        return Capacity.reserve(cursor, pet_type, total_spaces, open_stays)
+
+    # remove a pet's open boardings from the counts (pet deleted or retyped)
+    @staticmethod
+    def release_for_pet(cursor, pet_id):
+        cursor.execute("""
+            UPDATE Capacity SET occupied = occupied - (
+                SELECT COUNT(*)
+                FROM Boarding b
+                JOIN Pet p ON b.pet_id = p.pet_id
+                WHERE p.pet_id = %s AND b.check_out IS NULL AND p.pet_type = Capacity.pet_type
+            )
+        """, (pet_id,))
+
+    # remove every open boarding of a customer's pets before the cascade delete
+    @staticmethod
+    def release_for_customer(cursor, customer_id):
+        cursor.execute("""
+            UPDATE Capacity SET occupied = occupied - (
+                SELECT COUNT(*)
+                FROM Boarding b
+                JOIN Pet p ON b.pet_id = p.pet_id
+                WHERE p.customer_id = %s AND b.check_out IS NULL AND p.pet_type = Capacity.pet_type
+            )
+        """, (customer_id,))
+
+    @staticmethod
+    def get_occupied(db):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT pet_type, occupied FROM Capacity WHERE pet_type IN (%s, %s)",
+                           Capacity.PET_TYPES)
+            results = cursor.fetchall()
+            cursor.close()
+
+        occupied = {pet_type: 0 for pet_type in Capacity.PET_TYPES}
+        for pet_type, count in results:
+            occupied[pet_type.lower()] = count
+        return occupied
+
+    # rebuild the counters from Boarding; returns {pet_type: (old, new)}
+    @staticmethod
+    def rebuild(db):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT pet_type, occupied FROM Capacity")
+            before = {pet_type.lower(): count for pet_type, count in cursor.fetchall()}
+
+            for pet_type in Capacity.PET_TYPES:
+                if pet_type not in before:
+                    cursor.execute("INSERT INTO Capacity (pet_type, occupied) VALUES (%s, 0)", (pet_type,))
+                    before[pet_type] = 0
+
+            cursor.execute("""
+                UPDATE Capacity SET occupied = (
+                    SELECT COUNT(*)
+                    FROM Boarding b
+                    JOIN Pet p ON b.pet_id = p.pet_id
+                    WHERE b.check_out IS NULL AND p.pet_type = Capacity.pet_type
+                )
+            """)
+            cursor.execute("SELECT pet_type, occupied FROM Capacity")
+            after = {pet_type.lower(): count for pet_type, count in cursor.fetchall()}
+
+            db.commit(conn)
+            cursor.close()
+
+        return {pet_type: (before.get(pet_type, 0), after[pet_type]) for pet_type in after}
\ No newline at end of file
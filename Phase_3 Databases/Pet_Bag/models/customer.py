@@ -1,93 +1,281 @@
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Customer model class with CRUD operations for customer data
-# 2026-01-31: Implemented delete_by_id().
-
-from database.connection import DatabaseConnection
-
-class Customer:
-    def __init__(self, customer_id=None, first_name="", last_name="", phone="", email=""):
-        self.customer_id = customer_id
-        self.first_name = first_name
-        self.last_name = last_name
-        self.phone = phone
-        self.email = email
-    
-    def save(self, db):
-        cursor = db.connection.cursor()
-        if self.customer_id:
-            sql = "UPDATE Customer SET first_name=%s, last_name=%s, phone=%s, email=%s WHERE customer_id=%s"
-            cursor.execute(sql, (self.first_name, self.last_name, self.phone, self.email, self.customer_id))
-        else:
-            sql = "INSERT INTO Customer (first_name, last_name, phone, email) VALUES (%s, %s, %s, %s)"
-            cursor.execute(sql, (self.first_name, self.last_name, self.phone, self.email))
-            self.customer_id = cursor.lastrowid
-        
-        db.connection.commit()
-        cursor.close()
-        return self.customer_id
-    
-    def delete(self, db):
-        cursor = db.connection.cursor()
-        sql = "DELETE FROM Customer WHERE customer_id=%s"
-        cursor.execute(sql, (self.customer_id,))
-        db.connection.commit()
-        affected_rows = cursor.rowcount
-        cursor.close()
-        return affected_rows > 0
-    
-    @staticmethod
-    def delete_by_id(db, customer_id):
-        cursor = db.connection.cursor()
-        sql = "DELETE FROM Customer WHERE customer_id=%s"
-        cursor.execute(sql, (customer_id,))
-        db.connection.commit()
-        affected_rows = cursor.rowcount
-        cursor.close()
-        return affected_rows > 0
-    
-    @staticmethod
-    def get_all(db):
-        cursor = db.connection.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM Customer ORDER BY last_name, first_name")
-        customers = cursor.fetchall()
-        cursor.close()
-        return customers
-    
-    @staticmethod
-    def create(db, customer_data):
-        cursor = db.connection.cursor()
-        sql = "INSERT INTO Customer (first_name, last_name, phone, email) VALUES (%s, %s, %s, %s)"
-        cursor.execute(sql, (
-            customer_data.get('first_name', ''),
-            customer_data.get('last_name', ''),
-            customer_data.get('phone', ''),
-            customer_data.get('email', '')
-        ))
-        db.connection.commit()
-        customer_id = cursor.lastrowid
-        cursor.close()
-        return customer_id
-    
-    @staticmethod
-    def update(db, customer_id, customer_data):
-        cursor = db.connection.cursor()
-        sql = "UPDATE Customer SET first_name=%s, last_name=%s, phone=%s, email=%s WHERE customer_id=%s"
-        cursor.execute(sql, (
-            customer_data.get('first_name', ''),
-            customer_data.get('last_name', ''),
-            customer_data.get('phone', ''),
-            customer_data.get('email', ''),
-            customer_id
-        ))
-        db.connection.commit()
-        cursor.close()
-        return True
-    
-    @staticmethod
-    def get_by_id(db, customer_id):
-        cursor = db.connection.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM Customer WHERE customer_id = %s", (customer_id,))
-        customer = cursor.fetchone()
-        cursor.close()
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Customer model class with CRUD operations for customer data
+# 2026-01-31: Implemented delete_by_id().
+# 2026-10-18: Borrow connections from the pool instead of a shared handle
+# 2026-10-18: Deleting a customer frees the capacity held by their boarded pets
+# 2026-10-18: Added keyset-paginated get_page() and iter_all()
+# 2026-10-18: Added get_by_ids() for refreshing only the rows a mutation touched
+# 2026-10-18: Added get_owner_options() for bounded owner dropdowns
+# 2026-10-18: Reads by id go through the session row cache; writes invalidate it
+# 2026-10-18: Reads return compact CustomerRecord rows built from a tuple cursor
+# 2026-10-18: Added create_many() for validated batch inserts in one transaction
+# 2026-10-18: Deleting a customer removes their stays from the daily_stats rollup
+# 2026-10-18: Rows read while a write invalidated the cache are not cached
+
+from database.connection import DatabaseConnection
+from models.capacity import Capacity
+from models.daily_stats import DailyStats
+from models.row_cache import SessionCache, session_cache, cached_rows
+from models.records import CustomerRecord
+from models import bulk
+from validation import validate_customer
+
+class Customer:
+    __slots__ = ('customer_id', 'first_name', 'last_name', 'phone', 'email')
+
+    def __init__(self, customer_id=None, first_name="", last_name="", phone="", email=""):
+        self.customer_id = customer_id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.phone = phone
+        self.email = email
+    
+    def save(self, db):
+        version = None
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            if self.customer_id:
+                sql = "UPDATE Customer SET first_name=%s, last_name=%s, phone=%s, email=%s WHERE customer_id=%s"
+                cursor.execute(sql, (self.first_name, self.last_name, self.phone, self.email, self.customer_id))
+                version = SessionCache.bump(cursor, 'Customer')
+            else:
+                sql = "INSERT INTO Customer (first_name, last_name, phone, email) VALUES (%s, %s, %s, %s)"
+                cursor.execute(sql, (self.first_name, self.last_name, self.phone, self.email))
+                self.customer_id = cursor.lastrowid
+
+            db.commit(conn)
+            cursor.close()
+        if version is not None:
+            Customer._forget(db, self.customer_id, version)
+        return self.customer_id
+    
+    def delete(self, db):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            # free the spaces of boarded pets before the cascade removes them
+            Capacity.release_for_customer(cursor, self.customer_id)
+            DailyStats.remove(cursor, "p.customer_id = %s", (self.customer_id,))
+            sql = "DELETE FROM Customer WHERE customer_id=%s"
+            cursor.execute(sql, (self.customer_id,))
+            affected_rows = cursor.rowcount
+            version = SessionCache.bump(cursor, 'Customer')
+            db.commit(conn)
+            cursor.close()
+        Customer._forget(db, self.customer_id, version)
+        return affected_rows > 0
+    
+    @staticmethod
+    def delete_by_id(db, customer_id):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            # free the spaces of boarded pets before the cascade removes them
+            Capacity.release_for_customer(cursor, customer_id)
+            DailyStats.remove(cursor, "p.customer_id = %s", (customer_id,))
+            sql = "DELETE FROM Customer WHERE customer_id=%s"
+            cursor.execute(sql, (customer_id,))
+            affected_rows = cursor.rowcount
+            version = SessionCache.bump(cursor, 'Customer')
+            db.commit(conn)
+            cursor.close()
+        Customer._forget(db, customer_id, version)
+        return affected_rows > 0
+
+    # drop a changed or deleted customer from the row cache, along with their
+    # pets: pet rows carry the owner's name and cascade away with the owner
+    @staticmethod
+    def _forget(db, customer_id, version):
+        cache = session_cache(db)
+        if cache:
+            cache.wrote('Customer', version, [customer_id])
+            cache.wrote('Pet', None, where=lambda pet: pet['customer_id'] == customer_id)
+
+    # keep rows that were read anyway so later lookups by id skip the database
+    @staticmethod
+    def _remember(cache, generation, customers):
+        if cache:
+            for customer in customers:
+                cache.put(customer['customer_id'], customer, generation)
+
+    # the row cache (or None) and its generation, taken before a read so
+    # rows fetched while a write was invalidating them are not cached
+    @staticmethod
+    def _reading(db):
+        cache = cached_rows(db, 'Customer')
+        return cache, cache.generation if cache else None
+
+    @staticmethod
+    def get_all(db):
+        cache, generation = Customer._reading(db)
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {CustomerRecord.select()} FROM Customer ORDER BY last_name, first_name")
+            customers = CustomerRecord.fetchall(cursor)
+            cursor.close()
+        Customer._remember(cache, generation, customers)
+        return customers
+
+    # one page of the customer list in (last_name, first_name, customer_id)
+    # order, starting after the key of the last row already shown. seeking on
+    # the index keeps every page as cheap as the first, unlike OFFSET
+    @staticmethod
+    def get_page(db, after=None, limit=100):
+        cache, generation = Customer._reading(db)
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            if after is None:
+                cursor.execute(f"""
+                    SELECT {CustomerRecord.select()} FROM Customer
+                    ORDER BY last_name, first_name, customer_id
+                    LIMIT %s
+                """, (limit,))
+            else:
+                cursor.execute(f"""
+                    SELECT {CustomerRecord.select()} FROM Customer
+                    WHERE (last_name, first_name, customer_id) > (%s, %s, %s)
+                    ORDER BY last_name, first_name, customer_id
+                    LIMIT %s
+                """, (*after, limit))
+            customers = CustomerRecord.fetchall(cursor)
+            cursor.close()
+        Customer._remember(cache, generation, customers)
+        return customers
+
+    # seek key of a customer row, as passed back to get_page(after=...)
+    @staticmethod
+    def page_key(customer):
+        return (customer['last_name'] or '', customer['first_name'], customer['customer_id'])
+
+    # customers by id (cached ones are not re-read); ids that no longer exist are left out
+    @staticmethod
+    def get_by_ids(db, customer_ids):
+        cache, generation = Customer._reading(db)
+        found, missing = cache.get_many(customer_ids) if cache else ({}, list(customer_ids))
+        if not missing:
+            return list(found.values())
+        placeholders = ", ".join(["%s"] * len(missing))
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {CustomerRecord.select()} FROM Customer WHERE customer_id IN ({placeholders})",
+                           tuple(missing))
+            customers = CustomerRecord.fetchall(cursor)
+            cursor.close()
+        Customer._remember(cache, generation, customers)
+        return list(found.values()) + customers
+
+    # iterate over every customer one page at a time
+    @staticmethod
+    def iter_all(db, page_size=500):
+        after = None
+        while True:
+            page = Customer.get_page(db, after, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = Customer.page_key(page[-1])
+
+    # id and name of up to limit owners for a dropdown, in list order. with a
+    # prefix, only owners whose first or last name starts with it ("ann s"
+    # narrows to first name ann, last name starting with s); each branch
+    # seeks an index, so the cost does not grow with the table
+    @staticmethod
+    def get_owner_options(db, prefix="", limit=50):
+        words = prefix.replace("%", "").replace("_", "").replace("\\", "").split()
+        with db.get_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            if not words:
+                cursor.execute("""
+                    SELECT customer_id, first_name, last_name FROM Customer
+                    ORDER BY last_name, first_name, customer_id
+                    LIMIT %s
+                """, (limit,))
+                options = cursor.fetchall()
+            elif len(words) > 1:
+                cursor.execute("""
+                    SELECT customer_id, first_name, last_name FROM Customer
+                    WHERE first_name = %s AND last_name LIKE %s
+                    ORDER BY last_name, customer_id
+                    LIMIT %s
+                """, (words[0], " ".join(words[1:]) + "%", limit))
+                options = cursor.fetchall()
+            else:
+                options = {}
+                for column in ("last_name", "first_name"):
+                    cursor.execute(f"""
+                        SELECT customer_id, first_name, last_name FROM Customer
+                        WHERE {column} LIKE %s
+                        ORDER BY {column}
+                        LIMIT %s
+                    """, (words[0] + "%", limit))
+                    for row in cursor.fetchall():
+                        options.setdefault(row['customer_id'], row)
+                options = sorted(options.values(), key=lambda c: Customer.page_key(c))[:limit]
+            cursor.close()
+        return options
+
+    @staticmethod
+    def create(db, customer_data):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            sql = "INSERT INTO Customer (first_name, last_name, phone, email) VALUES (%s, %s, %s, %s)"
+            cursor.execute(sql, (
+                customer_data.get('first_name', ''),
+                customer_data.get('last_name', ''),
+                customer_data.get('phone', ''),
+                customer_data.get('email', '')
+            ))
+            db.commit(conn)
+            customer_id = cursor.lastrowid
+            cursor.close()
+        return customer_id
+
+    # insert many customers in one transaction and return their ids in input
+    # order. every row must pass the add-customer rules first; if any fails a
+    # ValueError names the bad rows and nothing is written
+    @staticmethod
+    def create_many(db, customers, chunk_size=bulk.DEFAULT_CHUNK_SIZE):
+        customers = list(customers)
+        bulk.validate_rows(customers, validate_customer, "customer")
+        rows = [(c['first_name'].strip(), c['last_name'].strip(), c['phone'].strip(), c['email'].strip())
+                for c in customers]
+        if not rows:
+            return []
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            customer_ids = bulk.insert_many(db, cursor, "Customer", ("first_name", "last_name", "phone", "email"),
+                                            rows, chunk_size)
+            cursor.close()
+        return customer_ids
+
+    @staticmethod
+    def update(db, customer_id, customer_data):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            sql = "UPDATE Customer SET first_name=%s, last_name=%s, phone=%s, email=%s WHERE customer_id=%s"
+            cursor.execute(sql, (
+                customer_data.get('first_name', ''),
+                customer_data.get('last_name', ''),
+                customer_data.get('phone', ''),
+                customer_data.get('email', ''),
+                customer_id
+            ))
+            version = SessionCache.bump(cursor, 'Customer')
+            db.commit(conn)
+            cursor.close()
+        Customer._forget(db, customer_id, version)
+        return True
+    
+    @staticmethod
+    def get_by_id(db, customer_id):
+        cache, generation = Customer._reading(db)
+        customer = cache.get(customer_id) if cache else None
+        if customer is not None:
+            return customer
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {CustomerRecord.select()} FROM Customer WHERE customer_id = %s", (customer_id,))
+            customer = CustomerRecord.fetchone(cursor)
+            cursor.close()
+        if customer and cache:
+            cache.put(customer_id, customer, generation)
         return customer
\ No newline at end of file
@@ -0,0 +1,162 @@
+# models/daily_stats.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: daily_stats rollup of boardings, stay days, revenue and grooming per check-in date and pet type
+# 2026-10-18: Added so the reports read a few hundred rollup rows instead of grouping all of Boarding
+# 2026-10-18: Every change bumps a DataVersion counter per month touched (and one for open stays)
+# 2026-10-18: Migration 9 keeps its own backfill SQL; rebuild() serves the maintenance command
+# 2026-10-18: add() and remove() take a plain cursor; dictionary rows are no longer converted
+#
+# one row per (check-in date, pet type). the open_* columns count the stays
+# not yet checked out, so current and pending figures come from here too.
+#
+# like the Capacity counters, the helpers take the caller's cursor and run in
+# the writing transaction; add() and remove() read through it, so it must be
+# a plain (tuple) cursor. a write brackets itself with the rows it touches:
+#   DailyStats.remove(cursor, "b.pet_id = %s", (pet_id,))   # before
+#   ... UPDATE / DELETE ...
+#   DailyStats.add(cursor, "b.pet_id = %s", (pet_id,))      # after (if rows remain)
+# each call aggregates the matching boardings (an indexed lookup of a few
+# rows) and adds or subtracts the result, so check-in, check-out, grooming,
+# pet retyping and deletes all keep the rollup exact. rebuild() recomputes
+# it from history (the rebuild-daily-stats command).
+#
+# the cached reports (services/report_cache.py) notice changes through
+# DataVersion rows bumped in the same transaction: 'daily_stats:YYYY-MM'
+# for each month whose totals changed and 'daily_stats:open' whenever the
+# open stays did. a report depends on the months of its period plus the
+# open stays, so a write to last year's history leaves this month's reports
+# cached
+
+from models.records import record_type
+
+DailyStat = record_type("DailyStat", [
+    "stat_date", "pet_type", "boardings", "stay_days", "revenue", "grooming_requests",
+    "grooming_count", "grooming_revenue", "open_boardings", "open_stay_days", "open_revenue"])
+
+class DailyStats:
+    # revenue is amount_due (grooming included); grooming_requests counts
+    # stays that asked for grooming, grooming_count the Grooming rows booked
+    COUNTERS = DailyStat.COLUMNS[2:]
+    OPEN_COUNTERS = slice(6, 9)
+    OPEN_SCOPE = "daily_stats:open"
+    
+    # DataVersion row for the month of a stat date
+    @staticmethod
+    def scope(stat_date):
+        return f"daily_stats:{str(stat_date)[:7]}"
+    
+    # every DataVersion row a report over start..end depends on
+    @staticmethod
+    def scopes(start_date, end_date):
+        scopes = [DailyStats.OPEN_SCOPE]
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            scopes.append(f"daily_stats:{year:04d}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return scopes
+
+    @staticmethod
+    def add(cursor, where, params=()):
+        DailyStats._apply(cursor, 1, where, params)
+
+    @staticmethod
+    def remove(cursor, where, params=()):
+        DailyStats._apply(cursor, -1, where, params)
+
+    # aggregate the boardings matching where (aliases b = Boarding, p = Pet)
+    # into {(check-in date, pet type): counters}
+    @staticmethod
+    def aggregate(cursor, where, params=()):
+        cursor.execute(f"""
+            SELECT b.check_in, p.pet_type,
+                   COUNT(*),
+                   SUM(b.days_stay),
+                   SUM(b.amount_due),
+                   SUM(CASE WHEN b.grooming_requested = 1 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN b.check_out IS NULL THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN b.check_out IS NULL THEN b.days_stay ELSE 0 END),
+                   SUM(CASE WHEN b.check_out IS NULL THEN b.amount_due ELSE 0 END)
+            FROM Boarding b
+            JOIN Pet p ON p.pet_id = b.pet_id
+            WHERE {where}
+            GROUP BY b.check_in, p.pet_type
+        """, params)
+        stats = {}
+        for (check_in, pet_type, boardings, stay_days, revenue, requests,
+             open_boardings, open_stay_days, open_revenue) in cursor.fetchall():
+            stats[(check_in, pet_type.lower())] = [boardings, stay_days, revenue, requests, 0, 0,
+                                                   open_boardings, open_stay_days, open_revenue]
+
+        cursor.execute(f"""
+            SELECT b.check_in, p.pet_type, COUNT(*), SUM(g.price)
+            FROM Boarding b
+            JOIN Pet p ON p.pet_id = b.pet_id
+            JOIN Grooming g ON g.boarding_id = b.boarding_id
+            WHERE {where}
+            GROUP BY b.check_in, p.pet_type
+        """, params)
+        for check_in, pet_type, count, price in cursor.fetchall():
+            counters = stats.get((check_in, pet_type.lower()))
+            if counters is not None:
+                counters[4] = count
+                counters[5] = price or 0
+        return stats
+
+    # add deltas to one row's counters directly, when the caller already
+    # has the boarding in hand (check-out closing an open stay)
+    @staticmethod
+    def adjust(cursor, stat_date, pet_type, **deltas):
+        DailyStats._upsert(cursor, {(stat_date, pet_type.lower()): [deltas.get(name, 0)
+                                                                    for name in DailyStats.COUNTERS]})
+
+    @staticmethod
+    def _apply(cursor, sign, where, params):
+        stats = DailyStats.aggregate(cursor, where, params)
+        for counters in stats.values():
+            counters[:] = [sign * (value or 0) for value in counters]
+        DailyStats._upsert(cursor, stats)
+
+    @staticmethod
+    def _upsert(cursor, stats):
+        if not stats:
+            return
+        columns = ", ".join(DailyStat.COLUMNS)
+        placeholders = ", ".join(["%s"] * len(DailyStat.COLUMNS))
+        updates = ", ".join(f"{name} = {name} + VALUES({name})" for name in DailyStats.COUNTERS)
+        cursor.executemany(f"""
+            INSERT INTO daily_stats ({columns}) VALUES ({placeholders})
+            ON DUPLICATE KEY UPDATE {updates}
+        """, [(stat_date, pet_type) + tuple(counters) for (stat_date, pet_type), counters in stats.items()])
+        
+        scopes = set()
+        for (stat_date, pet_type), counters in stats.items():
+            if any(counters[:DailyStats.OPEN_COUNTERS.start]):
+                scopes.add(DailyStats.scope(stat_date))
+            if any(counters[DailyStats.OPEN_COUNTERS]):
+                scopes.add(DailyStats.OPEN_SCOPE)
+        DailyStats._bump(cursor, scopes)
+    
+    # sorted so two writers always lock the counters in the same order
+    @staticmethod
+    def _bump(cursor, scopes):
+        if scopes:
+            cursor.executemany("""
+                INSERT INTO DataVersion (table_name, version) VALUES (%s, 1)
+                ON DUPLICATE KEY UPDATE version = version + 1
+            """, [(scope,) for scope in sorted(scopes)])
+
+    # recompute every row from Boarding, Pet and Grooming; returns the
+    # number of (date, pet type) rows written
+    @staticmethod
+    def rebuild(db):
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM daily_stats")
+            # rows may have disappeared: every cached report is stale
+            cursor.execute("UPDATE DataVersion SET version = version + 1 WHERE table_name LIKE 'daily_stats:%'")
+            DailyStats.add(cursor, "1 = 1")
+            cursor.execute("SELECT COUNT(*) FROM daily_stats")
+            count = cursor.fetchone()[0]
+            cursor.close()
+        return count
\ No newline at end of file
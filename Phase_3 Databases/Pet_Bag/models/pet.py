@@ -1,116 +1,302 @@
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Pet model class with CRUD operations for pet data
-# 2026-01-31: Implemented get_occupied_spaces() for active check-ins and delete_by_id()
-
-from database.connection import DatabaseConnection
-
-class Pet:
-    def __init__(self, pet_id=None, customer_id=None, pet_name="", pet_type="", pet_age=0, breed="", weight=0):
-        self.pet_id = pet_id
-        self.customer_id = customer_id
-        self.pet_name = pet_name
-        self.pet_type = pet_type.lower()
-        self.pet_age = pet_age
-        self.breed = breed
-        self.weight = weight
-    
-    def save(self, db):
-        cursor = db.connection.cursor()
-        if self.pet_id:
-            sql = "UPDATE Pet SET pet_name=%s, pet_type=%s, pet_age=%s, breed=%s, weight=%s WHERE pet_id=%s"
-            cursor.execute(sql, (self.pet_name, self.pet_type, self.pet_age, self.breed, self.weight, self.pet_id))
-        else:
-            sql = "INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight) VALUES (%s, %s, %s, %s, %s, %s)"
-            cursor.execute(sql, (self.customer_id, self.pet_name, self.pet_type, self.pet_age, self.breed, self.weight))
-            self.pet_id = cursor.lastrowid
-        
-        db.connection.commit()
-        cursor.close()
-        return self.pet_id
-    
-    def delete(self, db):
-        cursor = db.connection.cursor()
-        sql = "DELETE FROM Pet WHERE pet_id=%s"
-        cursor.execute(sql, (self.pet_id,))
-        db.connection.commit()
-        affected_rows = cursor.rowcount
-        cursor.close()
-        return affected_rows > 0
-    
-    @staticmethod
-    def delete_by_id(db, pet_id):
-        cursor = db.connection.cursor()
-        sql = "DELETE FROM Pet WHERE pet_id=%s"
-        cursor.execute(sql, (pet_id,))
-        db.connection.commit()
-        affected_rows = cursor.rowcount
-        cursor.close()
-        return affected_rows > 0
-    
-    @staticmethod
-    def get_all(db):
-        cursor = db.connection.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT p.*, c.first_name, c.last_name 
-            FROM Pet p 
-            JOIN Customer c ON p.customer_id = c.customer_id
-            ORDER BY p.pet_name
-        """)
-        pets = cursor.fetchall()
-        cursor.close()
-        return pets
-    
-    @staticmethod
-    def create(db, pet_data):
-        cursor = db.connection.cursor()
-        sql = "INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight) VALUES (%s, %s, %s, %s, %s, %s)"
-        cursor.execute(sql, (
-            pet_data.get('customer_id'),
-            pet_data.get('pet_name', ''),
-            pet_data.get('pet_type', ''),
-            pet_data.get('pet_age', 0),
-            pet_data.get('breed', ''),
-            pet_data.get('weight', 0)
-        ))
-        db.connection.commit()
-        pet_id = cursor.lastrowid
-        cursor.close()
-        return pet_id
-    
-    @staticmethod
-    def update(db, pet_id, pet_data):
-        cursor = db.connection.cursor()
-        sql = "UPDATE Pet SET customer_id=%s, pet_name=%s, pet_type=%s, pet_age=%s, breed=%s, weight=%s WHERE pet_id=%s"
-        cursor.execute(sql, (
-            pet_data.get('customer_id'),
-            pet_data.get('pet_name', ''),
-            pet_data.get('pet_type', ''),
-            pet_data.get('pet_age', 0),
-            pet_data.get('breed', ''),
-            pet_data.get('weight', 0),
-            pet_id
-        ))
-        db.connection.commit()
-        cursor.close()
-        return True
-    
-    # get occupancy from the db by counting pets with no check-out date
-    @staticmethod
-    def get_occupied_spaces(db):
-        cursor = db.connection.cursor()
-        cursor.execute("""
-            SELECT p.pet_type, COUNT(*) as count 
-            FROM Boarding b
-            JOIN Pet p ON b.pet_id = p.pet_id
-            WHERE b.check_out IS NULL
-            GROUP BY p.pet_type
-        """)
-        results = cursor.fetchall()
-        cursor.close()
-        
-        occupied = {'dog': 0, 'cat': 0}
-        for pet_type, count in results:
-            occupied[pet_type.lower()] = count
-        
-        return occupied
\ No newline at end of file
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Pet model class with CRUD operations for pet data
+# 2026-01-31: Implemented get_occupied_spaces() for active check-ins and delete_by_id()
+# 2026-10-18: Borrow connections from the pool instead of a shared handle
+# 2026-10-18: Occupancy is read from the Capacity counters and kept in step on delete/retype
+# 2026-10-18: Added keyset-paginated get_page() and iter_all()
+# 2026-10-18: Added get_by_ids() for refreshing only the rows a mutation touched
+# 2026-10-18: Added get_by_id() with the owner's name for the edit dialog
+# 2026-10-18: Reads by id go through the session row cache; writes invalidate it
+# 2026-10-18: Reads return compact PetRecord rows built from a tuple cursor
+# 2026-10-18: Added create_many() for validated batch inserts in one transaction
+# 2026-10-18: Deletes and retypes keep the daily_stats rollup in step
+# 2026-10-18: Added forget_cached() so services that delete pets can invalidate the row cache
+# 2026-10-18: A type change of a boarded pet must find a space of the new type, or is rejected
+# 2026-10-18: Rows read while a write invalidated the cache are not cached
+
+from database.connection import DatabaseConnection
+from models.capacity import Capacity, CapacityFullError
+from models.daily_stats import DailyStats
+from models.row_cache import SessionCache, session_cache, cached_rows
+from models.records import PetRecord, PET_COLUMNS
+from models import bulk
+from validation import validate_pet
+
+class Pet:
+    __slots__ = ('pet_id', 'customer_id', 'pet_name', 'pet_type', 'pet_age', 'breed', 'weight')
+
+    def __init__(self, pet_id=None, customer_id=None, pet_name="", pet_type="", pet_age=0, breed="", weight=0):
+        self.pet_id = pet_id
+        self.customer_id = customer_id
+        self.pet_name = pet_name
+        self.pet_type = pet_type.lower()
+        self.pet_age = pet_age
+        self.breed = breed
+        self.weight = weight
+    
+    def save(self, db):
+        version = None
+        # one transaction, so a type change rejected for capacity undoes the edit
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            if self.pet_id:
+                Capacity.release_for_pet(cursor, self.pet_id)
+                DailyStats.remove(cursor, "b.pet_id = %s", (self.pet_id,))
+                sql = "UPDATE Pet SET pet_name=%s, pet_type=%s, pet_age=%s, breed=%s, weight=%s WHERE pet_id=%s"
+                cursor.execute(sql, (self.pet_name, self.pet_type, self.pet_age, self.breed, self.weight, self.pet_id))
+                Pet._reserve_open_stays(cursor, self.pet_id, self.pet_type)
+                DailyStats.add(cursor, "b.pet_id = %s", (self.pet_id,))
+                version = SessionCache.bump(cursor, 'Pet')
+            else:
+                sql = "INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight) VALUES (%s, %s, %s, %s, %s, %s)"
+                cursor.execute(sql, (self.customer_id, self.pet_name, self.pet_type, self.pet_age, self.breed, self.weight))
+                self.pet_id = cursor.lastrowid
+
+            cursor.close()
+        if version is not None:
+            Pet._forget(db, self.pet_id, version)
+        return self.pet_id
+    
+    def delete(self, db):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            # free any space the pet is holding before its boardings cascade away
+            Capacity.release_for_pet(cursor, self.pet_id)
+            DailyStats.remove(cursor, "b.pet_id = %s", (self.pet_id,))
+            sql = "DELETE FROM Pet WHERE pet_id=%s"
+            cursor.execute(sql, (self.pet_id,))
+            affected_rows = cursor.rowcount
+            version = SessionCache.bump(cursor, 'Pet')
+            db.commit(conn)
+            cursor.close()
+        Pet._forget(db, self.pet_id, version)
+        return affected_rows > 0
+    
+    @staticmethod
+    def delete_by_id(db, pet_id):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            # free any space the pet is holding before its boardings cascade away
+            Capacity.release_for_pet(cursor, pet_id)
+            DailyStats.remove(cursor, "b.pet_id = %s", (pet_id,))
+            sql = "DELETE FROM Pet WHERE pet_id=%s"
+            cursor.execute(sql, (pet_id,))
+            affected_rows = cursor.rowcount
+            version = SessionCache.bump(cursor, 'Pet')
+            db.commit(conn)
+            cursor.close()
+        Pet._forget(db, pet_id, version)
+        return affected_rows > 0
+
+    # drop a changed or deleted pet from the row cache
+    @staticmethod
+    def _forget(db, pet_id, version):
+        Pet.forget_cached(db, [pet_id], version)
+
+    # for services that write Pet rows themselves (PurgeService): drop those
+    # pets from the row cache; version is what SessionCache.bump returned
+    @staticmethod
+    def forget_cached(db, pet_ids, version):
+        cache = session_cache(db)
+        if cache:
+            cache.wrote('Pet', version, pet_ids)
+
+    # keep rows that were read anyway so later lookups by id skip the database
+    @staticmethod
+    def _remember(cache, generation, pets):
+        if cache:
+            for pet in pets:
+                cache.put(pet['pet_id'], pet, generation)
+
+    # the row cache (or None) and its generation, taken before a read so
+    # rows fetched while a write was invalidating them are not cached
+    @staticmethod
+    def _reading(db):
+        cache = cached_rows(db, 'Pet')
+        return cache, cache.generation if cache else None
+
+    @staticmethod
+    def get_all(db):
+        cache, generation = Pet._reading(db)
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {PET_COLUMNS}
+                FROM Pet p
+                JOIN Customer c ON p.customer_id = c.customer_id
+                ORDER BY p.pet_name
+            """)
+            pets = PetRecord.fetchall(cursor)
+            cursor.close()
+        Pet._remember(cache, generation, pets)
+        return pets
+
+    # one page of the pet list in (pet_name, pet_id) order, starting after
+    # the key of the last row already shown
+    @staticmethod
+    def get_page(db, after=None, limit=100):
+        cache, generation = Pet._reading(db)
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            if after is None:
+                cursor.execute(f"""
+                    SELECT {PET_COLUMNS}
+                    FROM Pet p
+                    JOIN Customer c ON p.customer_id = c.customer_id
+                    ORDER BY p.pet_name, p.pet_id
+                    LIMIT %s
+                """, (limit,))
+            else:
+                cursor.execute(f"""
+                    SELECT {PET_COLUMNS}
+                    FROM Pet p
+                    JOIN Customer c ON p.customer_id = c.customer_id
+                    WHERE (p.pet_name, p.pet_id) > (%s, %s)
+                    ORDER BY p.pet_name, p.pet_id
+                    LIMIT %s
+                """, (*after, limit))
+            pets = PetRecord.fetchall(cursor)
+            cursor.close()
+        Pet._remember(cache, generation, pets)
+        return pets
+
+    # seek key of a pet row, as passed back to get_page(after=...)
+    @staticmethod
+    def page_key(pet):
+        return (pet['pet_name'], pet['pet_id'])
+
+    # pets by id with owner names (cached ones are not re-read)
+    @staticmethod
+    def get_by_ids(db, pet_ids):
+        cache, generation = Pet._reading(db)
+        found, missing = cache.get_many(pet_ids) if cache else ({}, list(pet_ids))
+        if not missing:
+            return list(found.values())
+        placeholders = ", ".join(["%s"] * len(missing))
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {PET_COLUMNS}
+                FROM Pet p
+                JOIN Customer c ON p.customer_id = c.customer_id
+                WHERE p.pet_id IN ({placeholders})
+            """, tuple(missing))
+            pets = PetRecord.fetchall(cursor)
+            cursor.close()
+        Pet._remember(cache, generation, pets)
+        return list(found.values()) + pets
+
+    # one pet with its owner's name, or None
+    @staticmethod
+    def get_by_id(db, pet_id):
+        cache, generation = Pet._reading(db)
+        pet = cache.get(pet_id) if cache else None
+        if pet is not None:
+            return pet
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {PET_COLUMNS}
+                FROM Pet p
+                JOIN Customer c ON p.customer_id = c.customer_id
+                WHERE p.pet_id = %s
+            """, (pet_id,))
+            pet = PetRecord.fetchone(cursor)
+            cursor.close()
+        if pet and cache:
+            cache.put(pet_id, pet, generation)
+        return pet
+
+    # iterate over every pet one page at a time
+    @staticmethod
+    def iter_all(db, page_size=500):
+        after = None
+        while True:
+            page = Pet.get_page(db, after, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = Pet.page_key(page[-1])
+
+    @staticmethod
+    def create(db, pet_data):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            sql = "INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight) VALUES (%s, %s, %s, %s, %s, %s)"
+            cursor.execute(sql, (
+                pet_data.get('customer_id'),
+                pet_data.get('pet_name', ''),
+                pet_data.get('pet_type', ''),
+                pet_data.get('pet_age', 0),
+                pet_data.get('breed', ''),
+                pet_data.get('weight', 0)
+            ))
+            db.commit(conn)
+            pet_id = cursor.lastrowid
+            cursor.close()
+        return pet_id
+
+    # insert many pets in one transaction and return their ids in input order.
+    # every row must pass the add-pet rules first; if any fails a ValueError
+    # names the bad rows and nothing is written. an unknown owner fails the
+    # foreign key and rolls the whole batch back
+    @staticmethod
+    def create_many(db, pets, chunk_size=bulk.DEFAULT_CHUNK_SIZE):
+        pets = list(pets)
+        bulk.validate_rows(pets, validate_pet, "pet")
+        rows = [(p['customer_id'], p['pet_name'].strip(), p['pet_type'].strip().lower(), int(p['pet_age']),
+                 p['breed'].strip(), float(p['weight']))
+                for p in pets]
+        if not rows:
+            return []
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            pet_ids = bulk.insert_many(db, cursor, "Pet",
+                                       ("customer_id", "pet_name", "pet_type", "pet_age", "breed", "weight"),
+                                       rows, chunk_size)
+            cursor.close()
+        return pet_ids
+
+    # raises CapacityFullError (and changes nothing) when a boarded pet is
+    # moved to a type with no free space
+    @staticmethod
+    def update(db, pet_id, pet_data):
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            # move an open boarding to the other counter if the pet type changes
+            Capacity.release_for_pet(cursor, pet_id)
+            DailyStats.remove(cursor, "b.pet_id = %s", (pet_id,))
+            sql = "UPDATE Pet SET customer_id=%s, pet_name=%s, pet_type=%s, pet_age=%s, breed=%s, weight=%s WHERE pet_id=%s"
+            cursor.execute(sql, (
+                pet_data.get('customer_id'),
+                pet_data.get('pet_name', ''),
+                pet_data.get('pet_type', ''),
+                pet_data.get('pet_age', 0),
+                pet_data.get('breed', ''),
+                pet_data.get('weight', 0),
+                pet_id
+            ))
+            Pet._reserve_open_stays(cursor, pet_id, pet_data.get('pet_type', ''))
+            DailyStats.add(cursor, "b.pet_id = %s", (pet_id,))
+            version = SessionCache.bump(cursor, 'Pet')
+            cursor.close()
+        Pet._forget(db, pet_id, version)
+        return True
+
+    # claim spaces of the pet's type for its open boardings, after
+    # release_for_pet gave up the old ones; a full type raises, so the
+    # enclosing transaction rolls the whole edit back
+    @staticmethod
+    def _reserve_open_stays(cursor, pet_id, pet_type):
+        # imported here: services.boarding_service imports this module
+        from services.boarding_service import BoardingService
+        pet_type = pet_type.lower()
+        if not Capacity.reserve_for_pet(cursor, pet_id, pet_type, BoardingService.get_total_spaces(pet_type)):
+            raise CapacityFullError(f"No spaces available for {pet_type}s: "
+                                    "this pet is boarded and would need one")
+
+    # get occupancy from the Capacity counters (two primary-key rows)
+    @staticmethod
+    def get_occupied_spaces(db):
+        return Capacity.get_occupied(db)
\ No newline at end of file
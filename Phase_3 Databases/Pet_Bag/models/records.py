@@ -0,0 +1,89 @@
+# models/records.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Compact row types for Customer, Pet, Boarding, Grooming and report rows
+# 2026-10-18: Added so list and report reads stop allocating a dict per row
+#
+# each type is a namedtuple (fields in a fixed tuple, no per-row __dict__)
+# that still answers row['column'], row.get('column') and dict(row), so the
+# controllers and dialogs written against dictionary cursors keep working.
+# queries list the columns in COLUMNS order and build records straight from
+# a plain tuple cursor:
+#   cursor = conn.cursor()
+#   cursor.execute(f"SELECT {CustomerRecord.select('c')} FROM Customer c ...")
+#   customers = CustomerRecord.fetchall(cursor)
+# records are immutable, which also makes them safe to share from the row cache
+
+from collections import namedtuple
+
+def record_type(name, columns):
+    base = namedtuple(name, columns)
+
+    class Record(base):
+        __slots__ = ()
+        COLUMNS = base._fields
+
+        def __getitem__(self, key):
+            if isinstance(key, str):
+                try:
+                    return getattr(self, key)
+                except AttributeError:
+                    raise KeyError(key) from None
+            return base.__getitem__(self, key)
+
+        def get(self, key, default=None):
+            return getattr(self, key, default)
+
+        def keys(self):
+            return self._fields
+
+        # column list for a SELECT, optionally qualified with a table alias
+        @classmethod
+        def select(cls, alias=None):
+            prefix = f"{alias}." if alias else ""
+            return ", ".join(prefix + column for column in cls.COLUMNS)
+
+        @classmethod
+        def fetchall(cls, cursor):
+            return list(map(cls._make, cursor.fetchall()))
+
+        @classmethod
+        def fetchone(cls, cursor):
+            row = cursor.fetchone()
+            return cls._make(row) if row is not None else None
+
+    Record.__name__ = Record.__qualname__ = name
+    return Record
+
+CustomerRecord = record_type("CustomerRecord", [
+    "customer_id", "first_name", "last_name", "phone", "email"])
+
+# pets are always read with their owner's name
+PetRecord = record_type("PetRecord", [
+    "pet_id", "customer_id", "pet_name", "pet_type", "pet_age", "breed", "weight",
+    "first_name", "last_name"])
+PET_COLUMNS = ("p.pet_id, p.customer_id, p.pet_name, p.pet_type, p.pet_age, p.breed, p.weight, "
+               "c.first_name, c.last_name")
+
+# an open boarding with the pet and owner details the check-out dialog shows
+BoardingRecord = record_type("BoardingRecord", [
+    "boarding_id", "pet_id", "check_in", "check_out", "days_stay", "amount_due", "grooming_requested",
+    "pet_name", "pet_type", "weight", "first_name", "last_name"])
+BOARDING_COLUMNS = ("b.boarding_id, b.pet_id, b.check_in, b.check_out, b.days_stay, b.amount_due, "
+                    "b.grooming_requested, p.pet_name, p.pet_type, p.weight, c.first_name, c.last_name")
+
+GroomingRecord = record_type("GroomingRecord", [
+    "grooming_id", "boarding_id", "pet_id", "service_date", "service_type", "price"])
+
+# report rows, one per day or pet type
+OccupancyDay = record_type("OccupancyDay", [
+    "date", "total_boardings", "dog_count", "cat_count", "avg_stay_duration"])
+RevenueDay = record_type("RevenueDay", [
+    "date", "total_boardings", "daily_revenue", "dog_revenue", "cat_revenue",
+    "grooming_count", "grooming_revenue"])
+PetTypeRevenue = record_type("PetTypeRevenue", [
+    "pet_type", "count", "revenue", "avg_revenue"])
+
+# pets in the building one night, and the share of each type's spaces used
+OccupancyNight = record_type("OccupancyNight", [
+    "night", "dogs", "cats", "total", "dog_rate", "cat_rate", "rate"])
\ No newline at end of file
@@ -0,0 +1,94 @@
+# models/report.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Structured report result - sections of metrics and tables - shared by every output format
+# 2026-10-18: Added so a report is computed once and rendered as text, CSV, JSON or HTML
+# 2026-10-18: A report served from the report cache carries its age
+# 2026-10-18: A report that counts nights says how many its period covers
+#
+# ReportService builds a Report; services/report_renderers.py turns it into
+# output. values stay raw (numbers, dates) so CSV and JSON export them as
+# data, and each metric or column carries the format spec the text and HTML
+# renderers apply:
+#   Metric("total_revenue", "Total Revenue", 1234.5, "${:,.2f}")   -> Total Revenue: $1,234.50
+#   Metric("dogs", "Dogs", {'occupied': 3, 'capacity': 30}, "{occupied}/{capacity} spaces")
+# a section is a titled run of items (metrics and tables) in display order
+
+class Metric:
+    # indent nests the metric under the one before it; marker (e.g. a
+    # bullet) goes in front of the label in the text layout
+    def __init__(self, key, label, value, fmt="{}", indent=0, marker=""):
+        self.key = key
+        self.label = label
+        self.value = value
+        self.fmt = fmt
+        self.indent = indent
+        self.marker = marker
+
+    # display text of the value; a dict value fills named fields of fmt
+    @property
+    def text(self):
+        if self.value is None:
+            return ""
+        if isinstance(self.value, dict):
+            return self.fmt.format(**self.value)
+        return self.fmt.format(self.value)
+
+class Column:
+    # spec formats the cell value (e.g. ".1f", ",.2f"); prefix goes in front
+    # of it and width pads the whole cell in the text layout
+    def __init__(self, key, label, width, spec="", prefix=""):
+        self.key = key
+        self.label = label
+        self.width = width
+        self.spec = spec
+        self.prefix = prefix
+
+    def cell(self, value):
+        if value is None:
+            value = 0 if self.spec else ""
+        text = format(value, self.spec) if self.spec else str(value)
+        return self.prefix + text
+
+class Table:
+    # rows are tuples (or records) in column order
+    def __init__(self, key, columns, rows):
+        self.key = key
+        self.columns = columns
+        self.rows = rows
+
+class Section:
+    # title None runs the items on under the previous section; width is the
+    # length of the rule under the title (and around a table's rows)
+    def __init__(self, key, title, width=40, items=None):
+        self.key = key
+        self.title = title
+        self.width = width
+        self.items = items if items is not None else []
+
+    def add(self, item):
+        self.items.append(item)
+        return item
+
+    def metric(self, key, label, value, fmt="{}", indent=0, marker=""):
+        return self.add(Metric(key, label, value, fmt, indent, marker))
+
+class Report:
+    def __init__(self, kind, title, start_date, end_date, period_days, generated):
+        self.kind = kind
+        self.title = title
+        self.start_date = start_date
+        self.end_date = end_date
+        self.period_days = period_days
+        self.generated = generated
+        self.cache_age = None  # seconds since it was computed, when served from the cache
+        self.nights = None  # nights counted (start to end inclusive), for the occupancy report
+        self.sections = []
+
+    def section(self, key, title, width=40):
+        section = Section(key, title, width)
+        self.sections.append(section)
+        return section
+
+    def default_filename(self, extension):
+        return f"petbag_{self.kind}_report_{self.generated.strftime('%Y%m%d_%H%M%S')}{extension}"
\ No newline at end of file
@@ -0,0 +1,207 @@
+# models/row_cache.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Session-level identity map of Customer and Pet rows keyed by primary key
+# 2026-10-18: Added so dialogs and list refreshes stop re-reading rows that have not changed
+# 2026-10-18: A read that raced an invalidation no longer caches the row it fetched
+#
+# reads fill the cache and writes go through it: save/create/update/delete
+# drop the rows they touched (and pets of a changed or deleted customer,
+# whose rows carry the owner's name) right after they commit.
+#
+# other terminals are caught with the DataVersion table: every update or
+# delete bumps its table's counter in the writing transaction. at most once
+# every ROW_CACHE_POLL_SECONDS a read compares the counters (two primary-key
+# rows) with the last ones seen; a change this session did not make clears
+# that table's cache. inserts never make a cached row stale, so they skip it.
+#
+# a worker thread can fetch a row just before a write commits and cache it
+# just after wrote() dropped it. every invalidation bumps the table's
+# generation, so readers note it before the query and put() skips rows read
+# under an older one.
+#
+# cached rows are shared between callers: treat them as read-only
+
+import time
+import weakref
+import threading
+from collections import OrderedDict
+from config import config
+
+class RowCache:
+    # LRU map of primary key -> row for one table
+    def __init__(self, table, maxsize):
+        self.table = table
+        self.maxsize = maxsize
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()  # worker threads read while the Tk thread writes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0  # bumped by every invalidation
+
+    def get(self, key):
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                self.misses += 1
+                return None
+            self._rows.move_to_end(key)
+            self.hits += 1
+            return row
+
+    # split keys into ({key: cached row}, [keys to fetch])
+    def get_many(self, keys):
+        found = {}
+        missing = []
+        for key in keys:
+            row = self.get(key)
+            if row is None:
+                missing.append(key)
+            else:
+                found[key] = row
+        return found, missing
+
+    # generation is the one read before the row was fetched; None always stores
+    def put(self, key, row, generation=None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._rows[key] = row
+            self._rows.move_to_end(key)
+            while len(self._rows) > self.maxsize:
+                self._rows.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys):
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                if self._rows.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def invalidate_where(self, predicate):
+        with self._lock:
+            self.generation += 1
+            stale = [key for key, row in self._rows.items() if predicate(row)]
+            for key in stale:
+                del self._rows[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._rows)
+            self._rows.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._rows),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+
+class SessionCache:
+    TABLES = ('Customer', 'Pet')
+    # Pet rows include the owner's name, so a customer change also stales pets
+    DEPENDENTS = {'Customer': ('Pet',), 'Pet': ()}
+
+    def __init__(self, maxsize, poll_seconds):
+        self.tables = {table: RowCache(table, maxsize) for table in SessionCache.TABLES}
+        self.poll_seconds = poll_seconds
+        self.versions = {}  # table -> last DataVersion counter seen
+        self.remote_changes = 0
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def rows(self, db, table):
+        self.sync(db)
+        return self.tables[table]
+
+    def sync(self, db, force=False):
+        # compare the change counters with the ones last seen, if due
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._checked_at is not None and now - self._checked_at < self.poll_seconds:
+                return
+            self._checked_at = now
+
+        try:
+            with db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT table_name, version FROM DataVersion")
+                current = {table: version for table, version in cursor.fetchall()}
+                cursor.close()
+        except Exception as e:
+            # without the counters nothing cached can be trusted
+            print(f"Error reading data versions: {e}")
+            current = {}
+
+        with self._lock:
+            for table in SessionCache.TABLES:
+                version = current.get(table)
+                if table in self.versions and version == self.versions[table] and version is not None:
+                    continue
+                if table in self.versions:
+                    self.remote_changes += 1
+                for name in (table,) + SessionCache.DEPENDENTS[table]:
+                    self.tables[name].clear()
+                self.versions[table] = version
+
+    # bump a table's change counter on the writer's cursor, inside its
+    # transaction; returns the new counter for wrote()
+    @staticmethod
+    def bump(cursor, table):
+        cursor.execute("UPDATE DataVersion SET version = version + 1 WHERE table_name = %s", (table,))
+        cursor.execute("SELECT version FROM DataVersion WHERE table_name = %s", (table,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    # after this session's write commits: drop the rows it touched and, if
+    # nobody else wrote in between, adopt its counter so the next poll does
+    # not clear the whole table for a change already applied here
+    def wrote(self, table, version, keys=(), where=None):
+        with self._lock:
+            if version is not None and self.versions.get(table) == version - 1:
+                self.versions[table] = version
+        self.tables[table].invalidate(keys)
+        if where is not None:
+            self.tables[table].invalidate_where(where)
+
+    def stats(self):
+        stats = {table: cache.stats() for table, cache in self.tables.items()}
+        stats['remote_changes'] = self.remote_changes
+        return stats
+
+    def format_stats(self):
+        lines = []
+        for table, cache in self.tables.items():
+            s = cache.stats()
+            lines.append(f"{table}: {s['hits']} hits, {s['misses']} misses ({s['hit_rate']:.0%}), "
+                         f"{s['size']} cached, {s['evictions']} evicted, {s['invalidations']} invalidated")
+        lines.append(f"changes from other terminals: {self.remote_changes}")
+        return "\n".join(lines)
+
+# one cache per DatabaseConnection, dropped with it
+_sessions = weakref.WeakKeyDictionary()
+_sessions_lock = threading.Lock()
+
+def session_cache(db):
+    # None when caching is turned off
+    if not config.ROW_CACHE_ENABLED:
+        return None
+    with _sessions_lock:
+        cache = _sessions.get(db)
+        if cache is None:
+            cache = SessionCache(config.ROW_CACHE_SIZE, config.ROW_CACHE_POLL_SECONDS)
+            _sessions[db] = cache
+    return cache
+
+def cached_rows(db, table):
+    cache = session_cache(db)
+    return cache.rows(db, table) if cache else None
\ No newline at end of file
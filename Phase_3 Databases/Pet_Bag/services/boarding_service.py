@@ -1,157 +1,301 @@
-# services/boarding_service.py
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: BoardingService handles check-in operations for 
-# 2026-01-31: Added weight-based grooming cost calculation and updated boarding prices
-
-from models.pet import Pet
-from datetime import date
-
-class BoardingService:
-    TOTAL_DOG_SPACES = 30
-    TOTAL_CAT_SPACES = 12
-    
-    # boarding prices per day
-    BOARDING_PRICES = {
-        'dog': 30,
-        'cat': 25
-    }
-    
-    # grooming price tiers by weight for dogs
-    GROOMING_PRICES = {
-        'small': {'min': 2, 'max': 20, 'price': 50},
-        'medium': {'min': 21, 'max': 50, 'price': 70},
-        'large': {'min': 51, 'max': 100, 'price': 90},
-        'extra_large': {'min': 101, 'max': float('inf'), 'price': 110}
-    }
-    
-    #calculate grooming price based on dog weight
-    @staticmethod
-    def calculate_grooming_price(weight):
-        
-        if weight < 2:  # Below minimum weight
-            return 0  # No grooming for very small dogs
-        
-        for tier, details in BoardingService.GROOMING_PRICES.items():
-            if details['min'] <= weight <= details['max']:
-                return details['price']
-        
-        # Default to extra large if weight exceeds all ranges
-        return BoardingService.GROOMING_PRICES['extra_large']['price']
-    
-    @staticmethod
-    def check_in_pet(db, pet_id, days_stay, grooming_requested=False):
-        try:
-            # get pet from database
-            cursor = db.connection.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM Pet WHERE pet_id = %s", (pet_id,))
-            pet_data = cursor.fetchone()
-            
-            if not pet_data:
-                cursor.close()
-                return False, "Pet not found"
-            
-            pet_type = pet_data['pet_type'].lower()
-            
-            # check space availability from database
-            occupied = Pet.get_occupied_spaces(db)
-            
-            if pet_type == "dog":
-                if occupied.get('dog', 0) >= BoardingService.TOTAL_DOG_SPACES:
-                    cursor.close()
-                    return False, "No spaces available for dogs"
-            elif pet_type == "cat":
-                if occupied.get('cat', 0) >= BoardingService.TOTAL_CAT_SPACES:
-                    cursor.close()
-                    return False, "No spaces available for cats"
-            else:
-                cursor.close()
-                return False, "Invalid pet type"
-            
-            # calculate boarding amount due
-            boarding_price = BoardingService.BOARDING_PRICES.get(pet_type, 0)
-            boarding_amount = boarding_price * days_stay
-            
-            # calculate total amount due
-            total_amount_due = boarding_amount
-            
-            # save boarding record
-            sql = """
-                INSERT INTO Boarding (pet_id, check_in, days_stay, amount_due, grooming_requested)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            cursor.execute(sql, (pet_id, date.today(), days_stay, total_amount_due, grooming_requested))
-            boarding_id = cursor.lastrowid
-            
-            # if grooming requested for dog staying 2+ days
-            if grooming_requested and pet_type == "dog" and days_stay >= 2:
-                # calculate grooming price based on weight
-                grooming_price = BoardingService.calculate_grooming_price(pet_data.get('weight', 0))
-                
-                if grooming_price > 0:
-                    # update boarding amount to include grooming
-                    total_with_grooming = boarding_amount + grooming_price
-                    cursor.execute("""
-                        UPDATE Boarding 
-                        SET amount_due = %s 
-                        WHERE boarding_id = %s
-                    """, (total_with_grooming, boarding_id))
-                    
-                    # create grooming record
-                    grooming_sql = """
-                        INSERT INTO Grooming (boarding_id, pet_id, service_date, service_type, price)
-                        VALUES (%s, %s, %s, %s, %s)
-                    """
-                    cursor.execute(grooming_sql, (boarding_id, pet_id, date.today(), "Full Grooming", grooming_price))
-            
-            db.connection.commit()
-            cursor.close()
-            
-            # build success message
-            message = f"{pet_data['pet_name']} checked in successfully!\n"
-            message += f"Space assigned. Boarding amount: ${boarding_amount:.2f}"
-            
-            if grooming_requested and pet_type == "dog" and days_stay >= 2:
-                grooming_price = BoardingService.calculate_grooming_price(pet_data.get('weight', 0))
-                if grooming_price > 0:
-                    message += f"\nGrooming service scheduled: ${grooming_price:.2f}"
-                    message += f"\nTotal amount due: ${boarding_amount + grooming_price:.2f}"
-                else:
-                    message += "\nNote: Dog is too small for grooming (minimum 2lbs required)"
-            elif grooming_requested:
-                if pet_type != "dog":
-                    message += "\nNote: Grooming only available for dogs"
-                elif days_stay < 2:
-                    message += "\nNote: Grooming only available for dogs staying 2+ days"
-            
-            return True, message
-            
-        except Exception as e:
-            # handle any error
-            return False, f"Check-in failed: {str(e)}"
-    
-    # calculate available spaces from database
-    @staticmethod
-    def get_available_spaces(db):
-        
-        occupied = Pet.get_occupied_spaces(db)
-        
-        return {
-            "dog_spaces": BoardingService.TOTAL_DOG_SPACES - occupied.get('dog', 0),
-            "cat_spaces": BoardingService.TOTAL_CAT_SPACES - occupied.get('cat', 0)
-        }
-    
-    @staticmethod
-    def get_current_boardings(db):
-        cursor = db.connection.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT b.*, p.pet_name, p.pet_type, p.weight, c.first_name, c.last_name
-            FROM Boarding b
-            JOIN Pet p ON b.pet_id = p.pet_id
-            JOIN Customer c ON p.customer_id = c.customer_id
-            WHERE b.check_out IS NULL
-            ORDER BY b.check_in DESC
-        """)
-        boardings = cursor.fetchall()
-        cursor.close()
-        return boardings
\ No newline at end of file
+# services/boarding_service.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: BoardingService handles check-in operations for 
+# 2026-01-31: Added weight-based grooming cost calculation and updated boarding prices
+# 2026-10-18: Borrow connections from the pool instead of a shared handle
+# 2026-10-18: Check-in increments the Capacity counter in the same transaction
+# 2026-10-18: Capacity check and boarding insert are one atomic reservation
+# 2026-10-18: Added admit() so a walk-in check-in commits owner, pet and boarding once
+# 2026-10-18: Check-ins run in a transaction() scope so they nest inside a caller's unit of work
+# 2026-10-18: admit() takes a confirmed owner or uses the indexed exact-name lookup
+# 2026-10-18: Current boardings and grooming rows are returned as compact records
+# 2026-10-18: Added record_history() to batch-insert finished stays for the CSV import
+# 2026-10-18: Check-ins and imported stays are added to the daily_stats rollup
+# 2026-10-18: check_in_pet() reads the pet with a plain cursor, which it hands on to DailyStats
+# 2026-10-18: Added MAX_STAY_DAYS, the longest stay booked at check-in or accepted by the import
+
+from models.pet import Pet
+from models.capacity import Capacity
+from models.records import BoardingRecord, BOARDING_COLUMNS, GroomingRecord
+from models import bulk
+from models.daily_stats import DailyStats
+from services.customer_lookup_service import CustomerLookupService
+from datetime import date
+
+class BoardingService:
+    TOTAL_DOG_SPACES = 30
+    TOTAL_CAT_SPACES = 12
+    # longest stay the check-in dialog books and the CSV import accepts; the
+    # occupancy report cache relies on no stay reaching further back
+    MAX_STAY_DAYS = 365
+    
+    # boarding prices per day
+    BOARDING_PRICES = {
+        'dog': 30,
+        'cat': 25
+    }
+    
+    # grooming price tiers by weight for dogs
+    GROOMING_PRICES = {
+        'small': {'min': 2, 'max': 20, 'price': 50},
+        'medium': {'min': 21, 'max': 50, 'price': 70},
+        'large': {'min': 51, 'max': 100, 'price': 90},
+        'extra_large': {'min': 101, 'max': float('inf'), 'price': 110}
+    }
+    
+    # capacity limit for a pet type, or None for unsupported types
+    @staticmethod
+    def get_total_spaces(pet_type):
+        if pet_type == "dog":
+            return BoardingService.TOTAL_DOG_SPACES
+        if pet_type == "cat":
+            return BoardingService.TOTAL_CAT_SPACES
+        return None
+    
+    #calculate grooming price based on dog weight
+    @staticmethod
+    def calculate_grooming_price(weight):
+        
+        if weight < 2:  # Below minimum weight
+            return 0  # No grooming for very small dogs
+        
+        for tier, details in BoardingService.GROOMING_PRICES.items():
+            if details['min'] <= weight <= details['max']:
+                return details['price']
+        
+        # Default to extra large if weight exceeds all ranges
+        return BoardingService.GROOMING_PRICES['extra_large']['price']
+    
+    # grooming price for a stay, or 0 when the stay does not qualify
+    @staticmethod
+    def get_grooming_price(pet_type, weight, days_stay, grooming_requested):
+        if grooming_requested and pet_type == "dog" and days_stay >= 2:
+            return BoardingService.calculate_grooming_price(weight or 0)
+        return 0
+    
+    # insert the boarding (amount already includes grooming) and its grooming
+    # row on the caller's cursor; returns (boarding_amount, grooming_price)
+    @staticmethod
+    def _insert_boarding(cursor, pet_id, pet_type, weight, days_stay, grooming_requested):
+        # calculate boarding amount due
+        boarding_price = BoardingService.BOARDING_PRICES.get(pet_type, 0)
+        boarding_amount = boarding_price * days_stay
+        grooming_price = BoardingService.get_grooming_price(pet_type, weight, days_stay, grooming_requested)
+        
+        # save boarding record with the final total so no follow-up UPDATE is needed
+        sql = """
+            INSERT INTO Boarding (pet_id, check_in, days_stay, amount_due, grooming_requested)
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        cursor.execute(sql, (pet_id, date.today(), days_stay, boarding_amount + grooming_price, grooming_requested))
+        boarding_id = cursor.lastrowid
+        
+        # create grooming record
+        if grooming_price > 0:
+            grooming_sql = """
+                INSERT INTO Grooming (boarding_id, pet_id, service_date, service_type, price)
+                VALUES (%s, %s, %s, %s, %s)
+            """
+            cursor.execute(grooming_sql, (boarding_id, pet_id, date.today(), "Full Grooming", grooming_price))
+        
+        DailyStats.add(cursor, "b.boarding_id = %s", (boarding_id,))
+        return boarding_amount, grooming_price
+    
+    # insert finished stays (check-in and check-out both known) in one
+    # transaction and return their boarding ids in input order. each stay is
+    # a dict with pet_id, pet_type, weight, check_in, check_out, days_stay,
+    # grooming_requested and optionally amount_due; missing amounts are priced
+    # like a check-in. open stays are refused: they hold a capacity space and
+    # must go through check_in_pet
+    @staticmethod
+    def record_history(db, stays, chunk_size=bulk.DEFAULT_CHUNK_SIZE):
+        stays = list(stays)
+        boardings = []
+        grooming_prices = []
+        for stay in stays:
+            if not stay.get('check_out'):
+                raise ValueError("Historical stays need a check-out date")
+            pet_type = stay['pet_type'].lower()
+            grooming_price = BoardingService.get_grooming_price(pet_type, stay['weight'], stay['days_stay'],
+                                                                stay['grooming_requested'])
+            amount_due = stay.get('amount_due')
+            if amount_due is None:
+                amount_due = BoardingService.BOARDING_PRICES.get(pet_type, 0) * stay['days_stay'] + grooming_price
+            boardings.append((stay['pet_id'], stay['check_in'], stay['check_out'], stay['days_stay'],
+                              amount_due, bool(stay['grooming_requested'])))
+            grooming_prices.append(grooming_price)
+        if not boardings:
+            return []
+        
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            boarding_ids = bulk.insert_many(db, cursor, "Boarding",
+                                            ("pet_id", "check_in", "check_out", "days_stay", "amount_due",
+                                             "grooming_requested"),
+                                            boardings, chunk_size)
+            grooming_rows = [(boarding_id, stay['pet_id'], stay['check_in'], "Full Grooming", price)
+                             for boarding_id, stay, price in zip(boarding_ids, stays, grooming_prices) if price > 0]
+            if grooming_rows:
+                cursor.executemany("""
+                    INSERT INTO Grooming (boarding_id, pet_id, service_date, service_type, price)
+                    VALUES (%s, %s, %s, %s, %s)
+                """, grooming_rows)
+            for start in range(0, len(boarding_ids), chunk_size):
+                chunk = boarding_ids[start:start + chunk_size]
+                DailyStats.add(cursor, f"b.boarding_id IN ({', '.join(['%s'] * len(chunk))})", chunk)
+            cursor.close()
+        return boarding_ids
+    
+    # build success message
+    @staticmethod
+    def _checkin_message(pet_name, pet_type, days_stay, grooming_requested, boarding_amount, grooming_price):
+        message = f"{pet_name} checked in successfully!\n"
+        message += f"Space assigned. Boarding amount: ${boarding_amount:.2f}"
+        
+        if grooming_requested and pet_type == "dog" and days_stay >= 2:
+            if grooming_price > 0:
+                message += f"\nGrooming service scheduled: ${grooming_price:.2f}"
+                message += f"\nTotal amount due: ${boarding_amount + grooming_price:.2f}"
+            else:
+                message += "\nNote: Dog is too small for grooming (minimum 2lbs required)"
+        elif grooming_requested:
+            if pet_type != "dog":
+                message += "\nNote: Grooming only available for dogs"
+            elif days_stay < 2:
+                message += "\nNote: Grooming only available for dogs staying 2+ days"
+        
+        return message
+    
+    @staticmethod
+    def check_in_pet(db, pet_id, days_stay, grooming_requested=False):
+        try:
+            with db.transaction() as conn:
+                # get pet from database
+                cursor = conn.cursor()
+                cursor.execute("SELECT pet_name, pet_type, weight FROM Pet WHERE pet_id = %s", (pet_id,))
+                pet_data = cursor.fetchone()
+                
+                if not pet_data:
+                    cursor.close()
+                    return False, "Pet not found"
+                
+                pet_name, pet_type, weight = pet_data
+                pet_type = pet_type.lower()
+                
+                total_spaces = BoardingService.get_total_spaces(pet_type)
+                if total_spaces is None:
+                    cursor.close()
+                    return False, "Invalid pet type"
+                
+                # claim a space and insert the boarding in one transaction so
+                # concurrent check-ins at other desks cannot overbook
+                if not Capacity.reserve(cursor, pet_type, total_spaces):
+                    cursor.close()
+                    return False, f"No spaces available for {pet_type}s"
+                
+                boarding_amount, grooming_price = BoardingService._insert_boarding(
+                    cursor, pet_id, pet_type, weight, days_stay, grooming_requested)
+                
+                cursor.close()
+            
+            return True, BoardingService._checkin_message(pet_name, pet_type, days_stay,
+                                                          grooming_requested, boarding_amount, grooming_price)
+            
+        except Exception as e:
+            # handle any error
+            return False, f"Check-in failed: {str(e)}"
+    
+    # walk-in check-in from the dialog: reserve a space, find or create the
+    # owner, create the pet and board it in one transaction with one commit.
+    # when the pet type is full nothing has been written, so a rejected
+    # check-in never leaves an orphaned customer or pet behind.
+    # customer_id boards for an owner the desk already confirmed; new_owner
+    # always creates one; otherwise an exact (normalized) name match is reused.
+    # returns (success, message, {'customer_id', 'pet_id'} or None)
+    @staticmethod
+    def admit(db, owner_name, pet_data, days_stay, grooming_requested=False, customer_id=None, new_owner=False):
+        pet_type = pet_data.get('pet_type', '').lower()
+        total_spaces = BoardingService.get_total_spaces(pet_type)
+        if total_spaces is None:
+            return False, "Invalid pet type", None
+        
+        try:
+            with db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                if not Capacity.reserve(cursor, pet_type, total_spaces):
+                    cursor.close()
+                    return False, f"No spaces available for {pet_type}s", None
+                
+                if customer_id is None and not new_owner:
+                    # indexed exact match on the normalized name
+                    matches = CustomerLookupService.exact_match_ids(cursor, owner_name)
+                    customer_id = matches[0] if matches else None
+                
+                if customer_id is None:
+                    first_name, last_name = CustomerLookupService.split_name(owner_name)
+                    cursor.execute(
+                        "INSERT INTO Customer (first_name, last_name, phone, email) VALUES (%s, %s, %s, %s)",
+                        (first_name, last_name, '', ''))
+                    customer_id = cursor.lastrowid
+                
+                cursor.execute(
+                    "INSERT INTO Pet (customer_id, pet_name, pet_type, pet_age, breed, weight) VALUES (%s, %s, %s, %s, %s, %s)",
+                    (customer_id, pet_data.get('pet_name', ''), pet_data.get('pet_type', ''),
+                     pet_data.get('pet_age', 0), pet_data.get('breed', ''), pet_data.get('weight', 0)))
+                pet_id = cursor.lastrowid
+                
+                boarding_amount, grooming_price = BoardingService._insert_boarding(
+                    cursor, pet_id, pet_type, pet_data.get('weight', 0), days_stay, grooming_requested)
+                
+                cursor.close()
+            
+            message = BoardingService._checkin_message(pet_data.get('pet_name', ''), pet_type, days_stay,
+                                                       grooming_requested, boarding_amount, grooming_price)
+            # ids let the caller refresh just the rows this admission touched
+            return True, message, {'customer_id': customer_id, 'pet_id': pet_id}
+        
+        except Exception as e:
+            # the transaction scope has already rolled the whole admission back
+            return False, f"Check-in failed: {str(e)}", None
+    
+    # calculate available spaces from database
+    @staticmethod
+    def get_available_spaces(db):
+        
+        occupied = Pet.get_occupied_spaces(db)
+        
+        return {
+            "dog_spaces": BoardingService.TOTAL_DOG_SPACES - occupied.get('dog', 0),
+            "cat_spaces": BoardingService.TOTAL_CAT_SPACES - occupied.get('cat', 0)
+        }
+    
+    @staticmethod
+    def get_current_boardings(db):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {BOARDING_COLUMNS}
+                FROM Boarding b
+                JOIN Pet p ON b.pet_id = p.pet_id
+                JOIN Customer c ON p.customer_id = c.customer_id
+                WHERE b.check_out IS NULL
+                ORDER BY b.check_in DESC
+            """)
+            boardings = BoardingRecord.fetchall(cursor)
+            cursor.close()
+        return boardings
+    
+    # the grooming service booked with a boarding, or None
+    @staticmethod
+    def get_grooming(db, boarding_id):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {GroomingRecord.select()} FROM Grooming
+                WHERE boarding_id = %s
+            """, (boarding_id,))
+            grooming = GroomingRecord.fetchone(cursor)
+            cursor.close()
+        return grooming
\ No newline at end of file
@@ -0,0 +1,143 @@
+# services/customer_lookup_service.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Find existing owners by name for check-in using the Customer name indexes
+# 2026-10-18: Added to replace the full-table substring scan in the check-in dialog
+#
+# three tiers, each answered from an index instead of reading every customer:
+#   exact  - normalized first + last name equal (idx_customer_name)
+#   prefix - names starting with what was typed (idx_customer_first / idx_customer_name)
+#   fuzzy  - typo-tolerant: customers sharing the first two letters of a name
+#            are fetched by prefix, then ranked by similarity in Python
+
+import difflib
+
+class CustomerLookupService:
+    CANDIDATE_LIMIT = 10
+    FUZZY_POOL = 200  # rows fetched per blocking prefix before ranking
+    FUZZY_MIN_SCORE = 0.6
+
+    COLUMNS = "customer_id, first_name, last_name, phone, email"
+
+    @staticmethod
+    def normalize(name):
+        # case and spacing never decide whether two names are the same person
+        return " ".join((name or "").lower().split())
+
+    @staticmethod
+    def split_name(name):
+        # first word is the first name, the rest is the last name
+        parts = (name or "").split()
+        if not parts:
+            return "", ""
+        return parts[0], " ".join(parts[1:])
+
+    @staticmethod
+    def _like_prefix(text):
+        # names are letters and spaces; drop anything LIKE would treat as a wildcard
+        return text.replace("%", "").replace("_", "").replace("\\", "") + "%"
+
+    @staticmethod
+    def full_name(customer):
+        return f"{customer['first_name']} {customer['last_name'] or ''}".strip()
+
+    # ids of customers whose normalized name equals owner_name, oldest first;
+    # takes the caller's cursor so admit() can run it inside its transaction
+    @staticmethod
+    def exact_match_ids(cursor, owner_name):
+        first_name, last_name = CustomerLookupService.split_name(owner_name)
+        cursor.execute("""
+            SELECT customer_id FROM Customer
+            WHERE last_name = %s AND first_name = %s
+            ORDER BY customer_id
+        """, (last_name, first_name))
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def find_candidates(db, owner_name, limit=None):
+        # ranked candidates: exact matches, then prefix matches, then fuzzy
+        # matches; each dict carries 'match' ('exact'/'prefix'/'fuzzy') and 'score'
+        limit = limit or CustomerLookupService.CANDIDATE_LIMIT
+        query = CustomerLookupService.normalize(owner_name)
+        if not query:
+            return []
+        first_name, last_name = CustomerLookupService.split_name(query)
+        columns = CustomerLookupService.COLUMNS
+
+        candidates = {}
+
+        def add(rows, match, score_of):
+            for row in rows:
+                if row['customer_id'] not in candidates:
+                    candidates[row['customer_id']] = dict(row, match=match, score=score_of(row))
+
+        with db.get_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+
+            cursor.execute(f"""
+                SELECT {columns} FROM Customer
+                WHERE last_name = %s AND first_name = %s
+                ORDER BY customer_id
+                LIMIT %s
+            """, (last_name, first_name, limit))
+            add(cursor.fetchall(), 'exact', lambda row: 1.0)
+
+            # prefix: "ann l" -> first name = ann, last name starts with l;
+            # a single word may be the start of either name
+            if last_name:
+                cursor.execute(f"""
+                    SELECT {columns} FROM Customer
+                    WHERE first_name = %s AND last_name LIKE %s
+                    ORDER BY last_name, customer_id
+                    LIMIT %s
+                """, (first_name, CustomerLookupService._like_prefix(last_name), limit))
+                add(cursor.fetchall(), 'prefix', lambda row: 0.9)
+            else:
+                cursor.execute(f"""
+                    SELECT {columns} FROM Customer
+                    WHERE first_name LIKE %s
+                    ORDER BY first_name, last_name
+                    LIMIT %s
+                """, (CustomerLookupService._like_prefix(first_name), limit))
+                add(cursor.fetchall(), 'prefix', lambda row: 0.9)
+                cursor.execute(f"""
+                    SELECT {columns} FROM Customer
+                    WHERE last_name LIKE %s
+                    ORDER BY last_name, first_name, customer_id
+                    LIMIT %s
+                """, (CustomerLookupService._like_prefix(first_name), limit))
+                add(cursor.fetchall(), 'prefix', lambda row: 0.85)
+
+            # fuzzy: block on the first two letters of each typed name, then
+            # rank the small pool by similarity of the whole normalized name
+            if len(candidates) < limit:
+                pool = []
+                cursor.execute(f"""
+                    SELECT {columns} FROM Customer
+                    WHERE first_name LIKE %s
+                    LIMIT %s
+                """, (CustomerLookupService._like_prefix(first_name[:2]), CustomerLookupService.FUZZY_POOL))
+                pool.extend(cursor.fetchall())
+                if last_name:
+                    cursor.execute(f"""
+                        SELECT {columns} FROM Customer
+                        WHERE last_name LIKE %s
+                        LIMIT %s
+                    """, (CustomerLookupService._like_prefix(last_name[:2]), CustomerLookupService.FUZZY_POOL))
+                    pool.extend(cursor.fetchall())
+
+                def similarity(row):
+                    name = CustomerLookupService.normalize(CustomerLookupService.full_name(row))
+                    return round(difflib.SequenceMatcher(None, query, name).ratio(), 3)
+
+                scored = [row for row in pool if row['customer_id'] not in candidates
+                          and similarity(row) >= CustomerLookupService.FUZZY_MIN_SCORE]
+                scored.sort(key=similarity, reverse=True)
+                add(scored, 'fuzzy', similarity)
+
+            cursor.close()
+
+        tiers = {'exact': 0, 'prefix': 1, 'fuzzy': 2}
+        ranked = sorted(candidates.values(),
+                        key=lambda c: (tiers[c['match']], -c['score'], CustomerLookupService.full_name(c).lower()))
+        return ranked[:limit]
\ No newline at end of file
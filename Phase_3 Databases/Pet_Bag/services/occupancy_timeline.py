@@ -0,0 +1,126 @@
+# services/occupancy_timeline.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Nightly occupancy per pet type from boarding intervals with a sweep line
+# 2026-10-18: Added so the occupancy report counts pets in the building each night, not check-ins
+# 2026-10-18: The longest stay is BoardingService.MAX_STAY_DAYS, shared with the importer
+# 2026-10-18: NumPy is listed in requirements-optional.txt
+#
+# a stay occupies the nights [check_in, end): end is the actual check_out,
+# or for a pet still boarded check_in + days_stay (at least through tonight,
+# since it has not left). each stay becomes a +1 event on its first night and
+# a -1 on the night after its last, clipped to the period; a running sum over
+# the events sorted by night gives the count for every night.
+#
+# the events are counted per night and only the distinct nights are sorted,
+# so a period costs O(n log n) in the stays read plus one step per night.
+# with NumPy installed (optional) the running sum is a bincount and cumsum
+# over the whole period instead; both give the same counts.
+#
+# only stays that end after the period starts are read: closed ones through
+# idx_boarding_open (check_out, pet_id), open ones through its NULL range
+
+from collections import Counter
+from datetime import date, timedelta
+from heapq import nlargest
+from models.records import OccupancyNight
+from services.boarding_service import BoardingService
+
+# optional (requirements-optional.txt)
+try:
+    import numpy
+except ImportError:  # the pure-Python sweep gives the same counts
+    numpy = None
+
+class OccupancyTimeline:
+    FETCH_SIZE = 1000
+    # below this many stays the Python sweep is as fast as converting to arrays
+    NUMPY_MIN_STAYS = 5000
+
+    # OccupancyNight rows for every night from start_date to end_date
+    # inclusive, in date order
+    @staticmethod
+    def nightly(db, start_date, end_date, today=None):
+        today = today or date.today()
+        nights = (end_date - start_date).days + 1
+        if nights <= 0:
+            return []
+
+        stays = OccupancyTimeline.load_stays(db, start_date, end_date, today)
+        dogs = OccupancyTimeline.sweep(*stays['dog'], nights)
+        cats = OccupancyTimeline.sweep(*stays['cat'], nights)
+
+        dog_spaces = BoardingService.TOTAL_DOG_SPACES
+        cat_spaces = BoardingService.TOTAL_CAT_SPACES
+        total_spaces = dog_spaces + cat_spaces
+        return [OccupancyNight(start_date + timedelta(days=night), dog_count, cat_count, dog_count + cat_count,
+                               dog_count / dog_spaces * 100, cat_count / cat_spaces * 100,
+                               (dog_count + cat_count) / total_spaces * 100)
+                for night, (dog_count, cat_count) in enumerate(zip(dogs, cats))]
+
+    # {pet type: ([first night], [night after the last])} as offsets from
+    # start_date, clipped to the period
+    @staticmethod
+    def load_stays(db, start_date, end_date, today=None):
+        today = today or date.today()
+        nights = (end_date - start_date).days + 1
+        stays = {'dog': ([], []), 'cat': ([], [])}
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT b.check_in, b.check_out, b.days_stay, p.pet_type
+                FROM Boarding b
+                JOIN Pet p ON p.pet_id = b.pet_id
+                WHERE (b.check_out > %s OR b.check_out IS NULL) AND b.check_in <= %s
+            """, (start_date, end_date))
+            while True:
+                rows = cursor.fetchmany(OccupancyTimeline.FETCH_SIZE)
+                if not rows:
+                    break
+                for check_in, check_out, days_stay, pet_type in rows:
+                    first = (check_in - start_date).days
+                    if check_out is not None:
+                        last = (check_out - start_date).days
+                    else:
+                        last = max(first + days_stay, (today - start_date).days + 1)
+                    first = max(first, 0)
+                    last = min(last, nights)
+                    pet_type = pet_type.lower()
+                    if first < last and pet_type in stays:
+                        starts, ends = stays[pet_type]
+                        starts.append(first)
+                        ends.append(last)
+            cursor.close()
+        return stays
+
+    # occupancy per night from +1/-1 events at the given night offsets
+    @staticmethod
+    def sweep(starts, ends, nights):
+        if numpy is not None and len(starts) >= OccupancyTimeline.NUMPY_MIN_STAYS:
+            deltas = (numpy.bincount(numpy.asarray(starts, dtype=numpy.int64), minlength=nights + 1)
+                      - numpy.bincount(numpy.asarray(ends, dtype=numpy.int64), minlength=nights + 1))
+            return numpy.cumsum(deltas[:nights]).tolist()
+
+        deltas = Counter(starts)
+        deltas.subtract(ends)
+        counts = []
+        current = 0
+        for night in sorted(deltas):
+            # nights before this event keep the running count
+            counts.extend([current] * (night - len(counts)))
+            current += deltas[night]
+        counts.extend([current] * (nights - len(counts)))
+        return counts[:nights]
+
+    # the busiest nights, most pets first (earlier night first on a tie)
+    @staticmethod
+    def peak_nights(nights, count=5, key='total'):
+        return nlargest(count, nights, key=lambda night: night[key])
+
+    # nights where a pet type used every space
+    @staticmethod
+    def nights_full(nights):
+        return {
+            'dog': sum(1 for night in nights if night.dogs >= BoardingService.TOTAL_DOG_SPACES),
+            'cat': sum(1 for night in nights if night.cats >= BoardingService.TOTAL_CAT_SPACES)
+        }
\ No newline at end of file
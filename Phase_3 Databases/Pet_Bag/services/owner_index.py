@@ -0,0 +1,94 @@
+# services/owner_index.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: In-memory prefix index of owner names for the typeahead owner picker
+# 2026-10-18: Added so owner dropdowns stay usable with thousands of customers
+#
+# every owner is stored under two keys, "first last" and "last first", in one
+# sorted list. a prefix search is a bisect to the first key starting with the
+# typed text plus a walk over the matches it returns: O(log N + k) per
+# keystroke no matter how many customers there are. the index is built once
+# on the background worker and then patched as customers change
+
+import bisect
+from models.customer import Customer
+
+class OwnerIndex:
+    def __init__(self, customers=()):
+        self._owners = {}  # customer_id -> {'customer_id', 'first_name', 'last_name'}
+        entries = []
+        for customer in customers:
+            owner = OwnerIndex.owner(customer)
+            self._owners[owner['customer_id']] = owner
+            entries.extend(OwnerIndex._entries(owner))
+        self._keys = sorted(entries)  # (search key, customer_id)
+
+    @staticmethod
+    def build(db, page_size=1000):
+        # runs on the worker: reads the customers page by page
+        return OwnerIndex(Customer.iter_all(db, page_size))
+
+    @staticmethod
+    def normalize(text):
+        return " ".join((text or "").lower().split())
+
+    @staticmethod
+    def owner(customer):
+        return {
+            'customer_id': customer['customer_id'],
+            'first_name': customer['first_name'],
+            'last_name': customer['last_name'] or ''
+        }
+
+    @staticmethod
+    def _entries(owner):
+        first = OwnerIndex.normalize(owner['first_name'])
+        last = OwnerIndex.normalize(owner['last_name'])
+        keys = {f"{first} {last}".strip(), f"{last} {first}".strip()}
+        return [(key, owner['customer_id']) for key in keys]
+
+    def __len__(self):
+        return len(self._owners)
+
+    def add(self, customer):
+        # insert or replace one owner (after a create or rename)
+        self.remove(customer['customer_id'])
+        owner = OwnerIndex.owner(customer)
+        self._owners[owner['customer_id']] = owner
+        for entry in OwnerIndex._entries(owner):
+            bisect.insort(self._keys, entry)
+
+    def remove(self, customer_id):
+        owner = self._owners.pop(customer_id, None)
+        if owner is None:
+            return
+        for entry in OwnerIndex._entries(owner):
+            index = bisect.bisect_left(self._keys, entry)
+            if index < len(self._keys) and self._keys[index] == entry:
+                del self._keys[index]
+
+    # apply a refresh: ids missing from rows were deleted
+    def update(self, customer_ids, rows):
+        found = {row['customer_id']: row for row in rows}
+        for customer_id in customer_ids:
+            if customer_id in found:
+                self.add(found[customer_id])
+            else:
+                self.remove(customer_id)
+
+    def search(self, text, limit=20):
+        # owners whose "first last" or "last first" starts with text, in key
+        # order; an owner matched by both keys is listed once
+        prefix = OwnerIndex.normalize(text)
+        matches = []
+        seen = set()
+        index = bisect.bisect_left(self._keys, (prefix,))
+        while index < len(self._keys) and len(matches) < limit:
+            key, customer_id = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            if customer_id not in seen:
+                seen.add(customer_id)
+                matches.append(self._owners[customer_id])
+            index += 1
+        return matches
\ No newline at end of file
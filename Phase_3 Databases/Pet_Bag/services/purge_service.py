@@ -0,0 +1,202 @@
+# services/purge_service.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Delete a customer or pet and their history in small batches
+# 2026-10-18: Added so deleting a kennel-chain account no longer locks Boarding for the whole cascade
+# 2026-10-18: Each batch also removes its stays from the daily_stats rollup
+# 2026-10-18: Deleted pets leave the row cache through Pet.forget_cached
+#
+# a single DELETE FROM Customer cascades through Pet -> Boarding -> Grooming
+# in one transaction, holding row locks on every boarding the customer ever
+# had while check-ins at other desks wait. the purge instead removes the
+# history bottom-up, BATCH_SIZE rows per short transaction:
+#   1. finished Boarding rows with their Grooming rows, taken out of the
+#      daily_stats rollup in the same transaction
+#   2. Grooming rows no longer tied to a stay
+#   3. the pets, releasing the capacity space of any pet still boarded
+#      (its open stay and grooming cascade with it - at most a few rows)
+#   4. the customer, through Customer.delete_by_id
+# an interrupted purge leaves only finished history removed, so running it
+# again picks up where it stopped. dry_run only counts what would go
+
+from models.capacity import Capacity
+from models.daily_stats import DailyStats
+from models.customer import Customer
+from models.pet import Pet
+from models.row_cache import SessionCache
+
+class PurgeService:
+    BATCH_SIZE = 500
+    TABLES = ("Grooming", "Boarding", "Pet", "Customer")
+
+    # rows a purge would delete, per table, plus the stays still open
+    @staticmethod
+    def count_customer(db, customer_id):
+        return PurgeService._count(db, "p.customer_id = %s", customer_id,
+                                   "SELECT COUNT(*) FROM Customer WHERE customer_id = %s")
+
+    @staticmethod
+    def count_pet(db, pet_id):
+        return PurgeService._count(db, "p.pet_id = %s", pet_id, None)
+
+    @staticmethod
+    def _count(db, pet_filter, key, customer_sql):
+        counts = {}
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT COUNT(g.grooming_id)
+                FROM Pet p
+                JOIN Grooming g ON g.pet_id = p.pet_id
+                WHERE {pet_filter}
+            """, (key,))
+            counts['Grooming'] = cursor.fetchone()[0]
+            cursor.execute(f"""
+                SELECT COUNT(b.boarding_id), COUNT(b.boarding_id) - COUNT(b.check_out)
+                FROM Pet p
+                JOIN Boarding b ON b.pet_id = p.pet_id
+                WHERE {pet_filter}
+            """, (key,))
+            counts['Boarding'], counts['open_boardings'] = cursor.fetchone()
+            cursor.execute(f"SELECT COUNT(*) FROM Pet p WHERE {pet_filter}", (key,))
+            counts['Pet'] = cursor.fetchone()[0]
+            if customer_sql:
+                cursor.execute(customer_sql, (key,))
+                counts['Customer'] = cursor.fetchone()[0]
+            cursor.close()
+        return counts
+
+    @staticmethod
+    def describe(counts):
+        parts = []
+        for table, label in (("Customer", "customer"), ("Pet", "pet"), ("Boarding", "boarding record"),
+                             ("Grooming", "grooming record")):
+            if table in counts:
+                count = counts[table]
+                parts.append(f"{count:,} {label}{'' if count == 1 else 's'}")
+        return ", ".join(parts)
+
+    # progress, if given, is called after every committed batch with
+    # (table, rows deleted so far, rows counted up front)
+    @staticmethod
+    def purge_customer(db, customer_id, batch_size=None, progress=None, dry_run=False):
+        batch_size = batch_size or PurgeService.BATCH_SIZE
+        try:
+            counts = PurgeService.count_customer(db, customer_id)
+            if not counts['Customer']:
+                return False, "Customer not found"
+            if dry_run:
+                return True, f"Would delete {PurgeService.describe(counts)}"
+
+            tracker = _Tracker(counts, progress)
+            pet_ids = PurgeService._pet_ids(db, customer_id)
+            for pet_id in pet_ids:
+                PurgeService._purge_history(db, pet_id, batch_size, tracker)
+            for start in range(0, len(pet_ids), batch_size):
+                PurgeService._delete_pets(db, pet_ids[start:start + batch_size], tracker)
+
+            # pets checked in since the list was read cascade with the customer
+            if not Customer.delete_by_id(db, customer_id):
+                return False, "Customer was deleted by another user"
+            tracker.deleted("Customer", 1)
+            return True, f"Deleted {PurgeService.describe(counts)}"
+        except Exception as e:
+            return False, f"Delete stopped: {str(e)}"
+
+    @staticmethod
+    def purge_pet(db, pet_id, batch_size=None, progress=None, dry_run=False):
+        batch_size = batch_size or PurgeService.BATCH_SIZE
+        try:
+            counts = PurgeService.count_pet(db, pet_id)
+            if not counts['Pet']:
+                return False, "Pet not found"
+            if dry_run:
+                return True, f"Would delete {PurgeService.describe(counts)}"
+
+            tracker = _Tracker(counts, progress)
+            PurgeService._purge_history(db, pet_id, batch_size, tracker)
+            PurgeService._delete_pets(db, [pet_id], tracker)
+            return True, f"Deleted {PurgeService.describe(counts)}"
+        except Exception as e:
+            return False, f"Delete stopped: {str(e)}"
+
+    @staticmethod
+    def _pet_ids(db, customer_id):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT pet_id FROM Pet WHERE customer_id = %s ORDER BY pet_id", (customer_id,))
+            pet_ids = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+        return pet_ids
+
+    # finished stays and their grooming, one batch per transaction; open
+    # stays stay put so an interrupted purge never breaks a check-out
+    @staticmethod
+    def _purge_history(db, pet_id, batch_size, tracker):
+        while True:
+            with db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT boarding_id FROM Boarding
+                    WHERE pet_id = %s AND check_out IS NOT NULL
+                    LIMIT %s
+                """, (pet_id, batch_size))
+                ids = [row[0] for row in cursor.fetchall()]
+                if ids:
+                    in_ids = f"IN ({', '.join(['%s'] * len(ids))})"
+                    DailyStats.remove(cursor, f"b.boarding_id {in_ids}", ids)
+                    cursor.execute(f"DELETE FROM Grooming WHERE boarding_id {in_ids}", ids)
+                    groomed = cursor.rowcount
+                    cursor.execute(f"DELETE FROM Boarding WHERE boarding_id {in_ids}", ids)
+                cursor.close()
+            if not ids:
+                break
+            tracker.deleted("Grooming", groomed)
+            tracker.deleted("Boarding", len(ids))
+
+        # grooming no longer tied to a stay (not in the rollup)
+        while True:
+            with db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT grooming_id FROM Grooming
+                    WHERE pet_id = %s AND boarding_id IS NULL
+                    LIMIT %s
+                """, (pet_id, batch_size))
+                ids = [row[0] for row in cursor.fetchall()]
+                if ids:
+                    cursor.execute(f"DELETE FROM Grooming WHERE grooming_id IN ({', '.join(['%s'] * len(ids))})", ids)
+                cursor.close()
+            if not ids:
+                break
+            tracker.deleted("Grooming", len(ids))
+
+    @staticmethod
+    def _delete_pets(db, pet_ids, tracker):
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM Boarding WHERE pet_id IN ({}) AND check_out IS NULL"
+                           .format(", ".join(["%s"] * len(pet_ids))), pet_ids)
+            open_stays = cursor.fetchone()[0]
+            for pet_id in pet_ids:
+                Capacity.release_for_pet(cursor, pet_id)
+            DailyStats.remove(cursor, "b.pet_id IN ({})".format(", ".join(["%s"] * len(pet_ids))), pet_ids)
+            cursor.execute("DELETE FROM Pet WHERE pet_id IN ({})".format(", ".join(["%s"] * len(pet_ids))), pet_ids)
+            deleted = cursor.rowcount
+            version = SessionCache.bump(cursor, 'Pet')
+            cursor.close()
+        Pet.forget_cached(db, pet_ids, version)
+        if open_stays:
+            tracker.deleted("Boarding", open_stays)
+        tracker.deleted("Pet", deleted)
+
+class _Tracker:
+    def __init__(self, counts, progress):
+        self.totals = counts
+        self.done = {table: 0 for table in PurgeService.TABLES}
+        self.progress = progress
+
+    def deleted(self, table, count):
+        self.done[table] += count
+        if self.progress:
+            self.progress(table, self.done[table], max(self.totals.get(table, 0), self.done[table]))
\ No newline at end of file
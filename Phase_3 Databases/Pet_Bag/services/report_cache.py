@@ -0,0 +1,212 @@
+# services/report_cache.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: TTL and LRU cache of computed reports keyed by (kind, start date, end date)
+# 2026-10-18: Added so regenerating a report, or opening it at another desk, skips the queries
+#
+# a cached Report is served again while it is younger than the TTL and the
+# rollup rows it covers are unchanged. every daily_stats change bumps a
+# DataVersion counter for the month it touched and one for the open stays
+# (see models/daily_stats.py); an entry remembers the counters of its period
+# as they were before it was computed, and a lookup compares them again -
+# a primary-key read of one row per month. a check-in or check-out changes
+# the open stays and so stales every report; an edit to old history only
+# stales the periods that include it.
+#
+# entries live in an in-memory LRU and, when REPORT_CACHE_DIR is set, as one
+# pickle per report in that directory, so other processes on the same
+# database reuse them (the same counters are checked before a file is
+# served). the least recently used files past REPORT_CACHE_SIZE are deleted.
+# the directory is the app's own: only point it somewhere other users
+# cannot write, since a pickle is trusted when it is loaded
+
+import copy
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from config import config
+from models.daily_stats import DailyStats
+
+class ReportCache:
+    def __init__(self, ttl_seconds, maxsize, directory=None, identity=None):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        # files are shared only between processes on the same database
+        self.directory = directory if identity else None
+        self.prefix = hashlib.sha1(identity.encode()).hexdigest()[:12] if identity else None
+        self._entries = OrderedDict()  # (kind, start, end) -> entry dict
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+        self.shared_hits = 0
+
+    # the counters a report over start..end depends on, read before computing
+    # it; since (earlier than start) widens them for reports that read stays
+    # begun before the period
+    def versions(self, db, start_date, end_date):
+        scopes = DailyStats.scopes(start_date, end_date)
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT table_name, version FROM DataVersion WHERE table_name IN ({})"
+                           .format(", ".join(["%s"] * len(scopes))), scopes)
+            current = {table: version for table, version in cursor.fetchall()}
+            cursor.close()
+        return {scope: current.get(scope, 0) for scope in scopes}
+
+    # a copy of the cached report with its age set, or None
+    def get(self, db, kind, start_date, end_date, since=None):
+        key = (kind, start_date, end_date)
+        versions = None
+        for shared in (False, True):
+            entry = self._load(key) if shared else self._memory_entry(key)
+            if entry is None:
+                continue
+            if time.time() - entry['computed_at'] > self.ttl_seconds:
+                self.expired += 1
+                self._discard(key, shared)
+                continue
+            if versions is None:
+                versions = self.versions(db, since or start_date, end_date)
+            if entry['versions'] != versions:
+                self.invalidations += 1
+                self._discard(key, shared)
+                continue
+
+            self.hits += 1
+            if shared:
+                self.shared_hits += 1
+                self._remember(key, entry)
+            report = copy.copy(entry['report'])
+            report.cache_age = time.time() - entry['computed_at']
+            return report
+        self.misses += 1
+        return None
+
+    def put(self, kind, start_date, end_date, report, versions):
+        key = (kind, start_date, end_date)
+        entry = {'report': report, 'computed_at': time.time(), 'versions': versions}
+        self._remember(key, entry)
+        self._save(key, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        for path in self._files():
+            self._remove(path)
+
+    def _memory_entry(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _discard(self, key, shared):
+        if shared:
+            self._remove(self._path(key))
+        else:
+            with self._lock:
+                self._entries.pop(key, None)
+
+    def _path(self, key):
+        kind, start_date, end_date = key
+        return os.path.join(self.directory, f"{self.prefix}-{kind}-{start_date}-{end_date}.pickle")
+
+    def _files(self):
+        if not self.directory:
+            return []
+        return glob.glob(os.path.join(self.directory, f"{self.prefix}-*.pickle"))
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            os.utime(path)  # mark it recently used for the LRU sweep
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading cached report {path}: {e}")
+            self._remove(path)
+            return None
+
+    # written to a temporary file and renamed, so a reader never sees half of one
+    def _save(self, key, entry):
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(handle, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except Exception as e:
+            print(f"Error saving cached report: {e}")
+            return
+
+        files = self._files()
+        if len(files) > self.maxsize:
+            files.sort(key=lambda path: self._mtime(path))
+            for path in files[:len(files) - self.maxsize]:
+                self._remove(path)
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'files': len(self._files()),
+            'hits': self.hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'expired': self.expired,
+            'invalidations': self.invalidations
+        }
+
+# one cache per DatabaseConnection, dropped with it
+_caches = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+def report_cache(db):
+    # None when caching is turned off
+    if not config.REPORT_CACHE_ENABLED:
+        return None
+    with _caches_lock:
+        cache = _caches.get(db)
+        if cache is None:
+            cache = ReportCache(config.REPORT_CACHE_TTL_SECONDS, config.REPORT_CACHE_SIZE,
+                                config.REPORT_CACHE_DIR or None, db.backend.identity(db.database))
+            _caches[db] = cache
+    return cache
\ No newline at end of file
@@ -0,0 +1,219 @@
+# services/report_renderers.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Text, CSV, JSON and HTML renderers for the structured reports in models/report.py
+# 2026-10-18: Added so one computed report can be shown on screen and exported in any format
+# 2026-10-18: The header says how old a report served from the cache is
+# 2026-10-18: The period line gives the nights counted alongside the days
+#
+# every renderer writes to a file-like object line by line instead of
+# concatenating one big string, so a report can go straight to a file:
+#   with open(path, "w", newline="", encoding="utf-8") as out:
+#       write_report(report, "csv", out)
+# or to a string through render(report, "text"), which uses io.StringIO
+
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from html import escape
+
+# "Generated: 2026-10-18 09:15:02", plus "(cached, 2m 05s old)" for a cache hit
+def _generated_line(report):
+    line = f"Generated: {report.generated.strftime('%Y-%m-%d %H:%M:%S')}"
+    if report.cache_age is not None:
+        minutes, seconds = divmod(int(report.cache_age), 60)
+        line += f" (cached, {minutes}m {seconds:02d}s old)" if minutes else f" (cached, {seconds}s old)"
+    return line
+
+# "Report Period: 2026-09-18 to 2026-10-18 (30 days, 31 nights)" - the nights
+# run from start to end inclusive, so a report that counts them says so
+def _period_line(report):
+    length = f"{report.period_days} days"
+    if report.nights is not None:
+        length += f", {report.nights} nights"
+    return f"Report Period: {report.start_date} to {report.end_date} ({length})"
+
+def write_text(report, out):
+    out.write(f"{report.title}\n")
+    out.write("=" * 60 + "\n")
+    out.write(_period_line(report) + "\n")
+    out.write(_generated_line(report) + "\n")
+    out.write("=" * 60 + "\n")
+
+    for section in report.sections:
+        out.write("\n")
+        if section.title:
+            out.write(f"{section.title}\n")
+            out.write("-" * section.width + "\n")
+        for item in section.items:
+            if hasattr(item, "columns"):
+                _write_text_table(item, section.width, out)
+            else:
+                text = item.text
+                marker = item.marker + " " if item.marker else ""
+                out.write(f"{'  ' * item.indent}{marker}{item.label}:{' ' + text if text else ''}\n")
+
+# each row goes through one str.format call built from the columns, e.g.
+# "{0!s:<12} {1!s:<10} ${2:<11,.2f}" - the prefix counts toward the width
+def _write_text_table(table, width, out):
+    out.write(" ".join(f"{column.label:<{column.width}}" for column in table.columns) + "\n")
+    out.write("-" * width + "\n")
+    row_format = " ".join(
+        f"{column.prefix}{{{index}:<{column.width - len(column.prefix)}{column.spec}}}" if column.spec
+        else f"{column.prefix}{{{index}!s:<{column.width - len(column.prefix)}}}"
+        for index, column in enumerate(table.columns)) + "\n"
+    for row in table.rows:
+        if None in row:
+            row = [0 if value is None and column.spec else value for column, value in zip(table.columns, row)]
+        out.write(row_format.format(*row))
+    out.write("-" * width + "\n")
+
+# CSV: a header block, then one (section, key, label, value) row per metric
+# (dict values one row per field), then each table under its own header row
+def write_csv(report, out):
+    writer = csv.writer(out)
+    writer.writerow(["report", report.kind])
+    writer.writerow(["period_start", report.start_date])
+    writer.writerow(["period_end", report.end_date])
+    writer.writerow(["period_days", report.period_days])
+    if report.nights is not None:
+        writer.writerow(["period_nights", report.nights])
+    writer.writerow(["generated", report.generated.isoformat(sep=" ", timespec="seconds")])
+    if report.cache_age is not None:
+        writer.writerow(["cache_age_seconds", round(report.cache_age)])
+
+    writer.writerow([])
+    writer.writerow(["section", "key", "label", "value"])
+    tables = []
+    for section in report.sections:
+        for item in section.items:
+            if hasattr(item, "columns"):
+                tables.append(item)
+            elif isinstance(item.value, dict):
+                for field, value in item.value.items():
+                    writer.writerow([section.key, f"{item.key}.{field}", item.label, value])
+            elif item.value is not None:
+                writer.writerow([section.key, item.key, item.label, item.value])
+
+    for table in tables:
+        writer.writerow([])
+        writer.writerow([table.key])
+        writer.writerow([column.key for column in table.columns])
+        writer.writerows(table.rows)
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def write_json(report, out):
+    sections = []
+    for section in report.sections:
+        items = []
+        for item in section.items:
+            if hasattr(item, "columns"):
+                items.append({
+                    'type': 'table',
+                    'key': item.key,
+                    'columns': [{'key': column.key, 'label': column.label} for column in item.columns],
+                    'rows': [dict(zip((column.key for column in item.columns), row)) for row in item.rows]
+                })
+            else:
+                items.append({'type': 'metric', 'key': item.key, 'label': item.label,
+                              'value': item.value, 'text': item.text})
+        sections.append({'key': section.key, 'title': section.title, 'items': items})
+
+    # json.dump encodes in chunks straight to out
+    json.dump({
+        'report': report.kind,
+        'title': report.title,
+        'period_start': report.start_date,
+        'period_end': report.end_date,
+        'period_days': report.period_days,
+        'period_nights': report.nights,
+        'generated': report.generated.replace(microsecond=0),
+        'cache_age_seconds': round(report.cache_age) if report.cache_age is not None else None,
+        'sections': sections
+    }, out, default=_json_value, indent=2)
+    out.write("\n")
+
+def write_html(report, out):
+    out.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+    out.write(f"<title>{escape(report.title.title())}</title>\n")
+    out.write("<style>body{font-family:Arial,sans-serif}table{border-collapse:collapse}"
+              "th,td{border:1px solid #ccc;padding:2px 8px}td.num{text-align:right}</style>\n")
+    out.write("</head>\n<body>\n")
+    out.write(f"<h1>{escape(report.title.title())}</h1>\n")
+    out.write(f"<p>{escape(_period_line(report))}<br>\n")
+    out.write(f"{escape(_generated_line(report))}</p>\n")
+
+    for section in report.sections:
+        if section.title:
+            out.write(f"<h2>{escape(section.title.title())}</h2>\n")
+        in_list = False
+        for item in section.items:
+            if hasattr(item, "columns"):
+                if in_list:
+                    out.write("</ul>\n")
+                    in_list = False
+                _write_html_table(item, out)
+                continue
+            if not in_list:
+                out.write("<ul>\n")
+                in_list = True
+            style = f" style=\"margin-left:{item.indent * 2}em\"" if item.indent else ""
+            out.write(f"<li{style}><b>{escape(item.label)}</b>: {escape(item.text)}</li>\n")
+        if in_list:
+            out.write("</ul>\n")
+    out.write("</body>\n</html>\n")
+
+def _write_html_table(table, out):
+    out.write("<table>\n<thead><tr>")
+    out.write("".join(f"<th>{escape(column.label)}</th>" for column in table.columns))
+    out.write("</tr></thead>\n<tbody>\n")
+    for row in table.rows:
+        out.write("<tr>")
+        for column, value in zip(table.columns, row):
+            numeric = isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+            out.write(f"<td class=\"num\">" if numeric else "<td>")
+            out.write(escape(column.cell(value)) + "</td>")
+        out.write("</tr>\n")
+    out.write("</tbody>\n</table>\n")
+
+# format name -> (writer, file extension)
+RENDERERS = {
+    'text': (write_text, ".txt"),
+    'csv': (write_csv, ".csv"),
+    'json': (write_json, ".json"),
+    'html': (write_html, ".html")
+}
+
+def write_report(report, fmt, out):
+    RENDERERS[fmt][0](report, out)
+
+def render(report, fmt="text"):
+    out = io.StringIO()
+    write_report(report, fmt, out)
+    return out.getvalue()
+
+# format for a file name by its extension (.htm counts as html), default text
+def format_for_path(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".htm":
+        return 'html'
+    for fmt, (_, fmt_extension) in RENDERERS.items():
+        if extension == fmt_extension:
+            return fmt
+    return 'text'
+
+def save_report(report, path, fmt=None):
+    fmt = fmt or format_for_path(path)
+    # csv.writer supplies its own line endings
+    with open(path, "w", newline="" if fmt == 'csv' else None, encoding="utf-8") as out:
+        write_report(report, fmt, out)
+    return fmt
\ No newline at end of file
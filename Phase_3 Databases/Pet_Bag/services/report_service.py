@@ -1,305 +1,318 @@
-# services/report_service.py
-# SNHU Course: CS-499 Capstone
-# Student Name: Yana Burlak
-# Description: Report Service for PetBag Boarding System
-
-from datetime import datetime, timedelta
-from models.pet import Pet
-from services.boarding_service import BoardingService
-
-class ReportService:
-    
-    #generate detailed occupancy report for the specified period
-    @staticmethod
-    def get_occupancy_report(db, period_days=30):
-        
-        cursor = db.connection.cursor(dictionary=True)
-        
-        # calculate date range
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=period_days)
-        
-        # get occupancy data
-        cursor.execute("""
-            SELECT 
-                DATE(b.check_in) as date,
-                COUNT(*) as total_boardings,
-                SUM(CASE WHEN p.pet_type = 'dog' THEN 1 ELSE 0 END) as dog_count,
-                SUM(CASE WHEN p.pet_type = 'cat' THEN 1 ELSE 0 END) as cat_count,
-                AVG(b.days_stay) as avg_stay_duration
-            FROM Boarding b
-            JOIN Pet p ON b.pet_id = p.pet_id
-            WHERE b.check_in BETWEEN %s AND %s
-            GROUP BY DATE(b.check_in)
-            ORDER BY DATE(b.check_in) DESC
-        """, (start_date, end_date))
-        daily_data = cursor.fetchall()
-        
-        # get current occupancy
-        cursor.execute("""
-            SELECT 
-                p.pet_type,
-                COUNT(*) as count
-            FROM Boarding b
-            JOIN Pet p ON b.pet_id = p.pet_id
-            WHERE b.check_out IS NULL
-            GROUP BY p.pet_type
-        """)
-        current_occupancy = cursor.fetchall()
-        
-        # get capacity 
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_current,
-                AVG(b.days_stay) as avg_days_stay
-            FROM Boarding b
-            WHERE b.check_out IS NULL
-        """)
-        current_stats = cursor.fetchone()
-        
-        cursor.close()
-        
-        # format the report
-        report = "OCCUPANCY REPORT\n"
-        report += "=" * 60 + "\n"
-        report += f"Report Period: {start_date} to {end_date} ({period_days} days)\n"
-        report += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        report += "=" * 60 + "\n\n"
-        
-        report += "CURRENT OCCUPANCY STATUS\n"
-        report += "-" * 40 + "\n"
-        
-        dog_count = 0
-        cat_count = 0
-        for occ in current_occupancy:
-            if occ['pet_type'].lower() == 'dog':
-                dog_count = occ['count']
-            else:
-                cat_count = occ['count']
-        
-        total_capacity = 42  # 30 dogs + 12 cats
-        current_total = dog_count + cat_count
-        occupancy_rate = (current_total / total_capacity) * 100 if total_capacity > 0 else 0
-        
-        report += f"Dogs: {dog_count}/30 spaces ({dog_count/30*100:.1f}% occupied)\n"
-        report += f"Cats: {cat_count}/12 spaces ({cat_count/12*100:.1f}% occupied)\n"
-        report += f"Total: {current_total}/42 spaces ({occupancy_rate:.1f}% occupied)\n"
-        report += f"Average Stay Duration: {current_stats['avg_days_stay'] or 0:.1f} days\n\n"
-        
-        # daily section
-        report += "DAILY OCCUPANCY BREAKDOWN\n"
-        report += "-" * 60 + "\n"
-        report += f"{'Date':<12} {'Total':<8} {'Dogs':<8} {'Cats':<8} {'Avg Stay':<10}\n"
-        report += "-" * 60 + "\n"
-        
-        total_boardings = 0
-        total_dogs = 0
-        total_cats = 0
-        
-        for day in daily_data:
-            date_str = str(day['date']) if day['date'] else "No Date"
-            
-            report += f"{date_str:<12} {day['total_boardings']:<8} "
-            report += f"{day['dog_count']:<8} {day['cat_count']:<8} "
-            report += f"{day['avg_stay_duration'] or 0:<10.1f}\n"
-            
-            total_boardings += day['total_boardings']
-            total_dogs += day['dog_count']
-            total_cats += day['cat_count']
-        
-        report += "-" * 60 + "\n"
-        
-        # summary section
-        report += "\nSUMMARY STATISTICS\n"
-        report += "-" * 40 + "\n"
-        
-        if len(daily_data) > 0:
-            avg_daily_boardings = total_boardings / len(daily_data)
-            dog_percentage = (total_dogs / total_boardings * 100) if total_boardings > 0 else 0
-            cat_percentage = (total_cats / total_boardings * 100) if total_boardings > 0 else 0
-            
-            report += f"Total Boardings: {total_boardings}\n"
-            report += f"Average Daily Boardings: {avg_daily_boardings:.1f}\n"
-            report += f"Dog Boardings: {total_dogs} ({dog_percentage:.1f}%)\n"
-            report += f"Cat Boardings: {total_cats} ({cat_percentage:.1f}%)\n"
-        
-        # peak days 
-        if len(daily_data) > 0:
-            peak_day = max(daily_data, key=lambda x: x['total_boardings'])
-            peak_date_str = str(peak_day['date']) if peak_day['date'] else "Unknown"
-            report += f"\nPeak Day: {peak_date_str} ({peak_day['total_boardings']} boardings)\n"
-        
-        return report
-    
-    #generate detailed revenue report for the specified period
-    @staticmethod
-    def get_revenue_report(db, period_days=30):
-        
-        cursor = db.connection.cursor(dictionary=True)
-        
-        # calculate date range
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=period_days)
-        
-        # get revenue data
-        cursor.execute("""
-            SELECT 
-                DATE(b.check_in) as date,
-                COUNT(*) as total_boardings,
-                SUM(b.amount_due) as daily_revenue,
-                SUM(CASE WHEN p.pet_type = 'dog' THEN b.amount_due ELSE 0 END) as dog_revenue,
-                SUM(CASE WHEN p.pet_type = 'cat' THEN b.amount_due ELSE 0 END) as cat_revenue,
-                SUM(CASE WHEN b.grooming_requested = 1 AND p.pet_type = 'dog' THEN 1 ELSE 0 END) as grooming_count,
-                SUM(CASE WHEN g.price IS NOT NULL THEN g.price ELSE 0 END) as grooming_revenue
-            FROM Boarding b
-            JOIN Pet p ON b.pet_id = p.pet_id
-            LEFT JOIN Grooming g ON b.boarding_id = g.boarding_id
-            WHERE b.check_in BETWEEN %s AND %s
-            GROUP BY DATE(b.check_in)
-            ORDER BY DATE(b.check_in) DESC
-        """, (start_date, end_date))
-        daily_data = cursor.fetchall()
-        
-        # get revenue by pet type
-        cursor.execute("""
-            SELECT 
-                p.pet_type,
-                COUNT(*) as count,
-                SUM(b.amount_due) as revenue,
-                AVG(b.amount_due) as avg_revenue
-            FROM Boarding b
-            JOIN Pet p ON b.pet_id = p.pet_id
-            WHERE b.check_in BETWEEN %s AND %s
-            GROUP BY p.pet_type
-        """, (start_date, end_date))
-        pet_type_revenue = cursor.fetchall()
-        
-        # get grooming revenue breakdown
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_grooming,
-                SUM(g.price) as total_grooming_revenue,
-                AVG(g.price) as avg_grooming_price
-            FROM Grooming g
-            JOIN Boarding b ON g.boarding_id = b.boarding_id
-            WHERE b.check_in BETWEEN %s AND %s
-        """, (start_date, end_date))
-        grooming_stats = cursor.fetchone()
-        
-        # get upcoming revenue 
-        cursor.execute("""
-            SELECT 
-                SUM(b.amount_due) as upcoming_revenue,
-                COUNT(*) as upcoming_count
-            FROM Boarding b
-            WHERE b.check_out IS NULL
-        """)
-        upcoming = cursor.fetchone()
-        
-        cursor.close()
-        
-        # format the report
-        report = "REVENUE REPORT\n"
-        report += "=" * 60 + "\n"
-        report += f"Report Period: {start_date} to {end_date} ({period_days} days)\n"
-        report += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        report += "=" * 60 + "\n\n"
-        
-        report += "CURRENT PRICING\n"
-        report += "-" * 40 + "\n"
-        report += f"Boarding - Dogs: ${BoardingService.BOARDING_PRICES['dog']}/day\n"
-        report += f"Boarding - Cats: ${BoardingService.BOARDING_PRICES['cat']}/day\n"
-        report += "Grooming - Dogs (by weight):\n"
-        for tier, details in BoardingService.GROOMING_PRICES.items():
-            max_weight = "and above" if details['max'] == float('inf') else details['max']
-            if details['max'] == float('inf'):
-                report += f"  {tier.title()} ({details['min']} lbs {max_weight}): ${details['price']}\n"
-            else:
-                report += f"  {tier.title()} ({details['min']}-{max_weight} lbs): ${details['price']}\n"
-        report += "\n"
-        
-        # summary section
-        report += "REVENUE SUMMARY\n"
-        report += "-" * 40 + "\n"
-        
-        total_revenue = 0
-        total_boardings = 0
-        total_grooming = 0
-        grooming_revenue = 0
-        
-        for day in daily_data:
-            total_revenue += day['daily_revenue'] or 0
-            total_boardings += day['total_boardings'] or 0
-            total_grooming += day['grooming_count'] or 0
-            grooming_revenue += day['grooming_revenue'] or 0
-        
-        boarding_revenue = total_revenue - grooming_revenue
-        
-        report += f"Total Boardings: {total_boardings}\n"
-        report += f"Total Revenue: ${total_revenue:,.2f}\n"
-        report += f"  • Boarding Revenue: ${boarding_revenue:,.2f}\n"
-        report += f"  • Grooming Revenue: ${grooming_revenue:,.2f}\n"
-        report += f"Grooming Services: {total_grooming}\n"
-        if grooming_stats and grooming_stats['total_grooming'] > 0:
-            report += f"Average Grooming Price: ${grooming_stats['avg_grooming_price'] or 0:,.2f}\n"
-        if total_boardings > 0:
-            report += f"Average Revenue per Booking: ${total_revenue/total_boardings:,.2f}\n"
-        else:
-            report += "Average Revenue per Booking: $0.00\n"
-        
-        #  by pet type
-        report += "\nREVENUE BY PET TYPE\n"
-        report += "-" * 40 + "\n"
-        
-        dog_rev = 0
-        cat_rev = 0
-        dog_count = 0
-        cat_count = 0
-        
-        for pet_type in pet_type_revenue:
-            if pet_type['pet_type'].lower() == 'dog':
-                dog_rev = pet_type['revenue'] or 0
-                dog_count = pet_type['count'] or 0
-                dog_avg = pet_type['avg_revenue'] or 0
-            else:
-                cat_rev = pet_type['revenue'] or 0
-                cat_count = pet_type['count'] or 0
-                cat_avg = pet_type['avg_revenue'] or 0
-        
-        report += f"Dogs: {dog_count} boardings, ${dog_rev:,.2f} revenue (avg ${dog_avg:,.2f})\n"
-        report += f"Cats: {cat_count} boardings, ${cat_rev:,.2f} revenue (avg ${cat_avg:,.2f})\n"
-        
-        # daily section
-        report += "\nDAILY REVENUE BREAKDOWN\n"
-        report += "-" * 80 + "\n"
-        report += f"{'Date':<12} {'Boardings':<10} {'Revenue':<12} {'Dogs':<10} {'Cats':<10} {'Grooming':<10}\n"
-        report += "-" * 80 + "\n"
-        
-        for day in daily_data:
-            date_str = str(day['date']) if day['date'] else "No Date"
-            
-            report += f"{date_str:<12} {day['total_boardings']:<10} "
-            report += f"${day['daily_revenue'] or 0:<11,.2f} "
-            report += f"${day['dog_revenue'] or 0:<10,.2f} "
-            report += f"${day['cat_revenue'] or 0:<10,.2f} "
-            report += f"{day['grooming_count'] or 0:<10}\n"
-        
-        report += "-" * 80 + "\n"
-        
-        report += "\nFINANCIAL METRICS\n"
-        report += "-" * 40 + "\n"
-        
-        if len(daily_data) > 0:
-            avg_daily_revenue = total_revenue / len(daily_data)
-            report += f"Average Daily Revenue: ${avg_daily_revenue:,.2f}\n"
-            report += f"Projected Monthly Revenue: ${avg_daily_revenue * 30:,.2f}\n"
-            report += f"Projected Annual Revenue: ${avg_daily_revenue * 365:,.2f}\n"
-        
-        # upcoming revenue
-        if upcoming and upcoming['upcoming_revenue']:
-            report += f"\nUPCOMING REVENUE (Current Boardings)\n"
-            report += "-" * 40 + "\n"
-            report += f"Pending Boardings: {upcoming['upcoming_count'] or 0}\n"
-            report += f"Pending Revenue: ${upcoming['upcoming_revenue'] or 0:,.2f}\n"
-        
+# services/report_service.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Report Service for PetBag Boarding System
+# 2026-10-18: Borrow connections from the pool instead of a shared handle
+# 2026-10-18: Current occupancy comes from the Capacity counters
+# 2026-10-18: Report rows are compact records read from a tuple cursor
+# 2026-10-18: Both reports read the daily_stats rollup instead of grouping Boarding
+# 2026-10-18: Each report is built from one streamed pass over the rollup rows
+# 2026-10-18: Reports are built as structured Report objects; report_renderers formats them
+# 2026-10-18: Reports are served from the report cache while their period is unchanged
+# 2026-10-18: Occupancy report shows pets boarded per night from the sweep-line timeline
+# 2026-10-18: The occupancy cache lookback uses BoardingService.MAX_STAY_DAYS
+# 2026-10-18: Occupancy report states the number of nights its nightly figures cover
+
+from datetime import datetime, timedelta
+from models.pet import Pet
+from models.records import OccupancyDay, RevenueDay, PetTypeRevenue
+from models.daily_stats import DailyStat
+from models.report import Report, Table, Column
+from services.report_cache import report_cache
+from services.report_renderers import render
+from services.boarding_service import BoardingService
+from services.occupancy_timeline import OccupancyTimeline
+
+class ReportService:
+    FETCH_SIZE = 500
+    
+    # stream the rollup rows of the period, plus any row that still has open
+    # stays, with one query; reports accumulate every section from this pass
+    @staticmethod
+    def _rollup_rows(db, start_date, end_date):
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {DailyStat.select()}
+                FROM daily_stats
+                WHERE stat_date BETWEEN %s AND %s OR open_boardings > 0
+            """, (start_date, end_date))
+            while True:
+                rows = cursor.fetchmany(ReportService.FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield DailyStat._make(row)
+            cursor.close()
+    
+    # report text as the Reports tab shows it
+    @staticmethod
+    def get_occupancy_report(db, period_days=30, cached=True):
+        return render(ReportService.build_occupancy_report(db, period_days, cached))
+    
+    @staticmethod
+    def get_revenue_report(db, period_days=30, cached=True):
+        return render(ReportService.build_revenue_report(db, period_days, cached))
+    
+    @staticmethod
+    def build_occupancy_report(db, period_days=30, cached=True):
+        # a stay that began up to MAX_STAY_DAYS before the period can still
+        # be in the building during it (longer stays are never booked or imported)
+        return ReportService._build(db, "occupancy", period_days, cached, ReportService._occupancy_report,
+                                    BoardingService.MAX_STAY_DAYS)
+    
+    @staticmethod
+    def build_revenue_report(db, period_days=30, cached=True):
+        return ReportService._build(db, "revenue", period_days, cached, ReportService._revenue_report)
+    
+    # serve the report from the cache, or compute and cache it; the change
+    # counters (of the period plus lookback_days before it) are read first
+    # so a write made while computing stales it
+    @staticmethod
+    def _build(db, kind, period_days, cached, compute, lookback_days=0):
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=period_days)
+        
+        cache = report_cache(db) if cached else None
+        if cache is None:
+            return compute(db, start_date, end_date, period_days)
+        since = start_date - timedelta(days=lookback_days)
+        report = cache.get(db, kind, start_date, end_date, since)
+        if report is None:
+            versions = cache.versions(db, since, end_date)
+            report = compute(db, start_date, end_date, period_days)
+            cache.put(kind, start_date, end_date, report, versions)
+        return report
+    
+    #generate detailed occupancy report for the specified period
+    @staticmethod
+    def _occupancy_report(db, start_date, end_date, period_days):
+        
+        # one pass over the rollup: per-day counts and the open stays
+        days = {}  # date -> [boardings, dogs, cats, stay days]
+        total_current = 0
+        open_stay_days = 0
+        for row in ReportService._rollup_rows(db, start_date, end_date):
+            total_current += row.open_boardings
+            open_stay_days += row.open_stay_days
+            if not row.boardings or not start_date <= row.stat_date <= end_date:
+                continue
+            day = days.setdefault(row.stat_date, [0, 0, 0, 0])
+            day[0] += row.boardings
+            if row.pet_type == 'dog':
+                day[1] += row.boardings
+            elif row.pet_type == 'cat':
+                day[2] += row.boardings
+            day[3] += row.stay_days
+        
+        daily_data = [OccupancyDay(date, total, dogs, cats, stay_days / total)
+                      for date, (total, dogs, cats, stay_days) in sorted(days.items(), reverse=True)]
+        avg_days_stay = open_stay_days / total_current if total_current else 0
+        
+        # get current occupancy from the Capacity counters
+        current_occupancy = Pet.get_occupied_spaces(db)
+        
+        report = Report("occupancy", "OCCUPANCY REPORT", start_date, end_date, period_days, datetime.now())
+        
+        dog_count = current_occupancy.get('dog', 0)
+        cat_count = current_occupancy.get('cat', 0)
+        
+        dog_spaces = BoardingService.TOTAL_DOG_SPACES
+        cat_spaces = BoardingService.TOTAL_CAT_SPACES
+        total_capacity = dog_spaces + cat_spaces
+        current_total = dog_count + cat_count
+        occupancy_rate = (current_total / total_capacity) * 100 if total_capacity > 0 else 0
+        
+        spaces = "{occupied}/{capacity} spaces ({rate:.1f}% occupied)"
+        section = report.section("current", "CURRENT OCCUPANCY STATUS")
+        section.metric("dogs", "Dogs", {'occupied': dog_count, 'capacity': dog_spaces,
+                                        'rate': dog_count / dog_spaces * 100}, spaces)
+        section.metric("cats", "Cats", {'occupied': cat_count, 'capacity': cat_spaces,
+                                        'rate': cat_count / cat_spaces * 100}, spaces)
+        section.metric("total", "Total", {'occupied': current_total, 'capacity': total_capacity,
+                                          'rate': occupancy_rate}, spaces)
+        section.metric("avg_stay_days", "Average Stay Duration", avg_days_stay or 0, "{:.1f} days")
+        
+        # pets in the building each night of the period, latest first
+        nights = OccupancyTimeline.nightly(db, start_date, end_date)
+        report.nights = len(nights)
+        night_columns = [
+            Column("night", "Night", 12),
+            Column("dogs", "Dogs", 8),
+            Column("cats", "Cats", 8),
+            Column("total", "Total", 8),
+            Column("dog_rate", "Dog %", 8, ".1f"),
+            Column("cat_rate", "Cat %", 8, ".1f"),
+            Column("rate", "Used %", 8, ".1f")
+        ]
+        section = report.section("nightly", "NIGHTLY OCCUPANCY", width=70)
+        section.add(Table("nightly_occupancy", night_columns, nights[::-1]))
+        
+        section = report.section("utilization", "NIGHTLY UTILIZATION")
+        if nights:
+            avg_dogs = sum(night.dogs for night in nights) / len(nights)
+            avg_cats = sum(night.cats for night in nights) / len(nights)
+            section.metric("avg_nightly", "Average Nightly Occupancy", {
+                'dogs': avg_dogs, 'cats': avg_cats, 'rate': (avg_dogs + avg_cats) / total_capacity * 100,
+                'capacity': total_capacity}, "{dogs:.1f} dogs, {cats:.1f} cats ({rate:.1f}% of {capacity} spaces)")
+            peak = "{night} ({count}/{capacity} spaces, {rate:.1f}%)"
+            busiest = OccupancyTimeline.peak_nights(nights, 1, 'dogs')[0]
+            section.metric("peak_dog_night", "Peak Dog Night", {
+                'night': busiest.night, 'count': busiest.dogs, 'capacity': dog_spaces, 'rate': busiest.dog_rate}, peak)
+            busiest = OccupancyTimeline.peak_nights(nights, 1, 'cats')[0]
+            section.metric("peak_cat_night", "Peak Cat Night", {
+                'night': busiest.night, 'count': busiest.cats, 'capacity': cat_spaces, 'rate': busiest.cat_rate}, peak)
+            full = OccupancyTimeline.nights_full(nights)
+            section.metric("nights_dogs_full", "Nights Dogs Full", {'count': full['dog'], 'nights': len(nights)},
+                           "{count} of {nights}")
+            section.metric("nights_cats_full", "Nights Cats Full", {'count': full['cat'], 'nights': len(nights)},
+                           "{count} of {nights}")
+            
+            section = report.section("peak_nights", "PEAK NIGHTS", width=70)
+            section.add(Table("peak_nights", night_columns, OccupancyTimeline.peak_nights(nights)))
+        
+        # check-ins per day
+        section = report.section("daily", "DAILY CHECK-IN BREAKDOWN", width=60)
+        section.add(Table("daily_checkins", [
+            Column("date", "Date", 12),
+            Column("total_boardings", "Total", 8),
+            Column("dog_count", "Dogs", 8),
+            Column("cat_count", "Cats", 8),
+            Column("avg_stay_duration", "Avg Stay", 10, ".1f")
+        ], daily_data))
+        
+        total_boardings = sum(day.total_boardings for day in daily_data)
+        total_dogs = sum(day.dog_count for day in daily_data)
+        total_cats = sum(day.cat_count for day in daily_data)
+        
+        # summary section
+        section = report.section("summary", "SUMMARY STATISTICS")
+        
+        if len(daily_data) > 0:
+            avg_daily_boardings = total_boardings / len(daily_data)
+            dog_percentage = (total_dogs / total_boardings * 100) if total_boardings > 0 else 0
+            cat_percentage = (total_cats / total_boardings * 100) if total_boardings > 0 else 0
+            
+            share = "{count} ({percent:.1f}%)"
+            section.metric("total_boardings", "Total Boardings", total_boardings)
+            section.metric("avg_daily_boardings", "Average Daily Boardings", avg_daily_boardings, "{:.1f}")
+            section.metric("dog_boardings", "Dog Boardings", {'count': total_dogs, 'percent': dog_percentage}, share)
+            section.metric("cat_boardings", "Cat Boardings", {'count': total_cats, 'percent': cat_percentage}, share)
+            
+            # peak days
+            peak_day = max(daily_data, key=lambda x: x['total_boardings'])
+            report.section("peak", None).metric("peak_day", "Peak Check-in Day", {
+                'date': peak_day['date'], 'boardings': peak_day['total_boardings']}, "{date} ({boardings} boardings)")
+        
+        return report
+    
+    #generate detailed revenue report for the specified period
+    @staticmethod
+    def _revenue_report(db, start_date, end_date, period_days):
+        
+        # every section - daily breakdown, pet type totals, grooming and
+        # pending revenue - comes from the same single pass over the rollup
+        days = {}  # date -> [boardings, revenue, dog revenue, cat revenue, dog grooming requests, grooming revenue]
+        pet_types = {}  # pet type -> [boardings, revenue]
+        total_grooming_count = 0
+        total_grooming_revenue = 0
+        upcoming_revenue = 0
+        upcoming_count = 0
+        for row in ReportService._rollup_rows(db, start_date, end_date):
+            upcoming_revenue += row.open_revenue
+            upcoming_count += row.open_boardings
+            if not row.boardings or not start_date <= row.stat_date <= end_date:
+                continue
+            day = days.setdefault(row.stat_date, [0, 0, 0, 0, 0, 0])
+            day[0] += row.boardings
+            day[1] += row.revenue
+            if row.pet_type == 'dog':
+                day[2] += row.revenue
+                day[4] += row.grooming_requests
+            elif row.pet_type == 'cat':
+                day[3] += row.revenue
+            day[5] += row.grooming_revenue
+            totals = pet_types.setdefault(row.pet_type, [0, 0])
+            totals[0] += row.boardings
+            totals[1] += row.revenue
+            total_grooming_count += row.grooming_count
+            total_grooming_revenue += row.grooming_revenue
+        
+        daily_data = [RevenueDay(date, *values) for date, values in sorted(days.items(), reverse=True)]
+        pet_type_revenue = [PetTypeRevenue(pet_type, count, revenue, revenue / count)
+                            for pet_type, (count, revenue) in pet_types.items()]
+        avg_grooming_price = total_grooming_revenue / total_grooming_count if total_grooming_count else 0
+        
+        report = Report("revenue", "REVENUE REPORT", start_date, end_date, period_days, datetime.now())
+        
+        section = report.section("pricing", "CURRENT PRICING")
+        section.metric("boarding_dog", "Boarding - Dogs", BoardingService.BOARDING_PRICES['dog'], "${}/day")
+        section.metric("boarding_cat", "Boarding - Cats", BoardingService.BOARDING_PRICES['cat'], "${}/day")
+        section.metric("grooming_dog", "Grooming - Dogs (by weight)", None)
+        for tier, details in BoardingService.GROOMING_PRICES.items():
+            if details['max'] == float('inf'):
+                label = f"{tier.title()} ({details['min']} lbs and above)"
+            else:
+                label = f"{tier.title()} ({details['min']}-{details['max']} lbs)"
+            section.metric(f"grooming_{tier}", label, details['price'], "${}", indent=1)
+        
+        total_revenue = sum(day.daily_revenue or 0 for day in daily_data)
+        total_boardings = sum(day.total_boardings or 0 for day in daily_data)
+        total_grooming = sum(day.grooming_count or 0 for day in daily_data)
+        grooming_revenue = sum(day.grooming_revenue or 0 for day in daily_data)
+        boarding_revenue = total_revenue - grooming_revenue
+        
+        # summary section
+        money = "${:,.2f}"
+        section = report.section("summary", "REVENUE SUMMARY")
+        section.metric("total_boardings", "Total Boardings", total_boardings)
+        section.metric("total_revenue", "Total Revenue", total_revenue, money)
+        section.metric("boarding_revenue", "Boarding Revenue", boarding_revenue, money, indent=1, marker="•")
+        section.metric("grooming_revenue", "Grooming Revenue", grooming_revenue, money, indent=1, marker="•")
+        section.metric("grooming_services", "Grooming Services", total_grooming)
+        if total_grooming_count:
+            section.metric("avg_grooming_price", "Average Grooming Price", avg_grooming_price or 0, money)
+        section.metric("avg_revenue_per_booking", "Average Revenue per Booking",
+                       total_revenue / total_boardings if total_boardings > 0 else 0, money)
+        
+        #  by pet type
+        by_type = {'dog': {'boardings': 0, 'revenue': 0, 'avg_revenue': 0},
+                   'cat': {'boardings': 0, 'revenue': 0, 'avg_revenue': 0}}
+        for pet_type in pet_type_revenue:
+            by_type['dog' if pet_type['pet_type'].lower() == 'dog' else 'cat'] = {
+                'boardings': pet_type['count'] or 0,
+                'revenue': pet_type['revenue'] or 0,
+                'avg_revenue': pet_type['avg_revenue'] or 0
+            }
+        
+        totals = "{boardings} boardings, ${revenue:,.2f} revenue (avg ${avg_revenue:,.2f})"
+        section = report.section("by_pet_type", "REVENUE BY PET TYPE")
+        section.metric("dogs", "Dogs", by_type['dog'], totals)
+        section.metric("cats", "Cats", by_type['cat'], totals)
+        
+        # daily section
+        section = report.section("daily", "DAILY REVENUE BREAKDOWN", width=80)
+        section.add(Table("daily_revenue", [
+            Column("date", "Date", 12),
+            Column("total_boardings", "Boardings", 10),
+            Column("daily_revenue", "Revenue", 12, ",.2f", "$"),
+            Column("dog_revenue", "Dogs", 10, ",.2f", "$"),
+            Column("cat_revenue", "Cats", 10, ",.2f", "$"),
+            Column("grooming_count", "Grooming", 10)
+        ], [(day.date, day.total_boardings, day.daily_revenue, day.dog_revenue, day.cat_revenue,
+             day.grooming_count) for day in daily_data]))
+        
+        section = report.section("metrics", "FINANCIAL METRICS")
+        if len(daily_data) > 0:
+            avg_daily_revenue = total_revenue / len(daily_data)
+            section.metric("avg_daily_revenue", "Average Daily Revenue", avg_daily_revenue, money)
+            section.metric("projected_monthly", "Projected Monthly Revenue", avg_daily_revenue * 30, money)
+            section.metric("projected_annual", "Projected Annual Revenue", avg_daily_revenue * 365, money)
+        
+        # upcoming revenue
+        if upcoming_revenue:
+            section = report.section("upcoming", "UPCOMING REVENUE (Current Boardings)")
+            section.metric("pending_boardings", "Pending Boardings", upcoming_count or 0)
+            section.metric("pending_revenue", "Pending Revenue", upcoming_revenue or 0, money)
+        
         return report
\ No newline at end of file
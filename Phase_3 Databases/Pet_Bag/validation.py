@@ -0,0 +1,141 @@
+# validation.py
+# SNHU Course: CS-499 Capstone
+# Student Name: Yana Burlak
+# Description: Input validation rules shared by the dialogs and the bulk create APIs
+# 2026-10-18: Moved out of controllers.py so models can validate without importing tkinter
+#
+# every rule returns (is_valid, error_message)
+
+import re
+
+def validate_name(name, field_name="Name"):# names contain only letters and spaces with minimum 2 characters
+    
+    if not name or not name.strip():
+        return False, f"{field_name} cannot be empty"
+    # check for letters only (no numbers or special characters)
+    if not re.match(r"^[A-Za-z\s]+$", name):
+        return False, f"{field_name} can only contain letters"
+    
+    # min=2
+    if len(name.strip()) < 2:
+        return False, f"{field_name} must be at least 2 characters"
+    
+    return True, ""
+
+def validate_phone(phone):# phone numbers 10 digits with common separators allowed
+    
+    if not phone or not phone.strip():
+        return False, "Phone number cannot be empty"
+    
+    # remove separators to check digit count
+    clean_phone = re.sub(r'[\s\-\(\)\.]+', '', phone)
+    
+    # verify only digits remain after removing separators
+    if not clean_phone.isdigit():
+        return False, "Phone number can only contain digits and common separators"
+    
+    # min=10
+    if len(clean_phone) != 10:
+        return False, "Phone number must be 10 digits"
+    
+    return True, ""
+
+def validate_email(email): # email format requiring @ and domain
+    
+    if not email or not email.strip():
+        return False, "Email cannot be empty"
+    
+    # email format xxxx@xxxx.xxx
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    
+    if not re.match(pattern, email.strip()):
+        return False, "Invalid email format. Must contain '@' and domain"
+    
+    return True, ""
+
+def validate_weight(weight_str, pet_type=None): # weight is positive number under 200 lbs
+    
+    if not weight_str or not weight_str.strip():
+        if pet_type and pet_type.lower() == "dog":
+            return False, "Weight is required for dogs"
+        return False, "Weight cannot be empty"
+    
+    try:
+        weight = float(weight_str)
+        if weight <= 0:
+            return False, "Weight must be a positive number"
+        if weight > 200:  # max=200
+            return False, "Weight cannot exceed 200 lbs"
+        return True, ""
+    except ValueError:
+        return False, "Weight must be a valid number"
+
+def validate_pet_name(pet_name): # pet names with same rules as human names
+    
+    if not pet_name or not pet_name.strip():
+        return False, "Pet name cannot be empty"
+    
+    if not re.match(r"^[A-Za-z\s]+$", pet_name):
+        return False, "Pet name can only contain letters"
+    
+    if len(pet_name.strip()) < 2:
+        return False, "Pet name must be at least 2 characters"
+    
+    return True, ""
+
+def validate_breed(breed): # breed names with same rules as human names
+    
+    if not breed or not breed.strip():
+        return False, "Breed cannot be empty"
+    
+    if not re.match(r"^[A-Za-z\s]+$", breed):
+        return False, "Breed can only contain letters"
+    
+    if len(breed.strip()) < 2:
+        return False, "Breed must be at least 2 characters"
+    
+    return True, ""
+
+# age and pet type rules the pet dialogs enforce
+def validate_age(age):
+    try:
+        age = int(age)
+    except (TypeError, ValueError):
+        return False, "Age must be a whole number"
+    if age <= 0 or age > 30:
+        return False, "Age must be between 1 and 30 years"
+    return True, ""
+
+def validate_pet_type(pet_type):
+    if not pet_type or pet_type.strip().lower() not in ("dog", "cat"):
+        return False, "Pet type must be Dog or Cat"
+    return True, ""
+
+# whole-record checks: the same rules the add customer / add pet dialogs apply
+def validate_customer(customer_data):
+    checks = [
+        validate_name(customer_data.get('first_name'), "First name"),
+        validate_name(customer_data.get('last_name'), "Last name"),
+        validate_phone(customer_data.get('phone')),
+        validate_email(customer_data.get('email'))
+    ]
+    for is_valid, error in checks:
+        if not is_valid:
+            return False, error
+    return True, ""
+
+def validate_pet(pet_data):
+    if not pet_data.get('customer_id'):
+        return False, "Pet must have an owner"
+    weight = pet_data.get('weight')
+    checks = [
+        validate_pet_type(pet_data.get('pet_type')),
+        validate_pet_name(pet_data.get('pet_name')),
+        validate_breed(pet_data.get('breed')),
+        validate_age(pet_data.get('pet_age')),
+        validate_weight("" if weight is None else str(weight), pet_data.get('pet_type'))
+    ]
+    for is_valid, error in checks:
+        if not is_valid:
+            return False, error
+    return True, ""
\ No newline at end of file